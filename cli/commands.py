@@ -7,33 +7,163 @@ The actual business logic is implemented in the core traktarr module.
 """
 
 import click
-import os
-import sys
-
-# Import the core business logic functions
-from core.business_logic import (
-    # Core functions
-    trakt_authentication,
-    add_single_show,
-    add_multiple_shows,
-    add_single_movie,
-    add_multiple_movies,
-    run_automatic_mode,
-    
-    # Global variables that need to be initialized
-    init_globals
-)
+import functools
+
+from cli.fastparse import BASE_DIR, COMMANDS, MINIMUM_AVAILABILITY_CHOICES, REMOTE_CHOICES, SORT_CHOICES, VERSION
+
+
+@functools.lru_cache(maxsize=1)
+def _load():
+    """Import the core business logic on first use, so only the invoked command pays for it."""
+    from core import business_logic
+    return business_logic
+
+
+############################################################
+# COMMON OPTIONS
+############################################################
+
+def choice(choices):
+    """
+    Validate an option against a set of choices, a cheaper replacement for click.Choice.
+
+    Returns:
+        Keyword arguments for click.option
+    """
+    def validate(ctx, param, value):
+        if value is not None and value not in choices:
+            raise click.BadParameter("invalid choice: %s. (choose from %s)" % (value, ', '.join(sorted(choices))))
+        return value
+
+    return dict(metavar='[%s]' % '|'.join(sorted(choices)), callback=validate)
+
+
+def list_options(media_plural, pvr_name, after_sort=(), after_folder=()):
+    """
+    Build the options shared by the shows and movies list commands.
+
+    Args:
+        media_plural: 'shows' or 'movies', used in the help texts
+        pvr_name: 'Sonarr' or 'Radarr', used in the help texts
+        after_sort: Command specific options listed after --sort
+        after_folder: Command specific options listed after --folder
 
+    Returns:
+        Decorator applying all options, in --help order
+    """
+    options = [
+        click.option(
+            '--list-type', '-t',
+            help='Trakt list to process. '
+                 'For example, \'anticipated\', \'trending\', \'popular\', \'person\', \'watched\', \'played\', '
+                 '\'recommended\', \'watchlist\', or any URL to a list.',
+            required=True),
+        click.option(
+            '--add-limit', '-l',
+            default=0,
+            help='Limit number of %s added to %s.' % (media_plural, pvr_name)),
+        click.option(
+            '--add-delay', '-d',
+            default=2.5,
+            help='Seconds between each add request to %s.' % pvr_name,
+            show_default=True),
+        click.option(
+            '--workers', '-w',
+            default=1,
+            type=click.IntRange(min=1),
+            help='Number of %s to add to %s in parallel.' % (media_plural, pvr_name),
+            show_default=True),
+        click.option(
+            '--batch-size', '-b',
+            default=1,
+            type=click.IntRange(min=1),
+            help='Number of %s to add to %s per request (max 128).' % (media_plural, pvr_name),
+            show_default=True),
+        click.option(
+            '--cache-ttl',
+            default=None,
+            type=click.IntRange(min=0),
+            help='Seconds to cache the Trakt list for. Defaults to 1 hour for trending and recommended lists, '
+                 '24 hours for other public lists. Use 0 to always fetch a fresh list.'),
+        click.option(
+            '--sort', '-s',
+            default='votes',
+            **choice(SORT_CHOICES),
+            help='Sort list to process.',
+            show_default=True),
+        *after_sort,
+        click.option(
+            '--years', '--year', '-y',
+            default=None,
+            help='Can be a specific year or a range of years to search. For example, \'2000\' or \'2000-2010\'.'),
+        click.option(
+            '--genres', '-g',
+            default=None,
+            help='Only add %s from this genre to %s. '
+                 'Multiple genres are specified as a comma-separated list. '
+                 'Use \'ignore\' to add %s from any genre, including ones with no genre specified.'
+                 % (media_plural, pvr_name, media_plural)),
+        click.option(
+            '--folder', '-f',
+            default=None,
+            help='Add %s with this root folder to %s.' % (media_plural, pvr_name)),
+        *after_folder,
+        click.option(
+            '--person', '-p',
+            default=None,
+            help='Only add %s from this person (e.g. actor) to %s. '
+                 'Only one person can be specified. '
+                 'Requires the \'person\' list type.' % (media_plural, pvr_name)),
+        click.option(
+            '--include-non-acting-roles',
+            is_flag=True,
+            help='Include non-acting roles such as \'Director\', \'As Himself\', \'Narrator\', etc. '
+                 'Requires the \'person\' list type with the \'person\' argument.'),
+        click.option(
+            '--no-search',
+            is_flag=True,
+            help='Disable search when adding %s to %s.' % (media_plural, pvr_name)),
+        click.option(
+            '--notifications',
+            is_flag=True,
+            help='Send notifications.'),
+        click.option(
+            '--authenticate-user',
+            help='Specify which user to authenticate with to retrieve Trakt lists. '
+                 'Defaults to first user in the config.'),
+        click.option(
+            '--ignore-blacklist',
+            is_flag=True,
+            help='Ignores the blacklist when running the command.'),
+        click.option(
+            '--remove-rejected-from-recommended',
+            is_flag=True,
+            help='Removes rejected/existing %s from recommended.' % media_plural),
+        click.option(
+            '--dry-run',
+            is_flag=True,
+            help='Shows the list of %s remaining after processing, takes no action on them.' % media_plural),
+    ]
 
-@click.group(help='Add new shows & movies to Sonarr/Radarr from Trakt.')
-@click.version_option('1.2.5', prog_name='Traktarr')
+    def decorator(func):
+        # click.option prepends to the parameter list, so apply in reverse to keep the order above
+        for option in reversed(options):
+            func = option(func)
+        return func
+
+    return decorator
+
+
+@click.group(help='Add new shows & movies to Sonarr/Radarr from Trakt.',
+             context_settings=dict(help_option_names=['-h', '--help']))
+@click.version_option(VERSION, '--version', '-V', prog_name='Traktarr')
 @click.option(
     '--config',
     envvar='TRAKTARR_CONFIG',
     type=click.Path(file_okay=True, dir_okay=False),
     help='Configuration file',
     show_default=True,
-    default=os.path.join(os.path.dirname(os.path.realpath(sys.argv[0])), "config.json")
+    default=str(BASE_DIR / "config.json")
 )
 @click.option(
     '--cachefile',
@@ -41,7 +171,7 @@ from core.business_logic import (
     type=click.Path(file_okay=True, dir_okay=False),
     help='Cache file',
     show_default=True,
-    default=os.path.join(os.path.dirname(os.path.realpath(sys.argv[0])), "cache.db")
+    default=str(BASE_DIR / "cache.db")
 )
 @click.option(
     '--logfile',
@@ -49,11 +179,11 @@ from core.business_logic import (
     type=click.Path(file_okay=True, dir_okay=False),
     help='Log file',
     show_default=True,
-    default=os.path.join(os.path.dirname(os.path.realpath(sys.argv[0])), "activity.log")
+    default=str(BASE_DIR / "activity.log")
 )
 def app(config, cachefile, logfile):
     """Initialize global configuration and logging."""
-    init_globals(config, cachefile, logfile)
+    _load().init_globals(config, cachefile, logfile)
 
 
 ############################################################
@@ -63,7 +193,7 @@ def app(config, cachefile, logfile):
 @app.command(help='Authenticate Traktarr.')
 def trakt_auth():
     """Authenticate with Trakt API."""
-    trakt_authentication()
+    _load().trakt_authentication()
 
 
 ############################################################
@@ -85,115 +215,14 @@ def trakt_auth():
     help='Disable search when adding show to Sonarr.')
 def show(show_id, folder=None, no_search=False):
     """Add a single show to Sonarr."""
-    return add_single_show(show_id, folder, no_search)
+    return _load().add_single_show(show_id, folder, no_search)
 
 
 @app.command(help='Add multiple shows to Sonarr.', context_settings=dict(max_content_width=100))
-@click.option(
-    '--list-type', '-t',
-    help='Trakt list to process. '
-         'For example, \'anticipated\', \'trending\', \'popular\', \'person\', \'watched\', \'played\', '
-         '\'recommended\', \'watchlist\', or any URL to a list.',
-    required=True)
-@click.option(
-    '--add-limit', '-l',
-    default=0,
-    help='Limit number of shows added to Sonarr.')
-@click.option(
-    '--add-delay', '-d',
-    default=2.5,
-    help='Seconds between each add request to Sonarr.',
-    show_default=True)
-@click.option(
-    '--sort', '-s',
-    default='votes',
-    type=click.Choice(['rating', 'release', 'votes']),
-    help='Sort list to process.',
-    show_default=True)
-@click.option(
-    '--years', '--year', '-y',
-    default=None,
-    help='Can be a specific year or a range of years to search. For example, \'2000\' or \'2000-2010\'.')
-@click.option(
-    '--genres', '-g',
-    default=None,
-    help='Only add shows from this genre to Sonarr. '
-         'Multiple genres are specified as a comma-separated list. '
-         'Use \'ignore\' to add shows from any genre, including ones with no genre specified.')
-@click.option(
-    '--folder', '-f',
-    default=None,
-    help='Add shows with this root folder to Sonarr.')
-@click.option(
-    '--person', '-p',
-    default=None,
-    help='Only add shows from this person (e.g. actor) to Sonarr. '
-         'Only one person can be specified. '
-         'Requires the \'person\' list type.')
-@click.option(
-    '--include-non-acting-roles',
-    is_flag=True,
-    help='Include non-acting roles such as \'Director\', \'As Himself\', \'Narrator\', etc. '
-         'Requires the \'person\' list type with the \'person\' argument.')
-@click.option(
-    '--no-search',
-    is_flag=True,
-    help='Disable search when adding shows to Sonarr.')
-@click.option(
-    '--notifications',
-    is_flag=True,
-    help='Send notifications.')
-@click.option(
-    '--authenticate-user',
-    help='Specify which user to authenticate with to retrieve Trakt lists. '
-         'Defaults to first user in the config')
-@click.option(
-    '--ignore-blacklist',
-    is_flag=True,
-    help='Ignores the blacklist when running the command.')
-@click.option(
-    '--remove-rejected-from-recommended',
-    is_flag=True,
-    help='Removes rejected/existing shows from recommended.')
-@click.option(
-    '--dry-run',
-    is_flag=True,
-    help='Shows the list of shows remaining after processing, takes no action on them.')
-def shows(
-        list_type,
-        add_limit=0,
-        add_delay=2.5,
-        sort='votes',
-        years=None,
-        genres=None,
-        folder=None,
-        person=None,
-        no_search=False,
-        include_non_acting_roles=False,
-        notifications=False,
-        authenticate_user=None,
-        ignore_blacklist=False,
-        remove_rejected_from_recommended=False,
-        dry_run=False,
-):
+@list_options('shows', 'Sonarr')
+def shows(**kwargs):
     """Add multiple shows to Sonarr."""
-    return add_multiple_shows(
-        list_type=list_type,
-        add_limit=add_limit,
-        add_delay=add_delay,
-        sort=sort,
-        years=years,
-        genres=genres,
-        folder=folder,
-        person=person,
-        no_search=no_search,
-        include_non_acting_roles=include_non_acting_roles,
-        notifications=notifications,
-        authenticate_user=authenticate_user,
-        ignore_blacklist=ignore_blacklist,
-        remove_rejected_from_recommended=remove_rejected_from_recommended,
-        dry_run=dry_run,
-    )
+    return _load().add_multiple_shows(**kwargs)
 
 
 ############################################################
@@ -211,7 +240,7 @@ def shows(
     help='Add movie with this root folder to Radarr.')
 @click.option(
     '--minimum-availability', '-ma',
-    type=click.Choice(['announced', 'in_cinemas', 'released']),
+    **choice(MINIMUM_AVAILABILITY_CHOICES),
     help='Add movies with this minimum availability to Radarr. Default is \'released\'.')
 @click.option(
     '--no-search',
@@ -219,127 +248,28 @@ def shows(
     help='Disable search when adding movie to Radarr.')
 def movie(movie_id, folder=None, minimum_availability=None, no_search=False):
     """Add a single movie to Radarr."""
-    return add_single_movie(movie_id, folder, minimum_availability, no_search)
+    return _load().add_single_movie(movie_id, folder, minimum_availability, no_search)
 
 
 @app.command(help='Add multiple movies to Radarr.', context_settings=dict(max_content_width=100))
-@click.option(
-    '--list-type', '-t',
-    help='Trakt list to process. '
-         'For example, \'anticipated\', \'trending\', \'popular\', \'person\', \'watched\', \'played\', '
-         '\'recommended\', \'watchlist\', or any URL to a list.',
-    required=True)
-@click.option(
-    '--add-limit', '-l',
-    default=0,
-    help='Limit number of movies added to Radarr.')
-@click.option(
-    '--add-delay', '-d',
-    default=2.5,
-    help='Seconds between each add request to Radarr.',
-    show_default=True)
-@click.option(
-    '--sort', '-s',
-    default='votes',
-    type=click.Choice(['rating', 'release', 'votes']),
-    help='Sort list to process.', show_default=True)
-@click.option(
-    '--rotten_tomatoes', '-rt',
-    default=None,
-    type=int,
-    help='Set a minimum Rotten Tomatoes score.')
-@click.option(
-    '--years', '--year', '-y',
-    default=None,
-    help='Can be a specific year or a range of years to search. For example, \'2000\' or \'2000-2010\'.')
-@click.option(
-    '--genres', '-g',
-    default=None,
-    help='Only add movies from this genre to Radarr. '
-         'Multiple genres are specified as a comma-separated list. '
-         'Use \'ignore\' to add movies from any genre, including ones with no genre specified.')
-@click.option(
-    '--folder', '-f',
-    default=None,
-    help='Add movies with this root folder to Radarr.')
-@click.option(
-    '--minimum-availability', '-ma',
-    type=click.Choice(['announced', 'in_cinemas', 'released']),
-    help='Add movies with this minimum availability to Radarr. Default is \'released\'.')
-@click.option(
-    '--person', '-p',
-    default=None,
-    help='Only add movies from this person (e.g. actor) to Radarr. '
-         'Only one person can be specified. '
-         'Requires the \'person\' list type.')
-@click.option(
-    '--include-non-acting-roles',
-    is_flag=True,
-    help='Include non-acting roles such as \'Director\', \'As Himself\', \'Narrator\', etc. '
-         'Requires the \'person\' list type with the \'person\' argument.')
-@click.option(
-    '--no-search',
-    is_flag=True,
-    help='Disable search when adding movies to Radarr.')
-@click.option(
-    '--notifications',
-    is_flag=True,
-    help='Send notifications.')
-@click.option(
-    '--authenticate-user',
-    help='Specify which user to authenticate with to retrieve Trakt lists. '
-         'Defaults to first user in the config.')
-@click.option(
-    '--ignore-blacklist',
-    is_flag=True,
-    help='Ignores the blacklist when running the command.')
-@click.option(
-    '--remove-rejected-from-recommended',
-    is_flag=True,
-    help='Removes rejected/existing movies from recommended.')
-@click.option(
-    '--dry-run',
-    is_flag=True,
-    help='Shows the list of movies remaining after processing, takes no action on them.')
-def movies(
-        list_type,
-        add_limit=0,
-        add_delay=2.5,
-        sort='votes',
-        rotten_tomatoes=None,
-        years=None,
-        genres=None,
-        folder=None,
-        minimum_availability=None,
-        person=None,
-        include_non_acting_roles=False,
-        no_search=False,
-        notifications=False,
-        authenticate_user=None,
-        ignore_blacklist=False,
-        remove_rejected_from_recommended=False,
-        dry_run=False,
-):
+@list_options(
+    'movies', 'Radarr',
+    after_sort=[
+        click.option(
+            '--rotten_tomatoes', '-rt',
+            default=None,
+            type=int,
+            help='Set a minimum Rotten Tomatoes score.'),
+    ],
+    after_folder=[
+        click.option(
+            '--minimum-availability', '-ma',
+            **choice(MINIMUM_AVAILABILITY_CHOICES),
+            help='Add movies with this minimum availability to Radarr. Default is \'released\'.'),
+    ])
+def movies(**kwargs):
     """Add multiple movies to Radarr."""
-    return add_multiple_movies(
-        list_type=list_type,
-        add_limit=add_limit,
-        add_delay=add_delay,
-        sort=sort,
-        rotten_tomatoes=rotten_tomatoes,
-        years=years,
-        genres=genres,
-        folder=folder,
-        minimum_availability=minimum_availability,
-        person=person,
-        include_non_acting_roles=include_non_acting_roles,
-        no_search=no_search,
-        notifications=notifications,
-        authenticate_user=authenticate_user,
-        ignore_blacklist=ignore_blacklist,
-        remove_rejected_from_recommended=remove_rejected_from_recommended,
-        dry_run=dry_run,
-    )
+    return _load().add_multiple_movies(**kwargs)
 
 
 ############################################################
@@ -355,7 +285,7 @@ def movies(
 @click.option(
     '--sort', '-s',
     default='votes',
-    type=click.Choice(['votes', 'rating', 'release']),
+    **choice(SORT_CHOICES),
     help='Sort list to process.',
     show_default=True)
 @click.option(
@@ -374,24 +304,58 @@ def movies(
     '--ignore-blacklist',
     is_flag=True,
     help='Ignores the blacklist when running the command.')
-def run(
-        add_delay=2.5,
-        sort='votes',
-        no_search=False,
-        run_now=False,
-        no_notifications=False,
-        ignore_blacklist=False,
-):
+@click.option(
+    '--concurrent', '-c',
+    default=1,
+    type=click.IntRange(min=1),
+    help='Number of scheduled tasks to process in parallel.',
+    show_default=True)
+@click.option(
+    '--control-socket',
+    envvar='TRAKTARR_SOCK',
+    type=click.Path(dir_okay=False),
+    help='Listen on this Unix socket for commands sent with "traktarr remote".')
+@click.option(
+    '--workers', '-w',
+    default=1,
+    type=click.IntRange(min=1),
+    help='Number of shows / movies to add to Sonarr / Radarr in parallel.',
+    show_default=True)
+@click.option(
+    '--batch-size', '-b',
+    default=1,
+    type=click.IntRange(min=1),
+    help='Number of shows / movies to add to Sonarr / Radarr per request (max 128).',
+    show_default=True)
+def run(**kwargs):
     """Run Traktarr in automatic mode."""
-    return run_automatic_mode(
-        add_delay=add_delay,
-        sort=sort,
-        no_search=no_search,
-        run_now=run_now,
-        no_notifications=no_notifications,
-        ignore_blacklist=ignore_blacklist,
-    )
+    return _load().run_automatic_mode(**kwargs)
+
+
+############################################################
+# REMOTE CONTROL
+############################################################
+
+@app.command(
+    help='Run a show, shows, movie or movies command in an automatic mode started with --control-socket.',
+    context_settings=dict(ignore_unknown_options=True))
+@click.option(
+    '--socket', 'socket_path',
+    envvar='TRAKTARR_SOCK',
+    required=True,
+    type=click.Path(dir_okay=False),
+    help='Control socket of the running automatic mode.')
+@click.argument('command', type=click.Choice(REMOTE_CHOICES))
+@click.argument('args', nargs=-1, type=click.UNPROCESSED)
+@click.pass_context
+def remote(ctx, socket_path, command, args):
+    """Send a command to a running automatic mode."""
+    from core.remote import send_command
+    # parse the arguments with the command itself, so they are validated and documented in one place
+    kwargs = app.get_command(ctx, command).make_context(command, list(args), parent=ctx).params
+    ctx.exit(0 if send_command(socket_path, COMMANDS[command][1], kwargs) else 1)
 
 
 if __name__ == "__main__":
-    app()
+    from cli.fastparse import main
+    main()
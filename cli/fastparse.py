@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Traktarr Fast Argument Parser
+
+This module contains a minimal argparse dispatcher for the CLI commands.
+Click (cli/commands.py) is only loaded when help/version output is requested,
+or when the arguments can not be handled here so that Click can report the error.
+"""
+
+import argparse
+import functools
+import os
+import sys
+from pathlib import Path
+
+VERSION = '1.2.5'
+
+HELP_FLAGS = {'--help', '-h', '--version', '-V'}
+
+SORT_CHOICES = frozenset(('rating', 'release', 'votes'))
+MINIMUM_AVAILABILITY_CHOICES = frozenset(('announced', 'in_cinemas', 'released'))
+REMOTE_CHOICES = ['show', 'shows', 'movie', 'movies']
+
+
+def _base_dir():
+    """Return the traktarr install directory, default location for the config, cache and log files."""
+    if getattr(sys, 'frozen', False):
+        # frozen binaries unpack the modules to a temporary directory, use the executable's location instead
+        return Path(sys.argv[0]).resolve().parent
+    return Path(__file__).resolve().parent.parent
+
+
+BASE_DIR = _base_dir()
+
+
+class FallbackToClick(Exception):
+    """Raised when the arguments should be handled by Click instead."""
+    pass
+
+
+class ArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser that raises FallbackToClick instead of exiting on errors."""
+
+    def error(self, message):
+        raise FallbackToClick(message)
+
+
+def _parser(prog):
+    return ArgumentParser(prog=prog, add_help=False, allow_abbrev=False)
+
+
+def _int_at_least(minimum):
+    def convert(value):
+        value = int(value)
+        if value < minimum:
+            raise argparse.ArgumentTypeError("must be at least %d" % minimum)
+        return value
+    return convert
+
+
+def _default_path(file_name):
+    return str(BASE_DIR / file_name)
+
+
+############################################################
+# PARSERS
+############################################################
+
+def _build_app_parser():
+    parser = _parser('traktarr')
+    parser.add_argument('--config', default=os.environ.get('TRAKTARR_CONFIG', _default_path('config.json')))
+    parser.add_argument('--cachefile', default=os.environ.get('TRAKTARR_CACHEFILE', _default_path('cache.db')))
+    parser.add_argument('--logfile', default=os.environ.get('TRAKTARR_LOGFILE', _default_path('activity.log')))
+    parser.add_argument('command')
+    parser.add_argument('args', nargs=argparse.REMAINDER)
+    return parser
+
+
+def _build_trakt_auth_parser():
+    return _parser('traktarr trakt-auth')
+
+
+def _build_show_parser():
+    parser = _parser('traktarr show')
+    parser.add_argument('--show-id', '-id', required=True)
+    parser.add_argument('--folder', '-f', default=None)
+    parser.add_argument('--no-search', action='store_true')
+    return parser
+
+
+def _build_movie_parser():
+    parser = _parser('traktarr movie')
+    parser.add_argument('--movie-id', '-id', required=True)
+    parser.add_argument('--folder', '-f', default=None)
+    parser.add_argument('--minimum-availability', '-ma', choices=MINIMUM_AVAILABILITY_CHOICES, default=None)
+    parser.add_argument('--no-search', action='store_true')
+    return parser
+
+
+def _build_list_parser(prog, media_type):
+    parser = _parser(prog)
+    parser.add_argument('--list-type', '-t', required=True)
+    parser.add_argument('--add-limit', '-l', type=int, default=0)
+    parser.add_argument('--add-delay', '-d', type=float, default=2.5)
+    parser.add_argument('--workers', '-w', type=_int_at_least(1), default=1)
+    parser.add_argument('--batch-size', '-b', type=_int_at_least(1), default=1)
+    parser.add_argument('--cache-ttl', type=_int_at_least(0), default=None)
+    parser.add_argument('--sort', '-s', choices=SORT_CHOICES, default='votes')
+    if media_type == 'movies':
+        parser.add_argument('--rotten_tomatoes', '-rt', type=int, default=None)
+    parser.add_argument('--years', '--year', '-y', default=None)
+    parser.add_argument('--genres', '-g', default=None)
+    parser.add_argument('--folder', '-f', default=None)
+    if media_type == 'movies':
+        parser.add_argument('--minimum-availability', '-ma', choices=MINIMUM_AVAILABILITY_CHOICES, default=None)
+    parser.add_argument('--person', '-p', default=None)
+    parser.add_argument('--include-non-acting-roles', action='store_true')
+    parser.add_argument('--no-search', action='store_true')
+    parser.add_argument('--notifications', action='store_true')
+    parser.add_argument('--authenticate-user', default=None)
+    parser.add_argument('--ignore-blacklist', action='store_true')
+    parser.add_argument('--remove-rejected-from-recommended', action='store_true')
+    parser.add_argument('--dry-run', action='store_true')
+    return parser
+
+
+def _build_run_parser():
+    parser = _parser('traktarr run')
+    parser.add_argument('--add-delay', '-d', type=float, default=2.5)
+    parser.add_argument('--sort', '-s', choices=SORT_CHOICES, default='votes')
+    parser.add_argument('--no-search', action='store_true')
+    parser.add_argument('--run-now', action='store_true')
+    parser.add_argument('--no-notifications', action='store_true')
+    parser.add_argument('--ignore-blacklist', action='store_true')
+    parser.add_argument('--concurrent', '-c', type=_int_at_least(1), default=1)
+    parser.add_argument('--control-socket', default=os.environ.get('TRAKTARR_SOCK'))
+    parser.add_argument('--workers', '-w', type=_int_at_least(1), default=1)
+    parser.add_argument('--batch-size', '-b', type=_int_at_least(1), default=1)
+    return parser
+
+
+def _build_remote_parser():
+    parser = _parser('traktarr remote')
+    parser.add_argument('--socket', default=os.environ.get('TRAKTARR_SOCK'))
+    parser.add_argument('command', choices=REMOTE_CHOICES)
+    parser.add_argument('args', nargs=argparse.REMAINDER)
+    return parser
+
+
+APP_PARSER = _build_app_parser()
+
+# command name -> (parser builder, core.business_logic function name)
+COMMANDS = {
+    'trakt-auth': (_build_trakt_auth_parser, 'trakt_authentication'),
+    'show': (_build_show_parser, 'add_single_show'),
+    'shows': (functools.partial(_build_list_parser, 'traktarr shows', 'shows'), 'add_multiple_shows'),
+    'movie': (_build_movie_parser, 'add_single_movie'),
+    'movies': (functools.partial(_build_list_parser, 'traktarr movies', 'movies'), 'add_multiple_movies'),
+    'run': (_build_run_parser, 'run_automatic_mode'),
+    'remote': (_build_remote_parser, None),
+}
+# older Click releases registered the command without the dash
+COMMANDS['trakt_auth'] = COMMANDS['trakt-auth']
+
+
+@functools.lru_cache(maxsize=None)
+def get_parser(command):
+    """Build the parser of a command on first use, so each invocation only builds the one it runs."""
+    return COMMANDS[command][0]()
+
+
+############################################################
+# DISPATCH
+############################################################
+
+def _parse_command(command, argv):
+    func_name = COMMANDS[command][1]
+    command_args, unknown = get_parser(command).parse_known_args(argv)
+    if unknown:
+        raise FallbackToClick("unknown arguments: %s" % ' '.join(unknown))
+    return func_name, vars(command_args)
+
+
+def _parse_remote(argv):
+    remote_args = get_parser('remote').parse_args(argv)
+    if not remote_args.socket:
+        raise FallbackToClick("no control socket given")
+
+    func_name, kwargs = _parse_command(remote_args.command, remote_args.args)
+    return {'path': remote_args.socket, 'func_name': func_name, 'kwargs': kwargs}
+
+
+def parse(argv):
+    """
+    Parse the command line without Click.
+
+    Args:
+        argv: List of command line arguments (excluding the program name)
+
+    Returns:
+        Tuple of (app arguments, business logic function name, command keyword arguments),
+        the function name is 'remote' for `traktarr remote` with the core.remote.send_command arguments
+
+    Raises:
+        FallbackToClick: If the arguments should be handled by Click instead
+    """
+    if any(arg in HELP_FLAGS for arg in argv):
+        raise FallbackToClick("help requested")
+
+    app_args = APP_PARSER.parse_args(argv)
+    if app_args.command == 'remote':
+        return app_args, 'remote', _parse_remote(app_args.args)
+    if app_args.command not in COMMANDS:
+        raise FallbackToClick("unknown command: %s" % app_args.command)
+
+    func_name, kwargs = _parse_command(app_args.command, app_args.args)
+    return app_args, func_name, kwargs
+
+
+def main(argv=None):
+    """Run the CLI, using Click only for help/version output and argument errors."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    try:
+        app_args, func_name, kwargs = parse(argv)
+    except FallbackToClick:
+        from cli.commands import app
+        return app(args=argv)
+
+    if func_name == 'remote':
+        # the running automatic mode does the work, no need to load the config here
+        from core import remote
+        sys.exit(0 if remote.send_command(**kwargs) else 1)
+
+    from core import business_logic
+    business_logic.init_globals(app_args.config, app_args.cachefile, app_args.logfile)
+    return getattr(business_logic, func_name)(**kwargs)
@@ -6,13 +6,19 @@ This module contains the core business logic for Traktarr.
 CLI commands are defined in cli/commands.py and call these functions.
 """
 
+import copy
+import itertools
 import os.path
 import signal
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import schedule
 
+from helpers.executor import ContextThreadPoolExecutor
+
 ############################################################
 # INIT
 ############################################################
@@ -21,24 +27,28 @@ log = None
 notify = None
 app_loaded = False
 
+# Maximum number of items sent to Sonarr / Radarr in one bulk add request
+MAX_BATCH_SIZE = 128
+
+MINIMUM_AVAILABILITIES = frozenset(('announced', 'in_cinemas', 'released'))
+
+# Held while scheduled tasks or remote commands run, as remote commands temporarily change cfg
+_command_lock = threading.Lock()
+
+# Config values (besides the filters) changed by the commands for their duration, see _run_remote_command
+_REMOTE_COMMAND_OVERRIDES = (('sonarr', 'root_folder'), ('radarr', 'root_folder'), ('radarr', 'minimum_availability'))
+
+# Set on SIGINT / SIGTERM, lists being processed (also in worker threads) stop before their next item
+_shutdown = threading.Event()
+
 
 def init_globals(config_path, cachefile_path, logfile_path):
     """Initialize global configuration, logging, and notifications."""
     global cfg, log, notify, app_loaded
 
-    # Load config FIRST
+    # Load config FIRST, legacy options are replaced while it is loaded
     from misc.config import Config
     cfg = Config(configfile=config_path, cachefile=cachefile_path, logfile=logfile_path).cfg
-    
-    # Legacy Support
-    if cfg.filters.movies.blacklist_title_keywords:
-        cfg['filters']['movies']['blacklisted_title_keywords'] = cfg['filters']['movies']['blacklist_title_keywords']
-    if cfg.filters.movies.rating_limit:
-        cfg['filters']['movies']['rotten_tomatoes'] = cfg['filters']['movies']['rating_limit']
-    if cfg.radarr.profile:
-        cfg['radarr']['quality'] = cfg['radarr']['profile']
-    if cfg.sonarr.profile:
-        cfg['sonarr']['quality'] = cfg['sonarr']['profile']
 
     # Load logger AFTER config is initialized
     from misc.log import logger
@@ -137,6 +147,14 @@ def get_exclusions(pvr, pvr_type):
     return objects_list
 
 
+# Trakt lists filtered by year, country, language and genre (and runtime for movies)
+_FILTERED_TRAKT_LISTS = {
+    'anticipated': 'get_anticipated_%s',
+    'trending': 'get_trending_%s',
+    'popular': 'get_popular_%s',
+}
+
+
 def _get_trakt_list(trakt, media_type, list_type, person, include_non_acting_roles, authenticate_user, years, countries, languages, genres, runtimes, limit=None):
     """
     Get the appropriate Trakt list based on media type and list type.
@@ -158,162 +176,38 @@ def _get_trakt_list(trakt, media_type, list_type, person, include_non_acting_rol
     Returns:
         List of Trakt objects or None if failed
     """
-    from helpers import misc as misc_helper
-    
-    if media_type == 'shows':
-        if list_type.lower() == 'anticipated':
-            return trakt.get_anticipated_shows(
-                limit=limit,
-                years=years,
-                countries=countries,
-                languages=languages,
-                genres=genres,
-            )
-        elif list_type.lower() == 'trending':
-            return trakt.get_trending_shows(
-                limit=limit,
-                years=years,
-                countries=countries,
-                languages=languages,
-                genres=genres,
-            )
-        elif list_type.lower() == 'popular':
-            return trakt.get_popular_shows(
-                limit=limit,
-                years=years,
-                countries=countries,
-                languages=languages,
-                genres=genres,
-            )
-        elif list_type.lower() == 'person':
-            if not person:
-                log.error("Person argument required when using person list type.")
-                return None
-            return trakt.get_person_shows(
-                person=person,
-                limit=limit,
-                years=years,
-                countries=countries,
-                languages=languages,
-                genres=genres,
-                include_non_acting_roles=include_non_acting_roles,
-            )
-        elif list_type.lower() == 'recommended':
-            return trakt.get_recommended_shows(
-                authenticate_user,
-                limit=limit,
-                years=years,
-                countries=countries,
-                languages=languages,
-                genres=genres,
-            )
-        elif list_type.lower().startswith('played'):
-            most_type = misc_helper.substring_after(list_type.lower(), "_")
-            return trakt.get_most_played_shows(
-                limit=limit,
-                years=years,
-                countries=countries,
-                languages=languages,
-                genres=genres,
-                most_type=most_type if most_type else None,
-            )
-        elif list_type.lower().startswith('watched'):
-            most_type = misc_helper.substring_after(list_type.lower(), "_")
-            return trakt.get_most_watched_shows(
-                limit=limit,
-                years=years,
-                countries=countries,
-                languages=languages,
-                genres=genres,
-                most_type=most_type if most_type else None,
-            )
-        elif list_type.lower() == 'watchlist':
-            return trakt.get_watchlist_shows(authenticate_user, limit=limit)
-        else:
-            return trakt.get_user_list_shows(list_type, authenticate_user, limit=limit)
-    
-    elif media_type == 'movies':
-        if list_type.lower() == 'anticipated':
-            return trakt.get_anticipated_movies(
-                limit=limit,
-                years=years,
-                countries=countries,
-                languages=languages,
-                genres=genres,
-                runtimes=runtimes,
-            )
-        elif list_type.lower() == 'trending':
-            return trakt.get_trending_movies(
-                limit=limit,
-                years=years,
-                countries=countries,
-                languages=languages,
-                genres=genres,
-                runtimes=runtimes,
-            )
-        elif list_type.lower() == 'popular':
-            return trakt.get_popular_movies(
-                limit=limit,
-                years=years,
-                countries=countries,
-                languages=languages,
-                genres=genres,
-                runtimes=runtimes,
-            )
-        elif list_type.lower() == 'boxoffice':
-            return trakt.get_boxoffice_movies(limit=limit)
-        elif list_type.lower() == 'person':
-            if not person:
-                log.error("Person argument required when using person list type.")
-                return None
-            return trakt.get_person_movies(
-                years=years,
-                person=person,
-                limit=limit,
-                countries=countries,
-                languages=languages,
-                genres=genres,
-                runtimes=runtimes,
-                include_non_acting_roles=include_non_acting_roles,
-            )
-        elif list_type.lower() == 'recommended':
-            return trakt.get_recommended_movies(
-                authenticate_user,
-                limit=limit,
-                years=years,
-                countries=countries,
-                languages=languages,
-                genres=genres,
-                runtimes=runtimes,
-            )
-        elif list_type.lower().startswith('played'):
-            most_type = misc_helper.substring_after(list_type.lower(), "_")
-            return trakt.get_most_played_movies(
-                limit=limit,
-                years=years,
-                countries=countries,
-                languages=languages,
-                genres=genres,
-                runtimes=runtimes,
-                most_type=most_type if most_type else None,
-            )
-        elif list_type.lower().startswith('watched'):
-            most_type = misc_helper.substring_after(list_type.lower(), "_")
-            return trakt.get_most_watched_movies(
-                limit=limit,
-                years=years,
-                countries=countries,
-                languages=languages,
-                genres=genres,
-                runtimes=runtimes,
-                most_type=most_type if most_type else None,
-            )
-        elif list_type.lower() == 'watchlist':
-            return trakt.get_watchlist_movies(authenticate_user, limit=limit)
-        else:
-            return trakt.get_user_list_movies(list_type, authenticate_user, limit=limit)
-    
-    return None
+    if media_type not in ('shows', 'movies'):
+        return None
+
+    list_key = list_type.lower()
+    # played / watched lists carry the period after an underscore, e.g. played_weekly
+    list_name, _, most_type = list_key.partition('_')
+    filters = dict(limit=limit, years=years, countries=countries, languages=languages, genres=genres)
+    if media_type == 'movies':
+        filters['runtimes'] = runtimes
+
+    # Trakt method names are formatted with the media type, e.g. get_trending_shows / get_trending_movies
+    if list_key in _FILTERED_TRAKT_LISTS:
+        return getattr(trakt, _FILTERED_TRAKT_LISTS[list_key] % media_type)(**filters)
+    elif list_key == 'recommended':
+        return getattr(trakt, 'get_recommended_%s' % media_type)(authenticate_user, **filters)
+    elif list_key == 'person':
+        if not person:
+            log.error("Person argument required when using person list type.")
+            return None
+        return getattr(trakt, 'get_person_%s' % media_type)(
+            person=person,
+            include_non_acting_roles=include_non_acting_roles,
+            **filters
+        )
+    elif list_name in ('played', 'watched'):
+        return getattr(trakt, 'get_most_%s_%s' % (list_name, media_type))(most_type=most_type or None, **filters)
+    elif list_key == 'boxoffice' and media_type == 'movies':
+        return trakt.get_boxoffice_movies(limit=limit)
+    elif list_key == 'watchlist':
+        return getattr(trakt, 'get_watchlist_%s' % media_type)(authenticate_user, limit=limit)
+    else:
+        return getattr(trakt, 'get_user_list_%s' % media_type)(list_type, authenticate_user, limit=limit)
 
 
 ############################################################
@@ -338,6 +232,9 @@ def _process_media(
         dry_run=False,
         rotten_tomatoes=None,
         minimum_availability=None,
+        workers=1,
+        batch_size=1,
+        cache_ttl=None,
 ):
     """
     Common function for processing both shows and movies from Trakt lists.
@@ -346,7 +243,7 @@ def _process_media(
         media_type: 'shows' or 'movies'
         list_type: Type of Trakt list to process
         add_limit: Maximum number of items to add
-        add_delay: Seconds between each add request
+        add_delay: Minimum seconds between each add request
         sort: Sort method for lists
         years: Year filter
         genres: Genre filter
@@ -361,15 +258,18 @@ def _process_media(
         dry_run: Show what would be added without adding
         rotten_tomatoes: Minimum RT score (movies only)
         minimum_availability: Minimum availability (movies only)
+        workers: Number of items to process in parallel
+        batch_size: Number of items to add to the PVR per request (capped at MAX_BATCH_SIZE)
+        cache_ttl: Seconds to cache the fetched Trakt list for, None uses the default per list type, 0 disables caching
     
     Returns:
         Number of items added
     """
     from helpers import misc as misc_helper
     from helpers import parameter as parameter_helper
-    from helpers import omdb as omdb_helper
     from helpers import tmdb as tmdb_helper
     from helpers import trakt as trakt_helper
+    from helpers.ratelimit import RateLimiter
     
     # Configure based on media type
     if media_type == 'shows':
@@ -380,11 +280,15 @@ def _process_media(
         pvr_config = cfg.sonarr
         pvr_name = 'Sonarr'
         config_key = 'shows'
-        filters_config = cfg.filters.shows
+        # snapshot, the --genres / --years changes made to cfg below do not change what is blacklisted
+        filters_config = copy.copy(cfg.filters.shows)
         media_key = 'show'
         media_name = 'show'
         media_plural = 'shows'
-        add_func_name = 'add_show'
+        add_func_name = 'add_series'
+        payload_func_name = 'series_payload'
+        import_func_name = 'import_series'
+        id_key = 'tvdb'
         event_name = 'add_show'
         validate_func = tmdb_helper.check_show_tmdb_id if hasattr(tmdb_helper, 'check_show_tmdb_id') else None
     elif media_type == 'movies':
@@ -395,11 +299,14 @@ def _process_media(
         pvr_config = cfg.radarr
         pvr_name = 'Radarr'
         config_key = 'movies'
-        filters_config = cfg.filters.movies
+        filters_config = copy.copy(cfg.filters.movies)
         media_key = 'movie'
         media_name = 'movie'
         media_plural = 'movies'
         add_func_name = 'add_movie'
+        payload_func_name = 'movie_payload'
+        import_func_name = 'import_movies'
+        id_key = 'tmdb'
         event_name = 'add_movie'
         validate_func = tmdb_helper.check_movie_tmdb_id
     else:
@@ -437,6 +344,9 @@ def _process_media(
             misc_helper.unblacklist_genres(genres, cfg['filters'][config_key]['blacklisted_genres'])
             log.debug("Filter Trakt results with genre(s): %s", ', '.join(map(lambda x: x.title(), genres)))
 
+    # Lowercase set to match the genres of each item against
+    genre_filter = frozenset(genre.lower() for genre in genres) if genres else None
+
     # Process years parameter
     years, new_min_year, new_max_year = parameter_helper.years(
         years,
@@ -470,32 +380,33 @@ def _process_media(
         cfg[config_key]['root_folder'] = folder
     log.debug('Set root folder to: \'%s\'', pvr_config.root_folder)
 
-    # Movies-specific: replace minimum_availability if supplied
-    if media_type == 'movies' and minimum_availability:
-        valid_min_avail = ['announced', 'in_cinemas', 'released']
+    # Movies-specific: replace minimum_availability if supplied, otherwise fall back from an invalid config value
+    if media_type == 'movies':
         if minimum_availability:
             cfg['radarr']['minimum_availability'] = minimum_availability
-        elif cfg['radarr']['minimum_availability'] not in valid_min_avail:
+        elif cfg['radarr']['minimum_availability'] not in MINIMUM_AVAILABILITIES:
             cfg['radarr']['minimum_availability'] = 'released'
         log.debug('Set minimum availability to: \'%s\'', cfg['radarr']['minimum_availability'])
 
     # Validate trakt api_key
-    trakt = Trakt(cfg)
+    trakt = Trakt(cfg, cache_ttl=cache_ttl)
     pvr = pvr_class(pvr_config.url, pvr_config.api_key)
 
     validate_trakt(trakt, notifications)
     validate_pvr(pvr, pvr_name, notifications)
 
+    # The quality profile, library and exclusions do not depend on each other, so retrieve them concurrently
+    with ContextThreadPoolExecutor(max_workers=3) as executor:
+        quality_profile_future = executor.submit(get_quality_profile_id, pvr, getattr(pvr_config, 'quality', None))
+        pvr_objects_future = executor.submit(get_objects, pvr, pvr_name, notifications)
+        # Get exclusions list (only for movies, Sonarr doesn't support exclusions)
+        pvr_exclusions_future = executor.submit(get_exclusions, pvr, pvr_name) if media_type == 'movies' else None
+
     # Quality profile id
-    quality_profile_id = get_quality_profile_id(pvr, getattr(pvr_config, 'quality', None))
+    quality_profile_id = quality_profile_future.result()
 
-    pvr_objects_list = get_objects(pvr, pvr_name, notifications)
-    
-    # Get exclusions list (only for movies, Sonarr doesn't support exclusions)
-    if media_type == 'movies':
-        pvr_exclusions_list = get_exclusions(pvr, pvr_name)
-    else:
-        pvr_exclusions_list = None
+    pvr_objects_list = pvr_objects_future.result()
+    pvr_exclusions_list = pvr_exclusions_future.result() if pvr_exclusions_future is not None else None
 
     # Get trakt list with adaptive fetching to account for existing items
     initial_fetch_multiplier = 3  # Fetch 3x the limit initially to account for existing items
@@ -638,27 +549,166 @@ def _process_media(
                 log.info("Got fewer items than expected (%d/%d), list may be exhausted or have limited content.", 
                         len(trakt_objects_list), current_limit)
 
-    # Sort filtered list
+    # Sort filtered list, with an add limit only the top items (with headroom for skipped ones) are sorted up front
+    sort_limit = add_limit * 2 if add_limit else None
     if sort == 'release':
-        sorted_list = misc_helper.sorted_list(processed_list, media_key, 'released')
+        sorted_list = misc_helper.sorted_list(processed_list, media_key, 'released', limit=sort_limit)
         log.info("Sorted %s list to process by recent 'release' date.", media_plural)
     elif sort == 'rating':
-        sorted_list = misc_helper.sorted_list(processed_list, media_key, 'rating')
+        sorted_list = misc_helper.sorted_list(processed_list, media_key, 'rating', limit=sort_limit)
         log.info("Sorted %s list to process by highest 'rating'.", media_plural)
     else:
-        sorted_list = misc_helper.sorted_list(processed_list, media_key, 'votes')
+        sorted_list = misc_helper.sorted_list(processed_list, media_key, 'votes', limit=sort_limit)
         log.info("Sorted %s list to process by highest 'votes'.", media_plural)
 
     # Display specified min RT score (movies only)
+    omdb_helper = None
     if media_type == 'movies' and rotten_tomatoes is not None:
         if cfg.omdb.api_key:
+            # only needed for the Rotten Tomatoes check
+            from helpers import omdb as omdb_helper
             log.info("Minimum Rotten Tomatoes score of %d%% requested.", rotten_tomatoes)
         else:
             log.info("Skipping minimum Rotten Tomatoes score check as OMDb API Key is missing.")
 
-    # Process the list
-    log.info("Processing list now...")
-    for sorted_item in sorted_list:
+    # Resolve the settings used for every item once, instead of on every item
+    genres_title = ', '.join(genre.title() for genre in genres) if genres else None
+    omdb_api_key = cfg.omdb.api_key if omdb_helper is not None else None
+    remove_callback = callback_remove_recommended if remove_rejected_from_recommended else None
+    is_blacklisted_func = trakt_helper.is_show_blacklisted if media_type == 'shows' else trakt_helper.is_movie_blacklisted
+    root_folder = pvr_config.root_folder
+    if media_type == 'shows':
+        season_folder = cfg.sonarr.season_folder
+    else:
+        radarr_minimum_availability = cfg.radarr.minimum_availability
+
+    # Look up the Rotten Tomatoes scores of the first items in parallel, they are then checked from the cache file
+    if omdb_helper is not None and sort_limit:
+        sorted_list = iter(sorted_list)
+        candidates = list(itertools.islice(sorted_list, sort_limit))
+        sorted_list = itertools.chain(candidates, sorted_list)
+        omdb_helper.prefetch_rt_scores(omdb_api_key, [
+            (item[media_key]['title'], item[media_key]['year'], item[media_key]['ids']['imdb']) for item in candidates
+            if not genre_filter or misc_helper.allowed_genres(genre_filter, media_key, item)
+        ])
+
+    sonarr_profiles = {}
+
+    def sonarr_profile_ids():
+        """Look up the Sonarr language profile id and tag ids once, when the first show is added."""
+        if not sonarr_profiles:
+            # Language profile id
+            language_profile_id = get_language_profile_id(pvr, cfg.sonarr.language)
+
+            # Profile tags
+            tag_ids = None
+
+            if cfg.sonarr.tags is not None:
+                from helpers import sonarr as sonarr_helper
+                profile_tags = get_profile_tags(pvr)
+                if profile_tags is not None:
+                    tag_ids = sonarr_helper.series_tag_ids_list_builder(
+                        profile_tags,
+                        cfg.sonarr.tags,
+                    )
+
+            sonarr_profiles.update(language_profile_id=language_profile_id, tag_ids=tag_ids)
+        return sonarr_profiles['language_profile_id'], sonarr_profiles['tag_ids']
+
+    def add_args(sorted_item):
+        """Build the arguments for the PVR add (add_series / add_movie) and payload methods of an item."""
+        if media_type == 'shows':
+            language_profile_id, tag_ids = sonarr_profile_ids()
+
+            return (
+                sorted_item[media_key]['ids']['tvdb'],
+                sorted_item[media_key]['title'],
+                sorted_item[media_key]['ids']['slug'],
+                quality_profile_id,
+                language_profile_id,
+                root_folder,
+                season_folder,
+                tag_ids,
+                not no_search,
+                pvr_helper.series_type(sorted_item[media_key]['genres']),
+            )
+        else:  # movies
+            return (
+                sorted_item[media_key]['ids']['tmdb'],
+                sorted_item[media_key]['title'],
+                sorted_item[media_key]['year'],
+                sorted_item[media_key]['ids']['slug'],
+                quality_profile_id,
+                root_folder,
+                radarr_minimum_availability,
+                not no_search,
+            )
+
+    def item_added(sorted_item):
+        if notifications:
+            callback_notify({
+                'event': event_name,
+                media_key: sorted_item[media_key],
+                'list_type': list_type
+            })
+        return True
+
+    def add_item(sorted_item):
+        """Add a single item to the PVR, returns True if added, None if it failed."""
+        args = add_args(sorted_item)
+        add_limiter.wait()
+        if _shutdown.is_set():
+            return None
+        if not getattr(pvr, add_func_name)(*args):
+            log.error("FAILED ADDING: '%s (%s)'", sorted_item[media_key]['title'], sorted_item[media_key]['year'] or '????')
+            return None
+        return item_added(sorted_item)
+
+    def add_batch(batch):
+        """Add a batch of items to the PVR in one request, returns the number of items added."""
+        # noinspection PyBroadException
+        try:
+            payloads = [getattr(pvr, payload_func_name)(*add_args(sorted_item)) for sorted_item in batch]
+            add_limiter.wait()
+            added_ids = getattr(pvr, import_func_name)(payloads)
+        except Exception:
+            log.exception("Exception while adding %d %s in one request: ", len(batch), media_plural)
+            added_ids = None
+
+        if added_ids is None:
+            log.info("Adding %d %s one at a time instead.", len(batch), media_plural)
+            results = []
+            for sorted_item in batch:
+                # noinspection PyBroadException
+                try:
+                    results.append(add_item(sorted_item))
+                except Exception:
+                    log.exception("Exception while adding %s '%s': ", media_name, sorted_item[media_key]['title'])
+            return results.count(True)
+
+        batch_added = 0
+        for sorted_item in batch:
+            if sorted_item[media_key]['ids'][id_key] in added_ids:
+                batch_added += item_added(sorted_item)
+            else:
+                log.error("FAILED ADDING: '%s (%s)'", sorted_item[media_key]['title'], sorted_item[media_key]['year'] or '????')
+        return batch_added
+
+    def process_item(sorted_item, queue=None):
+        """
+        Filter and add a single list item.
+
+        Args:
+            sorted_item: Trakt list item
+            queue: When supplied, items that pass the filters are appended to it instead of being added
+
+        Returns:
+            True if the item was added, False if it passed the filters but was not added (dry-run or queued),
+            None if it was skipped or failed
+        """
+        if _shutdown.is_set():
+            return None
+
         # noinspection PyBroadException
 
         # Set common variables
@@ -673,43 +723,32 @@ def _process_media(
         item_genres = (', '.join(sorted_item[media_key]['genres'])).title() if sorted_item[media_key]['genres'] else 'N/A'
 
         try:
-            # Check if item has a valid TMDb ID and that it exists on TMDb
-            if validate_func and not validate_func(item_title, item_year, item_tmdb_id):
-                continue
+            # Cheap checks on the list item first, requests to TMDb / OMDb only for items that pass them
 
             # Check if genres matches genre(s) supplied via argument
-            if genres and not misc_helper.allowed_genres(genres, media_key, sorted_item):
+            if genre_filter and not misc_helper.allowed_genres(genre_filter, media_key, sorted_item):
                 log.debug("SKIPPING: '%s (%s)' because it was not from the genre(s): %s", 
-                         item_title, item_year, ', '.join(map(lambda x: x.title(), genres)))
-                continue
+                         item_title, item_year, genres_title)
+                return None
 
             # Check if item passes blacklist criteria inspection
-            if media_type == 'shows':
-                is_blacklisted = trakt_helper.is_show_blacklisted(
-                    sorted_item,
-                    filters_config,
-                    ignore_blacklist,
-                    callback_remove_recommended if remove_rejected_from_recommended else None,
-                )
-            else:  # movies
-                is_blacklisted = trakt_helper.is_movie_blacklisted(
-                    sorted_item,
-                    filters_config,
-                    ignore_blacklist,
-                    callback_remove_recommended if remove_rejected_from_recommended else None,
-                )
+            is_blacklisted = is_blacklisted_func(sorted_item, filters_config, ignore_blacklist, remove_callback)
 
             if not is_blacklisted:
+                # Check if item has a valid TMDb ID and that it exists on TMDb
+                if validate_func and not validate_func(item_title, item_year, item_tmdb_id):
+                    return None
+
                 # Skip movie if below user specified min RT score (movies only)
-                if media_type == 'movies' and rotten_tomatoes is not None and cfg.omdb.api_key:
+                if omdb_helper is not None:
                     if not omdb_helper.does_movie_have_min_req_rt_score(
-                            cfg.omdb.api_key,
+                            omdb_api_key,
                             item_title,
                             item_year,
                             item_imdb_id,
                             rotten_tomatoes,
                     ):
-                        continue
+                        return None
 
                 log.info("ADDING: '%s (%s)' | Country: %s | Language: %s | Genre(s): %s ",
                          item_title,
@@ -721,79 +760,69 @@ def _process_media(
 
                 if dry_run:
                     log.info("dry-run: SKIPPING")
-                else:
-                    # Add item to PVR
-                    if media_type == 'shows':
-                        # Language profile id
-                        language_profile_id = get_language_profile_id(pvr, cfg.sonarr.language)
-                        
-                        # Profile tags
-                        profile_tags = None
-                        tag_ids = None
-                        
-                        if cfg.sonarr.tags is not None:
-                            from helpers import sonarr as sonarr_helper
-                            profile_tags = get_profile_tags(pvr)
-                            if profile_tags is not None:
-                                tag_ids = sonarr_helper.series_tag_ids_list_builder(
-                                    profile_tags,
-                                    cfg.sonarr.tags,
-                                )
-                        
-                        # Series type
-                        if any('anime' in s.lower() for s in sorted_item[media_key]['genres']):
-                            series_type = 'anime'
-                        else:
-                            series_type = 'standard'
-                        
-                        add_result = pvr.add_series(
-                            sorted_item[media_key]['ids']['tvdb'],
-                            sorted_item[media_key]['title'],
-                            sorted_item[media_key]['ids']['slug'],
-                            quality_profile_id,
-                            language_profile_id,
-                            cfg.sonarr.root_folder,
-                            cfg.sonarr.season_folder,
-                            tag_ids,
-                            not no_search,
-                            series_type,
-                        )
-                    else:  # movies
-                        add_result = pvr.add_movie(
-                            sorted_item[media_key]['ids']['tmdb'],
-                            sorted_item[media_key]['title'],
-                            sorted_item[media_key]['year'],
-                            sorted_item[media_key]['ids']['slug'],
-                            quality_profile_id,
-                            cfg.radarr.root_folder,
-                            cfg.radarr.minimum_availability,
-                            not no_search,
-                        )
-
-                    if add_result:
-                        if notifications:
-                            callback_notify({
-                                'event': event_name,
-                                media_key: sorted_item[media_key],
-                                'list_type': list_type
-                            })
-                        added_count += 1
-                    else:
-                        log.error("FAILED ADDING: '%s (%s)'", item_title, item_year)
-                        continue
+                    return False
+                if queue is not None:
+                    queue.append(sorted_item)
+                    return False
+                return add_item(sorted_item)
             else:
                 log.info("SKIPPED: '%s (%s)'", item_title, item_year)
-                continue
+                return None
+
+        except Exception:
+            log.exception("Exception while processing %s '%s': ", media_name, item_title)
+            return None
+
+    # Wait at least add_delay between add requests (per worker), without sleeping after skipped items
+    add_limiter = RateLimiter(workers if batch_size <= 1 else 1, add_delay)
+
+    # Process the list
+    log.info("Processing list now...")
+    if batch_size > 1:
+        batch_size = min(batch_size, MAX_BATCH_SIZE)
+        log.info("Adding %s in batches of up to %d", media_plural, batch_size)
+        remaining_items = iter(sorted_list)
+        while not _shutdown.is_set():
+            # Never queue more items than are left to add, so add_limit is not exceeded
+            queue_size = min(batch_size, add_limit - added_count) if add_limit else batch_size
+            batch = []
+            for sorted_item in remaining_items:
+                process_item(sorted_item, batch)
+                if len(batch) >= queue_size:
+                    break
+            if not batch:
+                break
+
+            added_count += add_batch(batch)
 
             # Stop adding items, if added_count >= add_limit
             if add_limit and added_count >= add_limit:
                 break
+    elif workers <= 1:
+        for sorted_item in sorted_list:
+            if process_item(sorted_item):
+                added_count += 1
 
-            # Sleep before adding any more
-            time.sleep(add_delay)
-
-        except Exception:
-            log.exception("Exception while processing %s '%s': ", media_name, item_title)
+            # Stop adding items, if added_count >= add_limit
+            if (add_limit and added_count >= add_limit) or _shutdown.is_set():
+                break
+    else:
+        log.info("Processing with %d workers", workers)
+        remaining_items = iter(sorted_list)
+        with ContextThreadPoolExecutor(max_workers=workers) as executor:
+            while not _shutdown.is_set():
+                # Never start more items than are left to add, so add_limit is not exceeded
+                chunk_size = min(workers, add_limit - added_count) if add_limit else workers
+                chunk = list(itertools.islice(remaining_items, chunk_size))
+                if not chunk:
+                    break
+
+                results = list(executor.map(process_item, chunk))
+                added_count += results.count(True)
+
+                # Stop adding items, if added_count >= add_limit
+                if add_limit and added_count >= add_limit:
+                    break
 
     log.info("Added %d new %s(s) to %s", added_count, media_name, pvr_name)
 
@@ -856,19 +885,25 @@ def add_single_show(show_id, folder=None, no_search=False):
 
     log.info("Retrieved Trakt show information for \'%s\': \'%s (%s)\'", show_id, series_title, series_year)
 
+    # the sonarr profiles do not depend on each other, so retrieve them concurrently
+    with ContextThreadPoolExecutor(max_workers=3) as executor:
+        quality_profile_future = executor.submit(get_quality_profile_id, sonarr, cfg.sonarr.quality)
+        language_profile_future = executor.submit(get_language_profile_id, sonarr, cfg.sonarr.language)
+        profile_tags_future = executor.submit(get_profile_tags, sonarr) if cfg.sonarr.tags is not None else None
+
     # quality profile id
-    quality_profile_id = get_quality_profile_id(sonarr, cfg.sonarr.quality)
+    quality_profile_id = quality_profile_future.result()
 
     # language profile id
-    language_profile_id = get_language_profile_id(sonarr, cfg.sonarr.language)
+    language_profile_id = language_profile_future.result()
 
     # profile tags
     profile_tags = None
     tag_ids = None
     tag_names = None
 
-    if cfg.sonarr.tags is not None:
-        profile_tags = get_profile_tags(sonarr)
+    if profile_tags_future is not None:
+        profile_tags = profile_tags_future.result()
         if profile_tags is not None:
             # determine which tags to use when adding this series
             tag_ids = sonarr_helper.series_tag_ids_list_builder(
@@ -881,10 +916,7 @@ def add_single_show(show_id, folder=None, no_search=False):
             )
 
     # series type
-    if any('anime' in s.lower() for s in trakt_show['genres']):
-        series_type = 'anime'
-    else:
-        series_type = 'standard'
+    series_type = sonarr_helper.series_type(trakt_show['genres'])
 
     log.debug("Set series type for \'%s (%s)\' to: %s", series_title, series_year, series_type.title())
 
@@ -932,11 +964,9 @@ def add_single_movie(movie_id, folder=None, minimum_availability=None, no_search
     log.debug('Set root folder to: \'%s\'', cfg['radarr']['root_folder'])
 
     # replace radarr.minimum_availability if minimum_availability is supplied
-    valid_min_avail = ['announced', 'in_cinemas', 'released']
-
     if minimum_availability:
         cfg['radarr']['minimum_availability'] = minimum_availability
-    elif cfg['radarr']['minimum_availability'] not in valid_min_avail:
+    elif cfg['radarr']['minimum_availability'] not in MINIMUM_AVAILABILITIES:
         cfg['radarr']['minimum_availability'] = 'released'
 
     log.debug('Set minimum availability to: \'%s\'', cfg['radarr']['minimum_availability'])
@@ -948,11 +978,16 @@ def add_single_movie(movie_id, folder=None, minimum_availability=None, no_search
     validate_trakt(trakt, False)
     validate_pvr(radarr, 'Radarr', False)
 
+    # the trakt movie and the radarr quality profile do not depend on each other, so retrieve them concurrently
+    with ContextThreadPoolExecutor(max_workers=2) as executor:
+        quality_profile_future = executor.submit(get_quality_profile_id, radarr, cfg.radarr.quality)
+        trakt_movie_future = executor.submit(trakt.get_movie, movie_id)
+
     # quality profile id
-    quality_profile_id = get_quality_profile_id(radarr, cfg.radarr.quality)
+    quality_profile_id = quality_profile_future.result()
 
     # get trakt movie
-    trakt_movie = trakt.get_movie(movie_id)
+    trakt_movie = trakt_movie_future.result()
 
     if not trakt_movie:
         log.error("Aborting due to failure to retrieve Trakt movie")
@@ -1012,41 +1047,55 @@ def callback_remove_recommended(media_type, media_info):
         log.info("FAILED removing rejected recommended %s: \'%s\'", media_type, media_name)
 
 
-def callback_notify(data):
-    log.debug("Received callback data: %s", data)
+def _notify_add_movie(data):
+    if not cfg.notifications.verbose:
+        return
 
-    # handle event
-    if data['event'] == 'add_movie':
+    # convert movie year to string
+    movie_year = str(data['movie']['year']) if data['movie']['year'] else '????'
 
-        # convert movie year to string
-        movie_year = str(data['movie']['year']) \
-            if data['movie']['year'] else '????'
+    notify.send(
+        message="Added \'%s\' movie: \'%s (%s)\'" % (data['list_type'].capitalize(), data['movie']['title'], movie_year))
 
-        if cfg.notifications.verbose:
-            notify.send(
-                message="Added \'%s\' movie: \'%s (%s)\'" % (data['list_type'].capitalize(), data['movie']['title'],
-                                                             movie_year))
+
+def _notify_add_show(data):
+    if not cfg.notifications.verbose:
         return
-    elif data['event'] == 'add_show':
 
-        # convert series year to string
-        series_year = str(data['show']['year']) if data['show']['year'] else '????'
+    # convert series year to string
+    series_year = str(data['show']['year']) if data['show']['year'] else '????'
 
-        if cfg.notifications.verbose:
-            notify.send(
-                message="ADDED \'%s\' show: \'%s (%s)\'" % (data['list_type'].capitalize(), data['show']['title'],
-                                                            series_year))
-        return
-    elif data['event'] == 'abort':
-        notify.send(message="ABORTED ADDING Trakt \'%s\' %s due to: %s" % (data['list_type'].capitalize(), data['type'],
-                                                                           data['reason']))
-        return
-    elif data['event'] == 'error':
-        notify.send(message="Error: %s" % data['reason'])
-        return
-    else:
+    notify.send(
+        message="ADDED \'%s\' show: \'%s (%s)\'" % (data['list_type'].capitalize(), data['show']['title'], series_year))
+
+
+def _notify_abort(data):
+    notify.send(message="ABORTED ADDING Trakt \'%s\' %s due to: %s" % (data['list_type'].capitalize(), data['type'],
+                                                                       data['reason']))
+
+
+def _notify_error(data):
+    notify.send(message="Error: %s" % data['reason'])
+
+
+# callback_notify event -> handler
+_NOTIFY_HANDLERS = {
+    'add_movie': _notify_add_movie,
+    'add_show': _notify_add_show,
+    'abort': _notify_abort,
+    'error': _notify_error,
+}
+
+
+def callback_notify(data):
+    log.debug("Received callback data: %s", data)
+
+    # handle event
+    handler = _NOTIFY_HANDLERS.get(data['event'])
+    if handler is None:
         log.error("Unexpected callback: %s", data)
-    return
+        return
+    handler(data)
 
 
 ############################################################
@@ -1059,6 +1108,8 @@ def automatic_shows(
         no_search=False,
         notifications=False,
         ignore_blacklist=False,
+        workers=1,
+        batch_size=1,
 ):
     return _automatic_media(
         'shows',
@@ -1066,7 +1117,9 @@ def automatic_shows(
         sort=sort,
         no_search=no_search,
         notifications=notifications,
-        ignore_blacklist=ignore_blacklist
+        ignore_blacklist=ignore_blacklist,
+        workers=workers,
+        batch_size=batch_size,
     )
 
 
@@ -1077,6 +1130,8 @@ def automatic_movies(
         notifications=False,
         ignore_blacklist=False,
         rotten_tomatoes=None,
+        workers=1,
+        batch_size=1,
 ):
     return _automatic_media(
         'movies',
@@ -1085,7 +1140,9 @@ def automatic_movies(
         no_search=no_search,
         notifications=notifications,
         ignore_blacklist=ignore_blacklist,
-        rotten_tomatoes=rotten_tomatoes
+        rotten_tomatoes=rotten_tomatoes,
+        workers=workers,
+        batch_size=batch_size,
     )
 
 
@@ -1095,6 +1152,8 @@ def automatic_shows_public_lists(
         no_search=False,
         notifications=False,
         ignore_blacklist=False,
+        workers=1,
+        batch_size=1,
 ):
     return _automatic_media(
         'shows',
@@ -1103,7 +1162,9 @@ def automatic_shows_public_lists(
         sort=sort,
         no_search=no_search,
         notifications=notifications,
-        ignore_blacklist=ignore_blacklist
+        ignore_blacklist=ignore_blacklist,
+        workers=workers,
+        batch_size=batch_size,
     )
 
 
@@ -1114,6 +1175,8 @@ def automatic_movies_public_lists(
         notifications=False,
         ignore_blacklist=False,
         rotten_tomatoes=None,
+        workers=1,
+        batch_size=1,
 ):
     return _automatic_media(
         'movies',
@@ -1123,7 +1186,9 @@ def automatic_movies_public_lists(
         no_search=no_search,
         notifications=notifications,
         ignore_blacklist=ignore_blacklist,
-        rotten_tomatoes=rotten_tomatoes
+        rotten_tomatoes=rotten_tomatoes,
+        workers=workers,
+        batch_size=batch_size,
     )
 
 
@@ -1133,6 +1198,8 @@ def automatic_shows_user_lists(
         no_search=False,
         notifications=False,
         ignore_blacklist=False,
+        workers=1,
+        batch_size=1,
 ):
     return _automatic_media(
         'shows',
@@ -1141,7 +1208,9 @@ def automatic_shows_user_lists(
         sort=sort,
         no_search=no_search,
         notifications=notifications,
-        ignore_blacklist=ignore_blacklist
+        ignore_blacklist=ignore_blacklist,
+        workers=workers,
+        batch_size=batch_size,
     )
 
 
@@ -1152,6 +1221,8 @@ def automatic_movies_user_lists(
         notifications=False,
         ignore_blacklist=False,
         rotten_tomatoes=None,
+        workers=1,
+        batch_size=1,
 ):
     return _automatic_media(
         'movies',
@@ -1161,10 +1232,91 @@ def automatic_movies_user_lists(
         no_search=no_search,
         notifications=notifications,
         ignore_blacklist=ignore_blacklist,
-        rotten_tomatoes=rotten_tomatoes
+        rotten_tomatoes=rotten_tomatoes,
+        workers=workers,
+        batch_size=batch_size,
     )
 
 
+def _automatic_lists(automatic_config, list_filter, ignore_blacklist, disabled_for, media_name_singular,
+                     media_name_plural):
+    """
+    Flatten the automatic config of shows or movies into the lists to process.
+
+    Args:
+        automatic_config: cfg.automatic.shows or cfg.automatic.movies
+        list_filter: 'public_lists', 'user_lists', or None for all lists
+        ignore_blacklist: Ignore blacklist filters for all lists
+        disabled_for: Lists the blacklist is disabled for (filters disabled_for)
+        media_name_singular: 'show' or 'movie', for logging
+        media_name_plural: 'shows' or 'movies', for logging
+
+    Yields:
+        (list_type, limit, authenticate_user, ignore_blacklist) of every list with a limit above 0
+    """
+    from media.trakt import Trakt
+
+    for list_type, value in automatic_config.items():
+        list_key = list_type.lower()
+
+        if list_key in ('interval', 'intervals'):
+            continue
+
+        # public lists may carry a period after an underscore, e.g. watched_monthly
+        is_public_list = list_key.partition('_')[0] in Trakt.non_user_lists
+
+        # Apply list filtering if specified
+        if list_filter == 'public_lists':
+            # Only process public lists (non-user lists)
+            if not is_public_list:
+                continue
+        elif list_filter == 'user_lists':
+            # Only process user lists (watchlist and custom lists)
+            if is_public_list:
+                continue
+
+        list_name = list_type.capitalize()
+        if is_public_list:
+            limit = value
+
+            if limit <= 0:
+                log.info("SKIPPED Trakt's '%s' %s list.", list_name, media_name_plural)
+                continue
+
+            log.info("ADDING %d %s(s) from Trakt's '%s' list.", limit, media_name_singular, list_name)
+            yield list_type, limit, None, ignore_blacklist or list_key in disabled_for
+
+        elif list_key == 'watchlist':
+            for authenticate_user, limit in value.items():
+                if limit <= 0:
+                    log.info("SKIPPED Trakt user '%s''s '%s'", authenticate_user, list_name)
+                    continue
+
+                log.info("ADDING %d %s(s) from Trakt user '%s''s '%s'", limit, media_name_singular, authenticate_user,
+                         list_name)
+                yield list_type, limit, authenticate_user, \
+                    ignore_blacklist or f"watchlist:{authenticate_user}" in disabled_for
+
+        elif list_key == 'lists':
+            if not value:
+                log.info("SKIPPED Trakt's '%s' %s list.", list_name, media_name_plural)
+                continue
+
+            for list_, v in value.items():
+                if isinstance(v, dict):
+                    authenticate_user = v['authenticate_user']
+                    limit = v['limit']
+                else:
+                    authenticate_user = None
+                    limit = v
+
+                if limit <= 0:
+                    log.info("SKIPPED Trakt's '%s' %s list.", list_, media_name_plural)
+                    continue
+
+                yield list_, limit, authenticate_user, ignore_blacklist or f"list:{list_}" in disabled_for
+
+
 def _automatic_media(
         media_type,
         list_filter=None,
@@ -1174,6 +1326,8 @@ def _automatic_media(
         notifications=False,
         ignore_blacklist=False,
         rotten_tomatoes=None,
+        workers=1,
+        batch_size=1,
 ):
     """
     Common function for automatic adding of shows and movies.
@@ -1187,9 +1341,9 @@ def _automatic_media(
         notifications: Send notifications
         ignore_blacklist: Ignore blacklist filters
         rotten_tomatoes: Minimum RT score (movies only)
+        workers: Number of items to add in parallel
+        batch_size: Number of items to add to the PVR per request
     """
-    from media.trakt import Trakt
-
     # Configure based on media type
     if media_type == 'shows':
         config_key = 'shows'
@@ -1208,148 +1362,67 @@ def _automatic_media(
     else:
         raise ValueError(f"Invalid media_type: {media_type}. Must be 'shows' or 'movies'")
 
+    media_name_title = media_name_plural.title()
     total_added = 0
     # noinspection PyBroadException
     try:
-        log.info("Automatic %s task started.", media_name_plural.title())
+        log.info("Automatic %s task started.", media_name_title)
 
         # send notification
         if notifications and cfg.notifications.verbose:
-            notify.send(message=f"Automatic {media_name_plural.title()} task started.")
-
-        automatic_config = getattr(cfg.automatic, config_key)
-        
-        for list_type, value in automatic_config.items():
-            added_items = None
-
-            if list_type.lower() in ['interval', 'intervals']:
-                continue
-
-            # Apply list filtering if specified
-            if list_filter == 'public_lists':
-                # Only process public lists (non-user lists)
-                if not (list_type.lower() in Trakt.non_user_lists or (
-                        '_' in list_type and list_type.lower().partition("_")[0] in Trakt.non_user_lists)):
-                    continue
-            elif list_filter == 'user_lists':
-                # Only process user lists (watchlist and custom lists)
-                if list_type.lower() in Trakt.non_user_lists or (
-                        '_' in list_type and list_type.lower().partition("_")[0] in Trakt.non_user_lists):
-                    continue
-
-            if list_type.lower() in Trakt.non_user_lists or (
-                    '_' in list_type and list_type.lower().partition("_")[0] in Trakt.non_user_lists):
-                limit = value
-
-                if limit <= 0:
-                    log.info("SKIPPED Trakt's '%s' %s list.", list_type.capitalize(), media_name_plural)
-                    continue
-                else:
-                    log.info("ADDING %d %s from Trakt's '%s' list.", limit, media_name_singular + "(s)", list_type.capitalize())
-
-                local_ignore_blacklist = ignore_blacklist
-
-                if list_type.lower() in filters_config.disabled_for:
-                    local_ignore_blacklist = True
-
-                # run callback
-                added_items = _process_media(
-                    media_type=media_type,
-                    list_type=list_type,
-                    add_limit=limit,
-                    add_delay=add_delay,
-                    sort=sort,
-                    no_search=no_search,
-                    notifications=notifications,
-                    ignore_blacklist=local_ignore_blacklist,
-                    **callback_kwargs
-                )
-
-            elif list_type.lower() == 'watchlist':
-                for authenticate_user, limit in value.items():
-                    if limit <= 0:
-                        log.info("SKIPPED Trakt user '%s''s '%s'", authenticate_user, list_type.capitalize())
-                        continue
-                    else:
-                        log.info("ADDING %d %s from Trakt user '%s''s '%s'", limit, 
-                                media_name_singular + "(s)", authenticate_user, list_type.capitalize())
-
-                    local_ignore_blacklist = ignore_blacklist
-
-                    if f"watchlist:{authenticate_user}" in filters_config.disabled_for:
-                        local_ignore_blacklist = True
-
-                    # run callback
-                    added_items = _process_media(
-                        media_type=media_type,
-                        list_type=list_type,
-                        add_limit=limit,
-                        add_delay=add_delay,
-                        sort=sort,
-                        no_search=no_search,
-                        notifications=notifications,
-                        authenticate_user=authenticate_user,
-                        ignore_blacklist=local_ignore_blacklist,
-                        **callback_kwargs
-                    )
-
-            elif list_type.lower() == 'lists':
-
-                if len(value.items()) == 0:
-                    log.info("SKIPPED Trakt's '%s' %s list.", list_type.capitalize(), media_name_plural)
-                    continue
-
-                for list_, v in value.items():
-                    if isinstance(v, dict):
-                        authenticate_user = v['authenticate_user']
-                        limit = v['limit']
-                    else:
-                        authenticate_user = None
-                        limit = v
-
-                    if limit <= 0:
-                        log.info("SKIPPED Trakt's '%s' %s list.", list_, media_name_plural)
-                        continue
-
-                    local_ignore_blacklist = ignore_blacklist
-
-                    if f"list:{list_}" in filters_config.disabled_for:
-                        local_ignore_blacklist = True
-
-                    # run callback
-                    added_items = _process_media(
-                        media_type=media_type,
-                        list_type=list_,
-                        add_limit=limit,
-                        add_delay=add_delay,
-                        sort=sort,
-                        no_search=no_search,
-                        notifications=notifications,
-                        authenticate_user=authenticate_user,
-                        ignore_blacklist=local_ignore_blacklist,
-                        **callback_kwargs
-                    )
+            notify.send(message="Automatic %s task started." % media_name_title)
+
+        automatic_lists = _automatic_lists(getattr(cfg.automatic, config_key), list_filter, ignore_blacklist,
+                                           filters_config.disabled_for, media_name_singular, media_name_plural)
+
+        for list_type, limit, authenticate_user, local_ignore_blacklist in automatic_lists:
+            # run callback
+            added_items = _process_media(
+                media_type=media_type,
+                list_type=list_type,
+                add_limit=limit,
+                add_delay=add_delay,
+                sort=sort,
+                no_search=no_search,
+                notifications=notifications,
+                authenticate_user=authenticate_user,
+                ignore_blacklist=local_ignore_blacklist,
+                workers=workers,
+                batch_size=batch_size,
+                **callback_kwargs
+            )
 
             if added_items is None:
-                if list_type.lower() != 'lists':
-                    log.info("FAILED ADDING %s from Trakt's '%s' list.", media_name_plural, list_type.capitalize())
-                time.sleep(10)
-                continue
-            total_added += added_items
+                log.info("FAILED ADDING %s from Trakt's '%s' list.", media_name_plural, list_type.capitalize())
+            else:
+                total_added += added_items
 
-            # sleep
-            time.sleep(10)
+            if _shutdown.is_set():
+                break
 
-        log.info("FINISHED: Added %d %s total to %s!", total_added, media_name_singular + "(s)", target_service)
+            # the adds of each list are already paced by add_delay (and rate limited requests backed off),
+            # so only wait add_delay before the next list instead of a fixed 10 seconds
+            time.sleep(add_delay)
+
+        log.info("FINISHED: Added %d %s(s) total to %s!", total_added, media_name_singular, target_service)
         # send notification
         if notifications and (cfg.notifications.verbose or total_added > 0):
-            notify.send(message=f"Added {total_added} {media_name_singular}(s) total to {target_service}!")
+            notify.send(message="Added %d %s(s) total to %s!" % (total_added, media_name_singular, target_service))
 
     except Exception:
         log.exception("Exception while automatically adding %s: ", media_name_plural)
     return total_added
 
 
+# Scheduled tasks of the automatic mode: media type, list type (interval) and task function name
+_AUTOMATIC_TASKS = (
+    ('movies', 'public_lists', 'automatic_movies_public_lists'),
+    ('movies', 'user_lists', 'automatic_movies_user_lists'),
+    ('shows', 'public_lists', 'automatic_shows_public_lists'),
+    ('shows', 'user_lists', 'automatic_shows_user_lists'),
+)
+
+
 def run_automatic_mode(
         add_delay=2.5,
         sort='votes',
@@ -1357,17 +1430,40 @@ def run_automatic_mode(
         run_now=False,
         no_notifications=False,
         ignore_blacklist=False,
+        concurrent=1,
+        control_socket=None,
+        workers=1,
+        batch_size=1,
 ):
-    """Run Traktarr in automatic mode with separate intervals for public and user lists."""
+    """
+    Run Traktarr in automatic mode with separate intervals for public and user lists.
+
+    With concurrent > 1, tasks that are due at the same time (e.g. the first run with run_now)
+    are processed in parallel threads instead of one after another.
+
+    With control_socket, show/shows/movie/movies commands sent by `traktarr remote` are run
+    in this process, between the scheduled tasks.
+
+    With workers > 1, the items of each list are added to Sonarr / Radarr in parallel threads,
+    still paced by add_delay per worker.
+
+    With batch_size > 1, the items of each list are added to Sonarr / Radarr with bulk requests
+    of up to batch_size items, paced by add_delay per request.
+    """
 
     log.info("Automatic mode is now running.")
 
+    if control_socket:
+        from core import remote
+        remote.serve(control_socket, _run_remote_command)
+
     # send notification
     if not no_notifications and cfg.notifications.verbose:
         notify.send(message="Automatic mode is now running with separate intervals for public lists and user lists.")
 
     # Add tasks to schedule and do first run if enabled
     scheduled_tasks = []
+    executor = ThreadPoolExecutor(max_workers=concurrent) if concurrent > 1 else None
 
     # Helper function to get interval configuration
     def get_interval(media_type, list_type):
@@ -1378,35 +1474,43 @@ def run_automatic_mode(
                 return media_config.intervals[list_type]
         return 0  # No interval configured
 
+    # Task arguments shared by all tasks
+    task_args = (add_delay, sort, no_search, not no_notifications, ignore_blacklist)
+
     # Helper function to schedule a task
     def schedule_task(media_type, list_type, interval, func):
         if interval and interval > 0:
             task_name = f"{media_type} {list_type.replace('_', ' ')}"
             log.info("Scheduled %s every %s hours", task_name, interval)
-            
+
             # Build arguments based on media type
-            args = [add_delay, sort, no_search, not no_notifications, ignore_blacklist]
+            args = task_args
             if media_type == 'movies':
-                args.append(int(cfg.filters.movies.rotten_tomatoes) if cfg.filters.movies.rotten_tomatoes != "" else None)
-            
-            # Create and store the scheduled task
-            task = schedule.every(interval).hours.do(func, *args)
+                rotten_tomatoes = cfg.filters.movies.rotten_tomatoes
+                args += (int(rotten_tomatoes) if rotten_tomatoes != "" else None,)
+
+            # Create and store the scheduled task (schedule binds the arguments once, with functools.partial)
+            task = schedule.every(interval).hours.do(func, *args, workers=workers, batch_size=batch_size)
             task.tag = task_name  # Add a tag for identification
             scheduled_tasks.append(task)
             
-            if run_now:
+            if run_now and executor is None:
                 log.info("Running %s immediately", task_name)
-                task.run()
+                with _command_lock:
+                    task.run()
                 time.sleep(add_delay)
             
             return task
         return None
 
     # Schedule all tasks
-    schedule_task('movies', 'public_lists', get_interval('movies', 'public_lists'), automatic_movies_public_lists)
-    schedule_task('movies', 'user_lists', get_interval('movies', 'user_lists'), automatic_movies_user_lists)
-    schedule_task('shows', 'public_lists', get_interval('shows', 'public_lists'), automatic_shows_public_lists)
-    schedule_task('shows', 'user_lists', get_interval('shows', 'user_lists'), automatic_shows_user_lists)
+    for media_type, list_type, func_name in _AUTOMATIC_TASKS:
+        schedule_task(media_type, list_type, get_interval(media_type, list_type), globals()[func_name])
+
+    if run_now and executor is not None and scheduled_tasks:
+        log.info("Running %d tasks immediately with %d workers", len(scheduled_tasks), concurrent)
+        with _command_lock:
+            _run_jobs(scheduled_tasks, executor)
 
     # Log if no tasks were scheduled
     if not scheduled_tasks:
@@ -1443,24 +1547,59 @@ def run_automatic_mode(
                     log.info("No tasks scheduled")
                 last_schedule_log = current_time
             
-            # Sleep until next run
+            # Sleep until next run, waking up for the periodic schedule log at the latest
             idle_seconds = schedule.idle_seconds()
-            if idle_seconds > 0:
+            if idle_seconds is None:
+                # Nothing scheduled, stay idle (remote commands are still handled by their own thread)
+                time.sleep(schedule_log_interval)
+                continue
+            elif idle_seconds > 0:
                 next_run_time = schedule.next_run()
                 if next_run_time:
                     log.debug("Next job at %s (sleeping %d seconds)", next_run_time.strftime('%Y-%m-%d %H:%M:%S'), idle_seconds)
-                time.sleep(idle_seconds)
-            else:
-                time.sleep(1)  # Brief pause if no idle time
-                
-            # Check jobs to run
-            schedule.run_pending()
+                time.sleep(min(idle_seconds, schedule_log_interval))
+
+            # Check jobs to run (due jobs run right away, idle_seconds is positive again afterwards)
+            with _command_lock:
+                if executor is None:
+                    schedule.run_pending()
+                else:
+                    _run_jobs([job for job in schedule.jobs if job.should_run], executor)
 
         except Exception as e:
             log.exception("Unhandled exception occurred while processing scheduled tasks: %s", e)
             time.sleep(1)
 
 
+def _run_jobs(jobs, executor):
+    """Run scheduled jobs in the executor and wait for all of them to finish."""
+    futures = [executor.submit(job.run) for job in jobs]
+    for job, future in zip(jobs, futures):
+        try:
+            future.result()
+        except Exception:
+            log.exception("Exception while running %s: ", getattr(job, 'tag', 'Unknown task'))
+
+
+def _run_remote_command(func_name, kwargs):
+    """
+    Run a command received on the control socket, restoring the config values it overrides afterwards.
+
+    Only the command overrides (root folders, minimum availability and filters) are restored, changes like refreshed
+    Trakt tokens are kept.
+    """
+    with _command_lock:
+        saved_filters = copy.deepcopy(cfg['filters'])
+        saved_values = [(section, key, cfg[section][key]) for section, key in _REMOTE_COMMAND_OVERRIDES]
+        try:
+            return globals()[func_name](**kwargs)
+        finally:
+            cfg['filters'].clear()
+            cfg['filters'].update(saved_filters)
+            for section, key, value in saved_values:
+                cfg[section][key] = value
+
+
 ############################################################
 # MISC
 ############################################################
@@ -1482,5 +1621,6 @@ def init_notifications():
 # noinspection PyUnusedLocal
 def exit_handler(signum, frame):
     log.info("Received %s, canceling jobs and exiting.", signal.Signals(signum).name)
+    _shutdown.set()
     schedule.clear()
     exit()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Traktarr Remote Control
+
+Lets `traktarr run --control-socket PATH` accept show/shows/movie/movies commands from `traktarr remote`,
+so they run in the already loaded automatic mode instead of paying the start up cost again.
+
+Protocol: the client sends one JSON line {"cmd": <business logic function>, "args": {...}}, the server answers
+with JSON lines {"log": <message>} for every log record of the command, followed by {"result": ...} or {"error": ...}.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import socket
+import stat
+import sys
+import threading
+
+# business logic functions that may be called remotely
+REMOTE_FUNCTIONS = ('add_single_show', 'add_multiple_shows', 'add_single_movie', 'add_multiple_movies')
+
+# plain logging here, as the client side must not load the config through misc.log
+log = logging.getLogger('remote')
+
+# id of the remote command the current code runs for, worker threads started with a
+# helpers.executor.ContextThreadPoolExecutor inherit it
+_command_id = contextvars.ContextVar('remote_command_id', default=None)
+
+
+def _send(stream, message):
+    stream.write(json.dumps(message) + '\n')
+    stream.flush()
+
+
+class _ClientLogHandler(logging.Handler):
+    """Forwards the log records of a remote command, including those of its worker threads, to its client."""
+
+    def __init__(self, stream, command_id):
+        super().__init__()
+        self.stream = stream
+        self.command_id = command_id
+
+    def emit(self, record):
+        # emit() runs in the thread logging the record
+        if _command_id.get() is not self.command_id:
+            return
+        # noinspection PyBroadException
+        try:
+            _send(self.stream, {'log': self.format(record)})
+        except Exception:
+            # client went away, the command keeps running
+            pass
+
+
+############################################################
+# SERVER
+############################################################
+
+def serve(path, dispatch):
+    """
+    Listen for remote commands on a Unix domain socket in a background thread.
+
+    Args:
+        path: Path of the socket file
+        dispatch: Function called with (function name, keyword arguments) for every command
+
+    Returns:
+        The listening socket, or None if it could not be created
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        log.error("Control socket is not supported on this platform.")
+        return None
+
+    try:
+        if not _remove_stale_socket(path):
+            return None
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        os.chmod(path, 0o600)
+        server.listen(5)
+    except OSError:
+        log.exception("Exception creating control socket %s: ", path)
+        return None
+
+    threading.Thread(target=_accept_loop, args=(server, dispatch), name='remote-control', daemon=True).start()
+    log.info("Listening for remote commands on %s", path)
+    return server
+
+
+def _remove_stale_socket(path):
+    """
+    Remove the socket file left at path by an automatic mode that is no longer running.
+
+    Returns:
+        True if path is free to bind, False if it is another file or the socket of a running automatic mode
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return True
+
+    if not stat.S_ISSOCK(mode):
+        log.error("Control socket %s exists and is not a socket, not replacing it.", path)
+        return False
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            # nothing listens on it anymore
+            os.unlink(path)
+            return True
+
+    log.error("Control socket %s is in use by another running automatic mode.", path)
+    return False
+
+
+def _accept_loop(server, dispatch):
+    while True:
+        try:
+            conn, _ = server.accept()
+        except OSError:
+            # socket was closed
+            return
+
+        with conn:
+            _handle(conn, dispatch)
+
+
+def _handle(conn, dispatch):
+    stream = conn.makefile('rw', encoding='utf-8')
+    # noinspection PyBroadException
+    try:
+        request = json.loads(stream.readline())
+        func_name = request.get('cmd')
+        if func_name not in REMOTE_FUNCTIONS:
+            _send(stream, {'error': "Unknown remote command: %s" % func_name})
+            return
+
+        log.info("Running remote command %s", func_name)
+        command_id = object()
+        handler = _ClientLogHandler(stream, command_id)
+        if logging.getLogger().handlers:
+            handler.setFormatter(logging.getLogger().handlers[0].formatter)
+        logging.getLogger().addHandler(handler)
+        token = _command_id.set(command_id)
+        try:
+            result = dispatch(func_name, request.get('args') or {})
+        finally:
+            _command_id.reset(token)
+            logging.getLogger().removeHandler(handler)
+
+        _send(stream, {'result': result})
+    except SystemExit:
+        # the business logic exits on fatal errors (e.g. invalid Trakt credentials), keep serving later commands
+        log.error("Remote command aborted.")
+        # noinspection PyBroadException
+        try:
+            _send(stream, {'error': "Command aborted, check the log of automatic mode for the reason."})
+        except Exception:
+            pass
+    except Exception as e:
+        log.exception("Exception handling remote command: ")
+        # noinspection PyBroadException
+        try:
+            _send(stream, {'error': str(e)})
+        except Exception:
+            pass
+
+
+############################################################
+# CLIENT
+############################################################
+
+def send_command(path, func_name, kwargs, output=sys.stdout):
+    """
+    Run a command in the automatic mode listening on `path`, printing its log output.
+
+    Returns:
+        True if the command ran, False otherwise
+    """
+    try:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(path)
+    except (AttributeError, OSError) as e:
+        print("Unable to connect to control socket %s (is 'traktarr run --control-socket' running?): %s" % (path, e),
+              file=sys.stderr)
+        return False
+
+    with client:
+        stream = client.makefile('rw', encoding='utf-8')
+        _send(stream, {'cmd': func_name, 'args': kwargs})
+        for line in stream:
+            message = json.loads(line)
+            if 'log' in message:
+                print(message['log'], file=output)
+            elif 'error' in message:
+                print(message['error'], file=sys.stderr)
+                return False
+            elif 'result' in message:
+                return True
+
+    print("Connection closed before the command finished.", file=sys.stderr)
+    return False
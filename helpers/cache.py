@@ -0,0 +1,33 @@
+import functools
+import sqlite3
+import threading
+
+from cashier import Cashier
+
+
+class FileCache(Cashier):
+    """
+    Cashier that keeps a single SQLite connection per thread.
+
+    Cashier itself opens (and keeps) a connection for every thread and key, which adds up to one open file per
+    cached movie when the cache is shared for a long running automatic mode.
+    """
+
+    def __init__(self, file_name, default_timeout):
+        super().__init__(file_name, default_timeout=default_timeout)
+        self._local = threading.local()
+
+    def _get_conn(self, key):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.Connection(self.path, timeout=60, check_same_thread=False)
+            with conn:
+                conn.execute(self._create_sql)
+            self._local.conn = conn
+        return conn
+
+
+@functools.lru_cache(maxsize=None)
+def file_cache(path, ttl):
+    """Shared cache for a cache file and expiry time (in seconds)."""
+    return FileCache(path, default_timeout=ttl)
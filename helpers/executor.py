@@ -0,0 +1,13 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    ThreadPoolExecutor running every task in a copy of the context (contextvars) of the thread submitting it.
+
+    Lets the log records of the worker threads be matched to the remote command they run for (see core.remote).
+    """
+
+    def submit(self, fn, *args, **kwargs):
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
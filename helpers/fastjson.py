@@ -0,0 +1,36 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson (optional) parses the large Trakt list pages and Sonarr / Radarr libraries several times faster
+
+
+def loads(data):
+    """Parse a JSON str or bytes document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj):
+    """Serialize to compact UTF-8 JSON bytes, e.g. for a request body."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def dumps_sorted(obj):
+    """Serialize to a canonical JSON str (sorted keys), e.g. to compare or hash documents."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode('utf-8')
+    return json.dumps(obj, sort_keys=True)
+
+
+def dumps_indented(obj):
+    """Serialize to UTF-8 JSON bytes indented by 2 spaces (sorted keys), e.g. for the config file."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, indent=2, ensure_ascii=False).encode('utf-8')
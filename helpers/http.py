@@ -0,0 +1,16 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_session(pool_size=16):
+    """Create a requests session that keeps connections alive, with up to `pool_size` pooled connections per host."""
+    new_session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    new_session.mount('http://', adapter)
+    new_session.mount('https://', adapter)
+    return new_session
+
+
+# shared by the Trakt, Sonarr, Radarr, TMDb, TVDb and OMDb requests and the notification agents, so repeated calls
+# reuse connections
+session = create_session()
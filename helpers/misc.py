@@ -1,4 +1,4 @@
-from copy import copy
+import heapq
 
 from misc.log import logger
 
@@ -56,28 +56,38 @@ def unblacklist_genres(genres, blacklisted_genres):
 
 
 def allowed_genres(genres, object_type, trakt_object):
-    allowed_object = False
-
-    if len(genres) == 1 and genres[0].lower() == 'ignore':
-        allowed_object = True
-    else:
-        for item in genres:
-            if item.lower() in trakt_object[object_type]['genres']:
-                allowed_object = True
-                break
-    return allowed_object
-
-
-def sorted_list(original_list, list_type, sort_key, reverse=True):
-    prepared_list = copy(original_list)
-    for item in prepared_list:
-        if not item[list_type][sort_key]:
-            if sort_key == 'released' or sort_key == 'first_aired':
-                item[list_type][sort_key] = ""
-            else:
-                item[list_type][sort_key] = 0
-
-    return sorted(prepared_list, key=lambda k: k[list_type][sort_key], reverse=reverse)
+    """Check if the Trakt object is from one of the genres, given as a set of lowercase genre names."""
+    if genres == {'ignore'}:
+        return True
+    return not genres.isdisjoint(trakt_object[object_type]['genres'])
+
+
+def sorted_list(original_list, list_type, sort_key, reverse=True, limit=None):
+    # items without a value sort last, the key is computed once per item so the items are left untouched
+    missing = "" if sort_key == 'released' or sort_key == 'first_aired' else 0
+
+    def key(k):
+        return k[list_type].get(sort_key) or missing
+
+    if not limit or limit >= len(original_list):
+        return sorted(original_list, key=key, reverse=reverse)
+    return _partially_sorted(original_list, key, reverse, limit)
+
+
+def _partially_sorted(original_list, key, reverse, limit):
+    """
+    Yield the items in the same order as sorted(), but only sort the first `limit` items up front (O(N log limit)).
+    The rest is only sorted if more items are consumed, e.g. when items of the first part are skipped.
+    """
+    select = heapq.nlargest if reverse else heapq.nsmallest
+    first = select(limit, enumerate(original_list), key=lambda pair: key(pair[1]))
+    for _, item in first:
+        yield item
+
+    # equal keys keep their original order, so the remaining items still follow on from the first part
+    taken = {index for index, _ in first}
+    rest = [item for index, item in enumerate(original_list) if index not in taken]
+    yield from sorted(rest, key=key, reverse=reverse)
 
 
 # reference: https://stackoverflow.com/a/16712886
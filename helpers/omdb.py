@@ -1,9 +1,22 @@
+from helpers import fastjson
+from helpers.cache import file_cache
+from helpers.executor import ContextThreadPoolExecutor
+from helpers.http import session
+from misc.config import Config
 from misc.log import logger
-import json
-import requests
 
 log = logger.get_logger(__name__)
 
+# Rotten Tomatoes scores are remembered in the cache file, so later runs skip the request
+RT_SCORE_CACHE_TIME = 3 * 24 * 60 * 60
+
+# parallel OMDb requests when looking up the scores of several movies up front
+PREFETCH_WORKERS = 16
+
+
+def _rt_score_cache():
+    return file_cache(Config().cachefile, RT_SCORE_CACHE_TIME)
+
 
 def get_movie_rt_score(omdb_api_key, movie_title, movie_year, movie_imdb_id):
     """
@@ -19,17 +32,28 @@ def get_movie_rt_score(omdb_api_key, movie_title, movie_year, movie_imdb_id):
     ratings_exist = False
 
     if movie_imdb_id:
+        cache_key = 'omdb-rt-score-%s' % movie_imdb_id
+        cached_score = _rt_score_cache().get(cache_key)
+        if cached_score is not None:
+            log.debug("Rotten Tomatoes score for \'%s (%s)\' [IMDb ID: %s]: %s (cached)",
+                      movie_title,
+                      movie_year,
+                      movie_imdb_id,
+                      cached_score or 'N/A')
+            return cached_score
+
         log.debug("Requesting info from OMDb for: \'%s (%s)\' [IMDb ID: %s]",
                   movie_title,
                   movie_year,
                   movie_imdb_id)
-        r = requests.get('http://www.omdbapi.com/?i=' + movie_imdb_id + '&apikey=' + omdb_api_key)
-        if r.status_code == 200 and json.loads(r.text)["Response"] == 'True':
+        r = session.get('http://www.omdbapi.com/?i=' + movie_imdb_id + '&apikey=' + omdb_api_key)
+        resp_json = fastjson.loads(r.content) if r.status_code == 200 else None
+        if resp_json and resp_json["Response"] == 'True':
             log.debug("Successfully requested ratings from OMDB for \'%s (%s)\' [IMDb ID: %s]",
                       movie_title,
                       movie_year,
                       movie_imdb_id)
-            for source in json.loads(r.text)["Ratings"]:
+            for source in resp_json["Ratings"]:
                 if source['Source'] == 'Rotten Tomatoes':
                     # noinspection PyUnusedLocal
                     ratings_exist = True
@@ -38,12 +62,16 @@ def get_movie_rt_score(omdb_api_key, movie_title, movie_year, movie_imdb_id):
                               movie_year,
                               movie_imdb_id,
                               source['Value'])
-                    return int(source['Value'].split('%')[0])
+                    movie_rt_score = int(source['Value'].split('%')[0])
+                    _rt_score_cache().set(cache_key, movie_rt_score)
+                    return movie_rt_score
             if not ratings_exist:
                 log.debug("No Rotten Tomatoes score found for: \'%s (%s)\' [IMDb ID: %s]",
                           movie_title,
                           movie_year,
                           movie_imdb_id)
+                # remembered as well, only failed requests are retried on the next run
+                _rt_score_cache().set(cache_key, False)
         else:
             log.debug("Error encountered when requesting ratings from OMDb for: \'%s (%s)\' [IMDb ID: %s]",
                       movie_title,
@@ -57,6 +85,29 @@ def get_movie_rt_score(omdb_api_key, movie_title, movie_year, movie_imdb_id):
     return False
 
 
+def prefetch_rt_scores(omdb_api_key, movies):
+    """
+    Lookup the Rotten Tomatoes scores of several movies in parallel, so they are cached before they are checked
+
+    :param omdb_api_key: OMDb API Key
+    :param movies: List of (Movie Title, Movie Year, Movie IMDb ID) tuples
+    """
+
+    def lookup(movie):
+        try:
+            get_movie_rt_score(omdb_api_key, *movie)
+        except Exception:
+            log.exception("Exception looking up the Rotten Tomatoes score for \'%s (%s)\': ", movie[0], movie[1])
+
+    movies = [movie for movie in movies if movie[2]]
+    if not movies:
+        return
+
+    log.debug("Looking up the Rotten Tomatoes scores of %d movies", len(movies))
+    with ContextThreadPoolExecutor(max_workers=min(PREFETCH_WORKERS, len(movies))) as executor:
+        list(executor.map(lookup, movies))
+
+
 def does_movie_have_min_req_rt_score(omdb_api_key, movie_title, movie_year, movie_imdb_id, min_req_rt_score):
 
     # pull RT score
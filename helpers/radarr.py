@@ -20,18 +20,18 @@ def filter_trakt_movies_list(trakt_movies, callback):
     return None
 
 
-def movies_to_tmdb_dict(radarr_movies):
-    movies = {}
+def movies_tmdb_ids(radarr_movies):
+    movies = set()
 
     try:
         for tmp in radarr_movies:
             if 'tmdbId' not in tmp:
                 log.debug("Could not handle movie: %s", tmp['title'])
                 continue
-            movies[tmp['tmdbId']] = tmp
+            movies.add(tmp['tmdbId'])
         return movies
     except Exception:
-        log.exception("Exception processing Radarr movies to TMDB dict: ")
+        log.exception("Exception processing Radarr movies to TMDB ids: ")
     return None
 
 
@@ -39,8 +39,8 @@ def remove_existing_movies_from_trakt_list(radarr_movies, trakt_movies, callback
     new_movies_list = []
 
     try:
-        # turn radarr movies result into a dict with tmdb id as keys
-        processed_movies = movies_to_tmdb_dict(radarr_movies)
+        # turn radarr movies result into a set of tmdb ids
+        processed_movies = movies_tmdb_ids(radarr_movies)
         if not processed_movies:
             return None
 
@@ -66,18 +66,18 @@ def remove_existing_movies_from_trakt_list(radarr_movies, trakt_movies, callback
     return None
 
 
-def exclusions_to_tmdb_dict(radarr_exclusions):
-    movie_exclusions = {}
+def exclusions_tmdb_ids(radarr_exclusions):
+    movie_exclusions = set()
 
     try:
         for tmp in radarr_exclusions:
             if 'tmdbId' not in tmp:
                 log.debug("Could not handle movie: %s", tmp['movieTitle'])
                 continue
-            movie_exclusions[tmp['tmdbId']] = tmp
+            movie_exclusions.add(tmp['tmdbId'])
         return movie_exclusions
     except Exception:
-        log.exception("Exception processing Radarr movie exclusions to TMDB dict: ")
+        log.exception("Exception processing Radarr movie exclusions to TMDB ids: ")
     return None
 
 
@@ -85,8 +85,8 @@ def remove_excluded_movies_from_trakt_list(radarr_exclusions, trakt_movies, call
     new_movies_list = []
 
     try:
-        # turn radarr movie exclusions result into a dict with tmdb id as keys
-        processed_movies = exclusions_to_tmdb_dict(radarr_exclusions)
+        # turn radarr movie exclusions result into a set of tmdb ids
+        processed_movies = exclusions_tmdb_ids(radarr_exclusions)
         if not processed_movies:
             return None
 
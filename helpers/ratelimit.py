@@ -0,0 +1,35 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket allowing `calls` requests per `period` seconds, with bursts of up to `calls` requests.
+
+    Callers that exceed the budget are queued in order of arrival and sleep until their turn.
+    """
+
+    def __init__(self, calls, period):
+        self.capacity = max(calls, 1)
+        self.rate = self.capacity / period if period > 0 else None
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until a request is allowed, returns the number of seconds slept."""
+        if self.rate is None:
+            return 0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # reserve a token, going negative when waiting so later callers queue up behind this one
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -3,6 +3,14 @@ from misc.log import logger
 log = logger.get_logger(__name__)
 
 
+def series_type(genres):
+    """Sonarr series type of a Trakt show, 'anime' if one of its genres is anime."""
+    if not genres:
+        return 'standard'
+    # Trakt genres are lowercase slugs, so the lowercased comparison is only needed when that one misses
+    return 'anime' if 'anime' in genres or 'anime' in map(str.lower, genres) else 'standard'
+
+
 def series_tag_ids_list_builder(profile_tags, config_tags):
     try:
         tag_ids = []
@@ -50,17 +58,17 @@ def filter_trakt_series_list(trakt_series, callback):
     return None
 
 
-def series_to_tvdb_dict(sonarr_series):
-    series = {}
+def series_tvdb_ids(sonarr_series):
+    series = set()
     try:
         for tmp in sonarr_series:
             if 'tvdbId' not in tmp:
                 log.debug("Could not handle show: %s", tmp['title'])
                 continue
-            series[tmp['tvdbId']] = tmp
+            series.add(tmp['tvdbId'])
         return series
     except Exception:
-        log.exception("Exception processing Sonarr shows to TVDB dict: ")
+        log.exception("Exception processing Sonarr shows to TVDB ids: ")
     return None
 
 
@@ -77,8 +85,8 @@ def remove_existing_series_from_trakt_list(sonarr_series, trakt_series, callback
         if not trakt_series:
             return None
 
-        # turn sonarr series result into a dict with tvdb id as keys
-        processed_series = series_to_tvdb_dict(sonarr_series)
+        # turn sonarr series result into a set of tvdb ids
+        processed_series = series_tvdb_ids(sonarr_series)
         if not processed_series:
             return None
 
@@ -1,8 +1,17 @@
+from helpers.cache import file_cache
+from helpers.http import session
+from misc.config import Config
 from misc.log import logger
-import requests
 
 log = logger.get_logger(__name__)
 
+# movies found on TMDb are remembered in the cache file, so later runs skip the request
+EXISTS_CACHE_TIME = 7 * 24 * 60 * 60
+
+
+def _exists_cache():
+    return file_cache(Config().cachefile, EXISTS_CACHE_TIME)
+
 
 def validate_movie_tmdb_id(movie_title, movie_year, movie_tmdb_id):
     try:
@@ -17,11 +26,18 @@ def validate_movie_tmdb_id(movie_title, movie_year, movie_tmdb_id):
 
 
 def verify_movie_exists_on_tmdb(movie_title, movie_year, movie_tmdb_id):
+    cache_key = 'tmdb-movie-exists-%s' % movie_tmdb_id
     try:
+        if _exists_cache().get(cache_key):
+            log.debug("\'%s (%s)\' [TMDb ID: %s] exists on TMDb (cached).", movie_title, movie_year, movie_tmdb_id)
+            return True
+
         headers = {"User-Agent":"Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/51.0.2704.103 Safari/537.36"}
-        req = requests.get('https://www.themoviedb.org/movie/%s' % movie_tmdb_id, headers=headers)
+        req = session.get('https://www.themoviedb.org/movie/%s' % movie_tmdb_id, headers=headers)
         if req.status_code == 200:
             log.debug("\'%s (%s)\' [TMDb ID: %s] exists on TMDb.", movie_title, movie_year, movie_tmdb_id)
+            # only found movies are cached, any other response may be temporary
+            _exists_cache().set(cache_key, True)
             return True
         else:
             log.debug("SKIPPING: \'%s (%s)\' [TMDb ID: %s] because it does not exist on TMDb.", movie_title, movie_year,
@@ -1,9 +1,28 @@
+from functools import lru_cache
+
 from helpers import str as misc_str
 from misc.log import logger
 
 log = logger.get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _lowercase_set(values):
+    # the filter settings are the same for every item of a list, so they are lowercased only once
+    return frozenset(value.lower() for value in values)
+
+
+@lru_cache(maxsize=None)
+def _lowercase_keywords(values):
+    # keywords are matched as substrings, so they are kept as (lowercased, original) pairs instead of a set
+    return tuple((value.lower(), value) for value in values)
+
+
+@lru_cache(maxsize=None)
+def _int_set(values):
+    return frozenset(map(int, values))
+
+
 def extract_list_user_and_key_from_url(list_url):
     try:
         import re
@@ -18,9 +37,8 @@ def extract_list_user_and_key_from_url(list_url):
 
 def blacklisted_show_id(show, blacklisted_ids):
     blacklisted = False
-    blacklisted_ids = sorted(map(int, blacklisted_ids))
     try:
-        if show['show']['ids']['tvdb'] in blacklisted_ids:
+        if show['show']['ids']['tvdb'] in _int_set(tuple(blacklisted_ids)):
             log.debug("\'%s\' | Blacklisted IDs Check        | Blacklisted because it had a blacklisted TVDB ID: %d",
                       show['show']['title'],
                       show['show']['ids']['tvdb'])
@@ -39,8 +57,9 @@ def blacklisted_show_title(show, blacklisted_keywords):
             log.debug("Blacklisted Titles Check     | Blacklisted show because it had no title: %s", show)
             blacklisted = True
         else:
-            for keyword in blacklisted_keywords:
-                if keyword.lower() in show['show']['title'].lower():
+            title = show['show']['title'].lower()
+            for lowercase_keyword, keyword in _lowercase_keywords(tuple(blacklisted_keywords)):
+                if lowercase_keyword in title:
                     log.debug("\'%s\' | Blacklisted Titles Check     | Blacklisted because it had the title keyword: %s",
                               show['show']['title'], keyword)
                     blacklisted = True
@@ -79,8 +98,9 @@ def blacklisted_show_network(show, networks):
                       show['show']['title'])
             blacklisted = True
         else:
-            for network in networks:
-                if network.lower() in show['show']['network'].lower():
+            show_network = show['show']['network'].lower()
+            for network, _ in _lowercase_keywords(tuple(networks)):
+                if network in show_network:
                     log.debug("\'%s\' | Blacklisted Networks Check   | Blacklisted because it's from the network: %s",
                               show['show']['title'], show['show']['network'])
                     blacklisted = True
@@ -95,8 +115,9 @@ def blacklisted_show_network(show, networks):
 def blacklisted_show_country(show, allowed_countries):
     blacklisted = False
     try:
+        allowed_countries = _lowercase_set(tuple(allowed_countries))
         # ["ignore"] - add show item even if it is missing a country
-        if any('ignore' in s.lower() for s in allowed_countries):
+        if 'ignore' in allowed_countries:
             log.debug("\'%s\' | Blacklisted Countries Check  | Ignored.", show['show']['title'])
         # List provided - skip adding show item because it is missing a country
         elif not show['show']['country']:
@@ -108,7 +129,7 @@ def blacklisted_show_country(show, allowed_countries):
             log.debug("\'%s\' | Blacklisted Countries Check  | Skipped.",
                       show['show']['title'])
         # List provided - skip adding show item if the country is blacklisted
-        elif not any(show['show']['country'].lower() in s.lower() for s in allowed_countries):
+        elif show['show']['country'].lower() not in allowed_countries:
             log.debug("\'%s\' | Blacklisted Countries Check  | Blacklisted because it's from the country: %s",
                       show['show']['title'],
                       show['show']['country'].upper())
@@ -123,8 +144,9 @@ def blacklisted_show_country(show, allowed_countries):
 def blacklisted_show_language(show, allowed_languages):
     blacklisted = False
     try:
+        allowed_languages = _lowercase_set(tuple(allowed_languages))
         # ["ignore"] - add show item even if it is missing a language
-        if any('ignore' in s.lower() for s in allowed_languages):
+        if 'ignore' in allowed_languages:
             log.debug("\'%s\' | Blacklisted Languages Check  | Ignored.", show['show']['title'])
         # List provided - skip adding show item because it is missing a language
         elif not show['show']['language']:
@@ -136,7 +158,7 @@ def blacklisted_show_language(show, allowed_languages):
             log.debug("\'%s\' | Blacklisted Languages Check  | Skipped.",
                       show['show']['title'])
         # List provided - skip adding show item if the language is blacklisted
-        elif not any(show['show']['language'].lower() in c.lower() for c in allowed_languages):
+        elif show['show']['language'].lower() not in allowed_languages:
             log.debug("\'%s\' | Blacklisted Languages Check  | Blacklisted because it's in the language: %s",
                       show['show']['title'], show['show']['language'].upper())
             blacklisted = True
@@ -150,8 +172,9 @@ def blacklisted_show_language(show, allowed_languages):
 def blacklisted_show_genre(show, genres):
     blacklisted = False
     try:
+        genres = _lowercase_set(tuple(genres))
         # ["ignore"] - add show item even if it is missing a genre
-        if any('ignore' in s.lower() for s in genres):
+        if 'ignore' in genres:
             log.debug("\'%s\' | Blacklisted Genres Check     | Ignored.", show['show']['title'])
         elif not show['show']['genres']:
             log.debug("\'%s\' | Blacklisted Genres Check     | Blacklisted because it had no genre specified.",
@@ -163,12 +186,11 @@ def blacklisted_show_genre(show, genres):
                       show['show']['title'])
         # List provided - skip adding show item if the genre is blacklisted
         else:
-            for genre in genres:
-                if genre.lower() in show['show']['genres']:
-                    log.debug("\'%s\' | Blacklisted Genres Check     | Blacklisted because it was from the genre: %s",
-                              show['show']['title'], genre.title())
-                    blacklisted = True
-                    break
+            blacklisted_genres = genres.intersection(show['show']['genres'])
+            if blacklisted_genres:
+                log.debug("\'%s\' | Blacklisted Genres Check     | Blacklisted because it was from the genre: %s",
+                          show['show']['title'], min(blacklisted_genres).title())
+                blacklisted = True
         if not blacklisted:
             log.debug("\'%s\' | Blacklisted Genres Check     | Passed.", show['show']['title'])
     except Exception:
@@ -226,9 +248,8 @@ def is_show_blacklisted(show, blacklist_settings, ignore_blacklist, callback=Non
 
 def blacklisted_movie_id(movie, blacklisted_ids):
     blacklisted = False
-    blacklisted_ids = sorted(map(int, blacklisted_ids))
     try:
-        if movie['movie']['ids']['tmdb'] in blacklisted_ids:
+        if movie['movie']['ids']['tmdb'] in _int_set(tuple(blacklisted_ids)):
             log.debug("\'%s\' | Blacklisted IDs Check        | Blacklisted because it had a blacklisted TMDb ID: %d",
                       movie['movie']['title'], movie['movie']['ids']['tmdb'])
             blacklisted = True
@@ -246,8 +267,9 @@ def blacklisted_movie_title(movie, blacklisted_keywords):
             log.debug("Blacklisted Titles Check     | Blacklisted movie because it had no title: %s", movie)
             blacklisted = True
         else:
-            for keyword in blacklisted_keywords:
-                if keyword.lower() in movie['movie']['title'].lower():
+            title = movie['movie']['title'].lower()
+            for lowercase_keyword, keyword in _lowercase_keywords(tuple(blacklisted_keywords)):
+                if lowercase_keyword in title:
                     log.debug("\'%s\' | Blacklisted Titles Check     | Blacklisted because it had the title keyword: %s",
                               movie['movie']['title'], keyword)
                     blacklisted = True
@@ -282,8 +304,9 @@ def blacklisted_movie_year(movie, earliest_year, latest_year):
 def blacklisted_movie_country(movie, allowed_countries):
     blacklisted = False
     try:
+        allowed_countries = _lowercase_set(tuple(allowed_countries))
         # ["ignore"] - add movie item even if it is missing a country
-        if any('ignore' in s.lower() for s in allowed_countries):
+        if 'ignore' in allowed_countries:
             log.debug("\'%s\' | Blacklisted Countries Check  | Ignored.",
                       movie['movie']['title'])
         # List provided - skip adding movie item because it is missing a country
@@ -296,7 +319,7 @@ def blacklisted_movie_country(movie, allowed_countries):
             log.debug("\'%s\' | Blacklisted Countries Check  | Skipped.",
                       movie['movie']['title'])
         # List provided - skip adding movie item if the country is blacklisted
-        elif not any(movie['movie']['country'].lower() in s.lower() for s in allowed_countries):
+        elif movie['movie']['country'].lower() not in allowed_countries:
             log.debug("\'%s\' | Blacklisted Countries Check  | Blacklisted because it's from the country: %s",
                       movie['movie']['title'], movie['movie']['country'].upper())
             blacklisted = True
@@ -310,8 +333,9 @@ def blacklisted_movie_country(movie, allowed_countries):
 def blacklisted_movie_language(movie, allowed_languages):
     blacklisted = False
     try:
+        allowed_languages = _lowercase_set(tuple(allowed_languages))
         # ["ignore"] - add movie item even if it is missing a language
-        if any('ignore' in s.lower() for s in allowed_languages):
+        if 'ignore' in allowed_languages:
             log.debug("\'%s\' | Blacklisted Languages Check  | Ignored.",
                       movie['movie']['title'])
         # List provided - skip adding movie item because it is missing a language
@@ -324,7 +348,7 @@ def blacklisted_movie_language(movie, allowed_languages):
             log.debug("\'%s\' | Blacklisted Languages Check  | Skipped.",
                       movie['movie']['title'])
         # List provided - skip adding movie item if the language is blacklisted
-        elif not any(movie['movie']['language'].lower() in s.lower() for s in allowed_languages):
+        elif movie['movie']['language'].lower() not in allowed_languages:
             log.debug("\'%s\' | Blacklisted Languages Check  | Blacklisted because it's in the language: %s",
                       movie['movie']['title'], movie['movie']['language'].upper())
             blacklisted = True
@@ -338,8 +362,9 @@ def blacklisted_movie_language(movie, allowed_languages):
 def blacklisted_movie_genre(movie, genres):
     blacklisted = False
     try:
+        genres = _lowercase_set(tuple(genres))
         # ["ignore"] - add movie item even if it is missing a genre
-        if any('ignore' in s.lower() for s in genres):
+        if 'ignore' in genres:
             log.debug("\'%s\' | Blacklisted Genres Check     | Ignored.", movie['movie']['title'])
         elif not movie['movie']['genres']:
             log.debug("\'%s\' | Blacklisted Genres Check     | Blacklisted because it had no genre specified.",
@@ -351,12 +376,11 @@ def blacklisted_movie_genre(movie, genres):
                       movie['movie']['title'])
         # List provided - skip adding movie item if the genre is blacklisted
         else:
-            for genre in genres:
-                if genre.lower() in movie['movie']['genres']:
-                    log.debug("\'%s\' | Blacklisted Genres Check     | Blacklisted because it was from the genre: %s",
-                              movie['movie']['title'], genre.title())
-                    blacklisted = True
-                    break
+            blacklisted_genres = genres.intersection(movie['movie']['genres'])
+            if blacklisted_genres:
+                log.debug("\'%s\' | Blacklisted Genres Check     | Blacklisted because it was from the genre: %s",
+                          movie['movie']['title'], min(blacklisted_genres).title())
+                blacklisted = True
         if not blacklisted:
             log.debug("\'%s\' | Blacklisted Genres Check     | Passed.", movie['movie']['title'])
     except Exception:
@@ -5,6 +5,8 @@ from distutils.version import LooseVersion as Version
 import backoff
 import requests
 
+from helpers import fastjson
+from helpers.http import session
 from helpers.misc import backoff_handler
 from helpers import str as misc_str
 from helpers import misc
@@ -25,7 +27,7 @@ class PVR(ABC):
     def validate_api_key(self):
         try:
             # request system status to validate api_key
-            req = requests.get(
+            req = session.get(
                 os.path.join(misc_str.ensure_endswith(self.server_url, "/"), 'api/v3/system/status'),
                 headers=self.headers,
                 timeout=60,
@@ -48,7 +50,7 @@ class PVR(ABC):
     def _get_objects(self, endpoint):
         try:
             # make request
-            req = requests.get(
+            req = session.get(
                 os.path.join(misc_str.ensure_endswith(self.server_url, "/"), endpoint),
                 headers=self.headers,
                 timeout=60,
@@ -58,7 +60,7 @@ class PVR(ABC):
             log.debug("Request Response: %d", req.status_code)
 
             if req.status_code == 200:
-                resp_json = req.json()
+                resp_json = fastjson.loads(req.content)
                 log.debug("Found %d objects", len(resp_json))
                 return resp_json
             else:
@@ -71,7 +73,7 @@ class PVR(ABC):
     def get_quality_profile_id(self, profile_name):
         try:
             # make request
-            req = requests.get(
+            req = session.get(
                 os.path.join(misc_str.ensure_endswith(self.server_url, "/"), 'api/v3/qualityProfile'),
                 headers=self.headers,
                 timeout=60,
@@ -100,7 +102,7 @@ class PVR(ABC):
             # check if sonarr is v3
 
             # make request
-            ver_req = requests.get(
+            ver_req = session.get(
                 os.path.join(misc_str.ensure_endswith(self.server_url, "/"), 'api/system/status'),
                 headers=self.headers,
                 timeout=60,
@@ -120,7 +122,7 @@ class PVR(ABC):
 
         try:
             # make request
-            req = requests.get(
+            req = session.get(
                 os.path.join(misc_str.ensure_endswith(self.server_url, "/"), 'api/v3/languageprofile'),
                 headers=self.headers,
                 timeout=60,
@@ -161,7 +163,7 @@ class PVR(ABC):
     def _add_object(self, endpoint, payload, identifier_field, identifier):
         try:
             # make request
-            req = requests.post(
+            req = session.post(
                 os.path.join(misc_str.ensure_endswith(self.server_url, "/"), endpoint),
                 headers=self.headers,
                 json=payload,
@@ -173,6 +175,11 @@ class PVR(ABC):
             log.debug("Request Response Code: %d", req.status_code)
             log.debug("Request Response Text:\n%s", req.text)
 
+            if req.status_code == 429:
+                # rate limited, return None so backoff retries the request
+                log.warning("Rate limited while adding \'%s [%d]\'", payload['title'], identifier)
+                return None
+
             response_json = None
             if 'json' in req.headers['Content-Type'].lower():
                 response_json = misc.get_response_dict(req.json(), identifier_field, identifier)
@@ -196,3 +203,35 @@ class PVR(ABC):
         except Exception:
             log.exception("Exception adding \'%s [%d]\': ", payload['title'], identifier)
         return None
+
+    def _import_objects(self, endpoint, payloads, identifier_field):
+        """
+        Add multiple objects with a single request.
+
+        Returns:
+            Set of identifiers that were added, or None if the request failed and the objects should be added
+            one at a time instead
+        """
+        try:
+            # make request
+            req = session.post(
+                os.path.join(misc_str.ensure_endswith(self.server_url, "/"), endpoint),
+                headers=self.headers,
+                json=payloads,
+                timeout=120,
+                allow_redirects=False
+            )
+            log.debug("Request URL: %s", req.url)
+            log.debug("Request Payload: %s", payloads)
+            log.debug("Request Response Code: %d", req.status_code)
+            log.debug("Request Response Text:\n%s", req.text)
+
+            if req.status_code in [201, 200] and 'json' in req.headers['Content-Type'].lower():
+                response_json = req.json()
+                if isinstance(response_json, list):
+                    return {obj[identifier_field] for obj in response_json if identifier_field in obj}
+
+            log.error("Failed to add %d objects in one request - status_code: %d", len(payloads), req.status_code)
+        except Exception:
+            log.exception("Exception adding %d objects in one request: ", len(payloads))
+        return None
@@ -14,9 +14,8 @@ class Radarr(PVR):
     def get_exclusions(self):
         return self._get_objects('api/v3/exclusions')
 
-    @backoff.on_predicate(backoff.expo, lambda x: x is None, max_tries=4, on_backoff=backoff_handler)
-    def add_movie(self, movie_tmdb_id, movie_title, movie_year, movie_title_slug, quality_profile_id, root_folder,
-                  min_availability_temp, search_missing=False):
+    def movie_payload(self, movie_tmdb_id, movie_title, movie_year, movie_title_slug, quality_profile_id, root_folder,
+                      min_availability_temp, search_missing=False):
         payload = self._prepare_add_object_payload(movie_title, movie_title_slug, quality_profile_id, root_folder)
 
         # replace radarr minimum_availability if supplied
@@ -36,4 +35,16 @@ class Radarr(PVR):
             }
         })
 
+        return payload
+
+    @backoff.on_predicate(backoff.expo, lambda x: x is None, max_tries=4, on_backoff=backoff_handler)
+    def add_movie(self, movie_tmdb_id, movie_title, movie_year, movie_title_slug, quality_profile_id, root_folder,
+                  min_availability_temp, search_missing=False):
+        payload = self.movie_payload(movie_tmdb_id, movie_title, movie_year, movie_title_slug, quality_profile_id,
+                                     root_folder, min_availability_temp, search_missing)
+
         return self._add_object('api/v3/movie', payload, identifier_field='tmdbId', identifier=movie_tmdb_id)
+
+    def import_movies(self, payloads):
+        """Add multiple movies (built with movie_payload) in one request, returns the added TMDb IDs."""
+        return self._import_objects('api/v3/movie/import', payloads, identifier_field='tmdbId')
@@ -1,10 +1,10 @@
 import os.path
 
 import backoff
-import requests
 from helpers.misc import backoff_handler, dict_merge
 
 from helpers import str as misc_str
+from helpers.http import session
 from media.pvr import PVR
 from misc.log import logger
 
@@ -20,7 +20,7 @@ class Sonarr(PVR):
         tags = {}
         try:
             # make request
-            req = requests.get(
+            req = session.get(
                 os.path.join(misc_str.ensure_endswith(self.server_url, "/"), 'api/v3/tag'),
                 headers=self.headers,
                 timeout=60,
@@ -41,9 +41,8 @@ class Sonarr(PVR):
             log.exception("Exception retrieving tags: ")
         return None
 
-    @backoff.on_predicate(backoff.expo, lambda x: x is None, max_tries=4, on_backoff=backoff_handler)
-    def add_series(self, series_tvdb_id, series_title, series_title_slug, quality_profile_id, language_profile_id,
-                   root_folder, season_folder=True, tag_ids=None, search_missing=False, series_type='standard'):
+    def series_payload(self, series_tvdb_id, series_title, series_title_slug, quality_profile_id, language_profile_id,
+                       root_folder, season_folder=True, tag_ids=None, search_missing=False, series_type='standard'):
         payload = self._prepare_add_object_payload(series_title, series_title_slug, quality_profile_id, root_folder)
 
         payload = dict_merge(payload, {
@@ -58,6 +57,19 @@ class Sonarr(PVR):
             }
         })
 
+        return payload
+
+    @backoff.on_predicate(backoff.expo, lambda x: x is None, max_tries=4, on_backoff=backoff_handler)
+    def add_series(self, series_tvdb_id, series_title, series_title_slug, quality_profile_id, language_profile_id,
+                   root_folder, season_folder=True, tag_ids=None, search_missing=False, series_type='standard'):
+        payload = self.series_payload(series_tvdb_id, series_title, series_title_slug, quality_profile_id,
+                                      language_profile_id, root_folder, season_folder, tag_ids, search_missing,
+                                      series_type)
+
         endpoint = 'api/v3/series'
 
         return self._add_object(endpoint, payload, identifier_field='tvdbId', identifier=series_tvdb_id)
+
+    def import_series(self, payloads):
+        """Add multiple series (built with series_payload) in one request, returns the added TVDb IDs."""
+        return self._import_objects('api/v3/series/import', payloads, identifier_field='tvdbId')
@@ -1,11 +1,16 @@
-import json
+import functools
+import pickle
 import time
+import zlib
+from hashlib import md5
 
 import backoff
-import requests
-from cashier import cache
 
+from helpers import fastjson
+from helpers.cache import file_cache
+from helpers.http import session
 from helpers.misc import backoff_handler, dict_merge
+from helpers.ratelimit import RateLimiter
 from helpers.trakt import extract_list_user_and_key_from_url
 from misc.log import logger
 from misc.config import Config
@@ -13,12 +18,88 @@ from misc.config import Config
 log = logger.get_logger(__name__)
 cachefile = Config().cachefile
 
+# Trakt allows 1000 API calls every 5 minutes, shared by all Trakt instances and threads
+rate_limiter = RateLimiter(1000, 300)
+
+# shows / movies retrieved by id are remembered in the cache file, their details rarely change
+ITEM_CACHE_TIME = 7 * 24 * 60 * 60
+
+# Show / movie fields used when filtering, sorting and adding list items, the rest of each item (overview, trailer,
+# translations, ...) is dropped when a list is retrieved
+LIST_ITEM_FIELDS = frozenset((
+    'title', 'year', 'ids', 'genres', 'country', 'language', 'network', 'runtime',
+    'released', 'first_aired', 'rating', 'votes',
+))
+
+
+def cached_list(cache_time):
+    """
+    Cache the results of a Trakt list method in the cache file.
+
+    Results are keyed on the method name and all of its arguments, and kept for `cache_time` seconds,
+    unless the Trakt instance was created with a different cache_ttl (0 disables the cache).
+    They are stored compressed, as a list of a few hundred items pickles to hundreds of kilobytes.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapped(self, *args, **kwargs):
+            ttl = cache_time if self.cache_ttl is None else self.cache_ttl
+            if not ttl:
+                return func(self, *args, **kwargs)
+
+            key = md5((func.__name__ + repr((args, sorted(kwargs.items())))).encode('utf8')).hexdigest()
+            cache = file_cache(cachefile, ttl)
+            cached = cache.get(key)
+            if cached:
+                log.debug("Using cached %s results", func.__name__)
+                return pickle.loads(zlib.decompress(cached))
+
+            result = func(self, *args, **kwargs)
+            if result:
+                cache.set(key, zlib.compress(pickle.dumps(result, pickle.HIGHEST_PROTOCOL), 1))
+            return result
+
+        return wrapped
+
+    return decorator
+
+
+def cached_item(id_key):
+    """
+    Cache the show / movie returned by a Trakt item method in the cache file for ITEM_CACHE_TIME seconds.
+
+    Only items with an `id_key` id (the one Sonarr / Radarr add them by) are cached, as new items may not have one yet.
+    A Trakt instance created with a cache_ttl of 0 does not use the cache.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapped(self, item_id):
+            if self.cache_ttl == 0:
+                return func(self, item_id)
+
+            key = 'trakt-%s-%s' % (func.__name__, item_id)
+            cache = file_cache(cachefile, ITEM_CACHE_TIME)
+            item = cache.get(key)
+            if item:
+                log.debug("Using cached %s result for %s", func.__name__, item_id)
+                return item
+
+            item = func(self, item_id)
+            if item and (item.get('ids') or {}).get(id_key):
+                cache.set(key, item)
+            return item
+
+        return wrapped
+
+    return decorator
+
 
 class Trakt:
-    non_user_lists = ['anticipated', 'trending', 'popular', 'boxoffice', 'watched', 'played']
+    non_user_lists = frozenset(('anticipated', 'trending', 'popular', 'boxoffice', 'watched', 'played'))
 
-    def __init__(self, cfg):
+    def __init__(self, cfg, cache_ttl=None):
         self.cfg = cfg
+        self.cache_ttl = cache_ttl
 
     ############################################################
     # Requests
@@ -37,17 +118,11 @@ class Trakt:
             url = url.replace('{authenticate_user}', authenticate_user)
 
         # make request
-        resp_data = ''
-        if request_type == 'delete':
-            with requests.delete(url, headers=headers, params=payload, timeout=30, stream=True) as req:
-                for chunk in req.iter_content(chunk_size=250000, decode_unicode=True):
-                    if chunk:
-                        resp_data += chunk
-        else:
-            with requests.get(url, headers=headers, params=payload, timeout=30, stream=True) as req:
-                for chunk in req.iter_content(chunk_size=250000, decode_unicode=True):
-                    if chunk:
-                        resp_data += chunk
+        rate_limiter.wait()
+        request = session.delete if request_type == 'delete' else session.get
+        with request(url, headers=headers, params=payload, timeout=30, stream=True) as req:
+            # join the chunks once, appending them one by one copies large list pages over and over
+            resp_data = ''.join(chunk for chunk in req.iter_content(chunk_size=250000, decode_unicode=True) if chunk)
 
         log.debug("Request URL: %s", req.url)
         log.debug("Request Payload: %s", payload)
@@ -67,7 +142,7 @@ class Trakt:
             req, resp_data = self._make_request(url, payload)
 
             if req.status_code == 200 and len(resp_data):
-                return json.loads(resp_data)
+                return fastjson.loads(resp_data)
             elif req.status_code == 401:
                 log.warning("Received 401 unauthorized. Token may have expired.")
                 # Try to get the user from the request headers to refresh their token
@@ -77,7 +152,7 @@ class Trakt:
                     # Retry the request with the new token
                     req, resp_data = self._make_request(url, payload)
                     if req.status_code == 200 and len(resp_data):
-                        return json.loads(resp_data)
+                        return fastjson.loads(resp_data)
                 
                 log.error("The authentication to Trakt is revoked or refresh failed. Please re-authenticate.")
                 exit()
@@ -97,7 +172,7 @@ class Trakt:
             object_name,
             authenticate_user=None,
             payload=None,
-            sleep_between=5,
+            sleep_between=0,
             years=None,
             countries=None,
             languages=None,
@@ -137,6 +212,7 @@ class Trakt:
             payload['runtimes'] = runtimes
 
         processed = []
+        seen = set()
 
         if authenticate_user:
             type_name = type_name.replace('{authenticate_user}', self._user_used_for_authentication(authenticate_user))
@@ -144,6 +220,7 @@ class Trakt:
         try:
             resp_data = ''
             max_attempts = 6
+            rate_limited = 0
             while True:
                 attempts = 0
                 retrieve_error = False
@@ -171,6 +248,17 @@ class Trakt:
                               object_name, attempts)
                     return None
 
+                if req.status_code == 401:
+                    log.warning("Received 401 unauthorized. Token may have expired.")
+                    # Try to refresh token for the authenticated user
+                    if authenticate_user and self._attempt_token_refresh(authenticate_user):
+                        log.info("Token refreshed, retrying request...")
+                        # Retry the request with the new token, the page is then processed like any other
+                        req, resp_data = self._make_request(url, payload, authenticate_user)
+                    if req.status_code == 401 or not resp_data:
+                        log.error("The authentication to Trakt is revoked or refresh failed. Please re-authenticate.")
+                        exit()
+
                 current_page = payload['page']
                 total_pages = 0 if 'X-Pagination-Page-Count' not in req.headers else int(
                     req.headers['X-Pagination-Page-Count'])
@@ -178,31 +266,21 @@ class Trakt:
                 log.debug("Response Page: %d of %d", current_page, total_pages)
 
                 if req.status_code == 200 and len(resp_data):
+                    rate_limited = 0
                     if (resp_data.startswith("[{") and resp_data.endswith("}]")) or \
                             (resp_data.startswith("{") and resp_data.endswith("}")):
 
-                        resp_json = json.loads(resp_data)
-
-                        if type_name == 'person' and 'cast' in resp_json:
-                            for item in resp_json['cast']:
-                                # filter out non-acting roles
-                                if not include_non_acting_roles and \
-                                        ((item['character'].strip() == '') or
-                                         'narrat' in item['character'].lower() or
-                                         'himself' in item['character'].lower()):
-                                    continue
-                                if item not in processed:
-                                    if object_name.rstrip('s') not in item and 'title' in item:
-                                        processed.append({object_name.rstrip('s'): item})
-                                    else:
-                                        processed.append(item)
-                        else:
-                            for item in resp_json:
-                                if item not in processed:
-                                    if object_name.rstrip('s') not in item and 'title' in item:
-                                        processed.append({object_name.rstrip('s'): item})
-                                    else:
-                                        processed.append(item)
+                        resp_json = fastjson.loads(resp_data)
+
+                        for item in self._page_items(resp_json, type_name, object_name, include_non_acting_roles):
+                            # skip duplicates, pages can shift while they are being retrieved
+                            item_key = fastjson.dumps_sorted(item)
+                            if item_key in seen:
+                                continue
+                            seen.add(item_key)
+                            processed.append(item)
+                            if limit and len(processed) >= limit:
+                                break
 
                     elif resp_data == '[]':
                         log.warning("Received empty JSON response for page: %d of %d", current_page, total_pages)
@@ -228,22 +306,16 @@ class Trakt:
                     else:
                         log.info("There are %d page(s) left to retrieve results from.", total_pages - current_page)
                         payload['page'] += 1
-                        time.sleep(sleep_between)
+                        if sleep_between:
+                            time.sleep(sleep_between)
+
+                elif req.status_code == 429 and rate_limited < max_attempts:
+                    rate_limited += 1
+                    retry_after = self._retry_after(req.headers)
+                    log.warning("Trakt rate limit exceeded, retrying page %d in %d seconds (attempt %d/%d).",
+                                current_page, retry_after, rate_limited, max_attempts)
+                    time.sleep(retry_after)
 
-                elif req.status_code == 401:
-                    log.warning("Received 401 unauthorized. Token may have expired.")
-                    # Try to refresh token for the authenticated user
-                    if authenticate_user and self._attempt_token_refresh(authenticate_user):
-                        log.info("Token refreshed, retrying request...")
-                        # Retry the request with the new token
-                        req, resp_data = self._make_request(url, payload, authenticate_user)
-                        if req.status_code == 200 and len(resp_data):
-                            resp_json = json.loads(resp_data)
-                            processed.extend(resp_json)
-                            continue  # Continue with the same page
-                    
-                    log.error("The authentication to Trakt is revoked or refresh failed. Please re-authenticate.")
-                    exit()
                 else:
                     log.error("Failed to retrieve %s %s, request response: %d", type_name, object_name, req.status_code)
                     break
@@ -262,6 +334,34 @@ class Trakt:
             log.exception("Exception retrieving %s %s: ", type_name, object_name)
         return None
 
+    @staticmethod
+    def _retry_after(headers, default=5):
+        """Seconds to wait given by the Retry-After header of a 429 response, `default` if missing or an HTTP date."""
+        try:
+            return max(int(headers.get('Retry-After', default)), 0)
+        except (TypeError, ValueError):
+            return default
+
+    @staticmethod
+    def _page_items(resp_json, type_name, object_name, include_non_acting_roles):
+        """Yield the items of a retrieved page as {object type: {LIST_ITEM_FIELDS}}, e.g. {'movie': {...}}."""
+        object_type = object_name.rstrip('s')
+
+        if type_name == 'person' and 'cast' in resp_json:
+            items = resp_json['cast']
+            if not include_non_acting_roles:
+                # filter out non-acting roles
+                items = (item for item in items
+                         if item['character'].strip() != '' and
+                         'narrat' not in item['character'].lower() and
+                         'himself' not in item['character'].lower())
+        else:
+            items = resp_json
+
+        for item in items:
+            media = item.get(object_type, item) if 'title' not in item else item
+            yield {object_type: {field: value for field, value in media.items() if field in LIST_ITEM_FIELDS}}
+
     def validate_client_id(self):
         try:
             # request anticipated shows to validate client_id
@@ -298,7 +398,7 @@ class Trakt:
         print(self._headers_without_authentication())
 
         # Request device code
-        req = requests.post('https://api.trakt.tv/oauth/device/code', data=payload,
+        req = session.post('https://api.trakt.tv/oauth/device/code', data=payload,
                             headers=self._headers_without_authentication())
         
         log.debug("Device code request status: %d", req.status_code)
@@ -334,7 +434,7 @@ class Trakt:
             temp_headers = self._headers_without_authentication()
             temp_headers['Authorization'] = 'Bearer ' + access_token
 
-            user_req = requests.get('https://api.trakt.tv/users/me', headers=temp_headers)
+            user_req = session.get('https://api.trakt.tv/users/me', headers=temp_headers)
             log.debug("User info request status: %d", user_req.status_code)
             
             if user_req.status_code == 200:
@@ -384,7 +484,7 @@ class Trakt:
                        'client_secret': self.cfg.trakt.client_secret, 'grant_type': 'authorization_code'}
 
             # Poll Trakt for access token
-            req = requests.post('https://api.trakt.tv/oauth/device/token', data=payload,
+            req = session.post('https://api.trakt.tv/oauth/device/token', data=payload,
                                 headers=self._headers_without_authentication())
 
             success, status_code = self.__oauth_process_token_request(req)
@@ -404,7 +504,7 @@ class Trakt:
 
         log.debug("Attempting token refresh with payload: %s", {k: v if k != 'refresh_token' else '***' for k, v in payload.items()})
         
-        req = requests.post('https://api.trakt.tv/oauth/token', data=payload,
+        req = session.post('https://api.trakt.tv/oauth/token', data=payload,
                             headers=self._headers_without_authentication())
 
         log.debug("Token refresh response status: %d", req.status_code)
@@ -500,13 +600,14 @@ class Trakt:
     # Shows
     ############################################################
 
+    @cached_item('tvdb')
     def get_show(self, show_id):
         return self._make_item_request(
             url='https://api.trakt.tv/shows/%s' % str(show_id),
             object_name='show',
         )
 
-    @cache(cache_file=cachefile, retry_if_blank=True)
+    @cached_list(cache_time=3600)
     def get_trending_shows(
             self,
             limit=1000,
@@ -529,7 +630,7 @@ class Trakt:
             runtimes=runtimes,
         )
 
-    @cache(cache_file=cachefile, retry_if_blank=True)
+    @cached_list(cache_time=86400)
     def get_popular_shows(
             self,
             limit=1000,
@@ -552,7 +653,7 @@ class Trakt:
             runtimes=runtimes,
         )
 
-    @cache(cache_file=cachefile, retry_if_blank=True)
+    @cached_list(cache_time=86400)
     def get_anticipated_shows(
             self,
             limit=1000,
@@ -600,7 +701,7 @@ class Trakt:
             include_non_acting_roles=include_non_acting_roles,
         )
 
-    @cache(cache_file=cachefile, retry_if_blank=True)
+    @cached_list(cache_time=86400)
     def get_most_played_shows(
             self,
             limit=1000,
@@ -624,7 +725,7 @@ class Trakt:
             runtimes=runtimes,
         )
 
-    @cache(cache_file=cachefile, retry_if_blank=True)
+    @cached_list(cache_time=86400)
     def get_most_watched_shows(
             self,
             limit=1000,
@@ -648,7 +749,7 @@ class Trakt:
             runtimes=runtimes,
         )
 
-    @cache(cache_file=cachefile, retry_if_blank=True)
+    @cached_list(cache_time=3600)
     def get_recommended_shows(
             self,
             authenticate_user=None,
@@ -730,13 +831,14 @@ class Trakt:
     # Movies
     ############################################################
 
+    @cached_item('tmdb')
     def get_movie(self, movie_id):
         return self._make_item_request(
             url='https://api.trakt.tv/movies/%s' % str(movie_id),
             object_name='movie',
         )
 
-    @cache(cache_file=cachefile, retry_if_blank=True)
+    @cached_list(cache_time=3600)
     def get_trending_movies(
             self,
             limit=1000,
@@ -759,7 +861,7 @@ class Trakt:
             runtimes=runtimes,
         )
 
-    @cache(cache_file=cachefile, retry_if_blank=True)
+    @cached_list(cache_time=86400)
     def get_popular_movies(
             self,
             limit=1000,
@@ -782,7 +884,7 @@ class Trakt:
             runtimes=runtimes,
         )
 
-    @cache(cache_file=cachefile, retry_if_blank=True)
+    @cached_list(cache_time=86400)
     def get_anticipated_movies(
             self,
             limit=1000,
@@ -830,7 +932,7 @@ class Trakt:
             include_non_acting_roles=include_non_acting_roles,
         )
 
-    @cache(cache_file=cachefile, retry_if_blank=True)
+    @cached_list(cache_time=86400)
     def get_most_played_movies(
             self,
             limit=1000,
@@ -854,7 +956,7 @@ class Trakt:
             runtimes=runtimes,
         )
 
-    @cache(cache_file=cachefile, retry_if_blank=True)
+    @cached_list(cache_time=86400)
     def get_most_watched_movies(
             self,
             limit=1000,
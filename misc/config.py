@@ -1,9 +1,12 @@
-import json
+import copy
+import functools
 import os
 import sys
 
 from attrdict import AttrDict
 
+from helpers import fastjson
+
 
 class Singleton(type):
     _instances = {}
@@ -20,16 +23,26 @@ class AttrConfig(AttrDict):
     Simple AttrDict subclass to return None when requested attribute does not exist
     """
 
+    # the option names checked (with a regex) on every attribute access are the same few, so remember the result
+    _valid_name = classmethod(functools.lru_cache(maxsize=None)(AttrDict._valid_name.__func__))
+
     def __init__(self, config):
         super().__init__(config)
 
     def __getattr__(self, item):
-        try:
-            return super().__getattr__(item)
-        except AttributeError:
-            pass
-        # Default behaviour
-        return None
+        # checked up front, raising and catching an AttributeError for every missing option is slow
+        if item not in self or not self._valid_name(item):
+            return None
+
+        value = self[item]
+        if isinstance(value, AttrConfig):
+            return value
+        if isinstance(value, dict):
+            # wrap nested sections once and keep them, instead of copying them on every access (e.g. cfg.sonarr.tags)
+            value = AttrConfig(value)
+            dict.__setitem__(self, item, value)
+            return value
+        return self._build(value)
 
 
 class Config(object, metaclass=Singleton):
@@ -114,6 +127,14 @@ class Config(object, metaclass=Singleton):
         }
     }
 
+    # legacy option (path) -> name of the option replacing it
+    legacy_settings = {
+        ('filters', 'movies', 'blacklist_title_keywords'): 'blacklisted_title_keywords',
+        ('filters', 'movies', 'rating_limit'): 'rotten_tomatoes',
+        ('radarr', 'profile'): 'quality',
+        ('sonarr', 'profile'): 'quality',
+    }
+
     def __init__(self, configfile=None, cachefile=None, logfile=None):
         """Initializes config"""
         self.conf = None
@@ -142,6 +163,10 @@ class Config(object, metaclass=Singleton):
             tmp = self.load_config()
             self.conf, upgraded = self.upgrade_settings(tmp)
 
+            # Replace legacy options in the config file, so they are not checked on every run
+            if self.migrate_legacy_settings(self.conf) and not upgraded:
+                self.dump_config()
+
             # Save config if upgraded
             if upgraded:
                 self.dump_config()
@@ -162,32 +187,33 @@ class Config(object, metaclass=Singleton):
         if os.path.exists(self.config_path):
             return False
         print("Dumping default config to: %s" % self.config_path)
-        with open(self.config_path, 'w') as fp:
-            json.dump(self.base_config, fp, sort_keys=True, indent=2)
+        with open(self.config_path, 'wb') as fp:
+            fp.write(fastjson.dumps_indented(self.base_config))
         return True
 
     def dump_config(self):
         if os.path.exists(self.config_path):
-            with open(self.config_path, 'w') as fp:
-                json.dump(self.conf, fp, sort_keys=True, indent=2)
+            with open(self.config_path, 'wb') as fp:
+                fp.write(fastjson.dumps_indented(self.conf))
             return True
         else:
             return False
 
     def load_config(self):
-        with open(self.config_path, 'r') as fp:
-            return AttrConfig(json.load(fp))
+        with open(self.config_path, 'rb') as fp:
+            return AttrConfig(fastjson.loads(fp.read()))
 
     def __inner_upgrade(self, settings1, settings2, key=None, overwrite=False):
-        sub_upgraded = False
-        merged = settings2.copy()
+        """Merge settings1 into settings2 in place, returning whether settings2 was changed."""
+        upgraded = False
 
         if isinstance(settings1, dict):
             for k, v in settings1.items():
                 # missing k
                 if k not in settings2:
-                    merged[k] = v
-                    sub_upgraded = True
+                    # copied, so the merged settings do not share (and later change) e.g. the base config
+                    settings2[k] = copy.deepcopy(v)
+                    upgraded = True
                     if not key:
                         print("Added %r config option: %s" % (str(k), str(v)))
                     else:
@@ -196,32 +222,44 @@ class Config(object, metaclass=Singleton):
 
                 # iterate children
                 if isinstance(v, (dict, list)):
-                    merged[k], did_upgrade = self.__inner_upgrade(settings1[k], settings2[k], key=k,
-                                                                  overwrite=overwrite)
-                    sub_upgraded = did_upgrade or sub_upgraded
-                elif settings1[k] != settings2[k] and overwrite:
-                    merged = settings1
-                    sub_upgraded = True
+                    upgraded = self.__inner_upgrade(v, settings2[k], key=k, overwrite=overwrite) or upgraded
+                elif v != settings2[k] and overwrite:
+                    settings2[k] = v
+                    upgraded = True
         elif isinstance(settings1, list) and key:
             for v in settings1:
                 if v not in settings2:
-                    merged.append(v)
-                    sub_upgraded = True
+                    settings2.append(v)
+                    upgraded = True
                     print("Added to config option %r: %s" % (str(key), str(v)))
-                    continue
 
-        return merged, sub_upgraded
+        return upgraded
 
     def upgrade_settings(self, currents):
-        upgraded_settings, upgraded = self.__inner_upgrade(self.base_config, currents)
-        return AttrConfig(upgraded_settings), upgraded
+        upgraded = self.__inner_upgrade(self.base_config, currents)
+        return currents, upgraded
+
+    def migrate_legacy_settings(self, settings):
+        migrated = False
+        for path, new_key in self.legacy_settings.items():
+            parent = settings
+            for key in path[:-1]:
+                parent = parent.get(key) or {}
+            if path[-1] not in parent:
+                continue
+
+            value = parent.pop(path[-1])
+            if value:
+                parent[new_key] = value
+            print("Replaced legacy config option %r with %r" % ('.'.join(path), new_key))
+            migrated = True
+
+        return migrated
 
     def merge_settings(self, settings_to_merge):
-        upgraded_settings, upgraded = self.__inner_upgrade(settings_to_merge, self.conf, overwrite=True)
-
-        self.conf = upgraded_settings
+        upgraded = self.__inner_upgrade(settings_to_merge, self.conf, overwrite=True)
 
         if upgraded:
             self.dump_config()
 
-        return AttrConfig(upgraded_settings), upgraded
+        return self.conf, upgraded
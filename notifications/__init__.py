@@ -52,6 +52,9 @@ class Notifications:
             for service in self.services:
                 if chosen_service and service.NAME.lower() != chosen_service:
                     continue
+                elif hasattr(service, 'send_async'):
+                    # slow agents deliver in the background, and log when they did
+                    service.send_async(**kwargs)
                 elif service.send(**kwargs):
                     log.debug("Sent notification with %s", service.NAME)
         except Exception:
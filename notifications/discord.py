@@ -1,17 +1,56 @@
-import requests
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
+from helpers import fastjson
+from helpers.http import session
 from misc.log import logger
 
 log = logger.get_logger(__name__)
 
+# a single worker delivers the webhooks in order without holding up the adds, pending ones are still sent at exit
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='discord')
+
+
+def _join_messages(messages, max_length):
+    """Join messages with new lines into as few contents of at most max_length characters as possible."""
+    contents = []
+    current = ''
+    for message in messages:
+        if current and len(current) + 1 + len(message) > max_length:
+            contents.append(current)
+            current = ''
+        current = current + '\n' + message if current else message
+    if current:
+        contents.append(current)
+    return contents
+
 
 class Discord:
     NAME = "Discord"
+    # attempts when the webhook is rate limited (429), waiting the Retry-After seconds in between
+    RATE_LIMIT_ATTEMPTS = 3
+    MAX_RETRY_AFTER = 30
+    # background messages queued within this many seconds are sent as one, below the 2000 character content limit
+    COALESCE_SECONDS = 2
+    MAX_CONTENT_LENGTH = 1900
+    HEADERS = {'Content-Type': 'application/json'}
 
     def __init__(self, webhook_url, username='Traktarr', avatar_url=None):
         self.webhook_url = webhook_url
         self.username = username
         self.avatar_url = avatar_url
+        # static part of every payload
+        self._base_payload = {'username': username}
+        if avatar_url:
+            self._base_payload['avatar_url'] = avatar_url
+        self._pending = deque()
+        self._pending_lock = threading.Lock()
+        self._flush_future = None
+        # from the X-RateLimit headers of the last response, to wait for the reset instead of running into a 429
+        self._requests_remaining = None
+        self._reset_at = 0
         log.debug("Initialized Discord notification agent")
 
     def send(self, **kwargs):
@@ -21,18 +60,78 @@ class Discord:
 
         # send notification
         try:
-            payload = {
-                'content': kwargs['message'],
-                'username': self.username,
-            }
-            
-            # Add avatar URL if provided
-            if self.avatar_url:
-                payload['avatar_url'] = self.avatar_url
-
-            resp = requests.post(self.webhook_url, json=payload, timeout=30)
+            body = fastjson.dumps({**self._base_payload, 'content': kwargs['message']})
+
+            for attempt in range(1, self.RATE_LIMIT_ATTEMPTS + 1):
+                self._wait_for_rate_limit()
+                resp = session.post(self.webhook_url, data=body, headers=self.HEADERS, timeout=30)
+                self._update_rate_limit(resp.headers)
+                if resp.status_code != 429 or attempt == self.RATE_LIMIT_ATTEMPTS:
+                    break
+                retry_after = min(self._retry_after(resp), self.MAX_RETRY_AFTER)
+                log.debug("Discord webhook rate limited, retrying in %.1f seconds", retry_after)
+                time.sleep(retry_after)
+
             return resp.status_code == 204  # Discord returns 204 for successful webhook
 
         except Exception:
             log.exception("Error sending notification to %r", self.webhook_url)
         return False
+
+    def _wait_for_rate_limit(self):
+        if self._requests_remaining == 0:
+            delay = min(self._reset_at - time.monotonic(), self.MAX_RETRY_AFTER)
+            if delay > 0:
+                log.debug("Discord webhook rate limit reached, waiting %.1f seconds", delay)
+                time.sleep(delay)
+            self._requests_remaining = None
+
+    def _update_rate_limit(self, headers):
+        try:
+            self._requests_remaining = int(headers['X-RateLimit-Remaining'])
+            self._reset_at = time.monotonic() + float(headers['X-RateLimit-Reset-After'])
+        except (KeyError, TypeError, ValueError):
+            self._requests_remaining = None
+
+    @staticmethod
+    def _retry_after(resp):
+        try:
+            return float(resp.headers['Retry-After'])
+        except (KeyError, TypeError, ValueError):
+            pass
+        # noinspection PyBroadException
+        try:
+            return float(resp.json().get('retry_after', 1))
+        except Exception:
+            return 1.0
+
+    def send_async(self, **kwargs):
+        """
+        Send the notification in the background, together with the others queued within COALESCE_SECONDS.
+
+        Returns:
+            Future of whether the combined message(s) were sent
+        """
+        with self._pending_lock:
+            self._pending.append(kwargs['message'])
+            if self._flush_future is None:
+                self._flush_future = _executor.submit(self._flush)
+                # once per flush, not per message sent with it
+                self._flush_future.add_done_callback(self._log_sent)
+            return self._flush_future
+
+    def _log_sent(self, future):
+        if future.result():
+            log.debug("Sent notification with %s", self.NAME)
+
+    def _flush(self):
+        time.sleep(self.COALESCE_SECONDS)
+        with self._pending_lock:
+            messages = list(self._pending)
+            self._pending.clear()
+            self._flush_future = None
+
+        sent = True
+        for content in _join_messages(messages, self.MAX_CONTENT_LENGTH):
+            sent = self.send(message=content) and sent
+        return sent
@@ -1,5 +1,4 @@
-import requests
-
+from helpers.http import session
 from misc.log import logger
 
 log = logger.get_logger(__name__)
@@ -27,7 +26,7 @@ class Pushover:
                 'message': kwargs['message'],
                 'priority': self.priority,
             }
-            resp = requests.post('https://api.pushover.net/1/messages.json', data=payload, timeout=30)
+            resp = session.post('https://api.pushover.net/1/messages.json', data=payload, timeout=30)
             return resp.status_code == 200
 
         except Exception:
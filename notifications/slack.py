@@ -1,5 +1,4 @@
-import requests
-
+from helpers.http import session
 from misc.log import logger
 
 log = logger.get_logger(__name__)
@@ -30,7 +29,7 @@ class Slack:
             if self.channel:
                 payload['channel'] = self.channel
 
-            resp = requests.post(self.webhook_url, json=payload, timeout=30)
+            resp = session.post(self.webhook_url, json=payload, timeout=30)
             return resp.status_code == 200
 
         except Exception:
@@ -9,33 +9,76 @@ import sys
 import subprocess
 import argparse
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# the traktarr directory, commands run there and paths are relative to it (the working directory is left alone)
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TESTS = os.path.join(ROOT, 'tests')
+
+# pytest arguments to run the tests in parallel with pytest-xdist, one worker per CPU (see --parallel)
+PARALLEL_ARGS = ['-n', 'auto', '--dist=loadfile']
+# extra pytest arguments for every run
+pytest_args = []
+# set when several test types run at once, each then runs in its own captured process and prints when done
+concurrent = False
+_print_lock = threading.Lock()
 
 
 def run_command(cmd, description):
     """Run a command and handle the output."""
-    print(f"\n{'='*60}")
-    print(f"Running: {description}")
-    print(f"Command: {' '.join(cmd)}")
-    print(f"{'='*60}")
-    
+    is_pytest = cmd[1:3] == ['-m', 'pytest']
+    if is_pytest:
+        cmd = cmd + pytest_args
+    output = [
+        f"\n{'='*60}",
+        f"Running: {description}",
+        f"Command: {' '.join(cmd)}",
+        f"{'='*60}",
+    ]
+
+    if not concurrent:
+        print('\n'.join(output))
+        if is_pytest:
+            return run_pytest(cmd[3:], description)
+        return stream_command(cmd, description)
+
+    success = False
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        result = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, check=False)
         
         if result.stdout:
-            print("STDOUT:")
-            print(result.stdout)
+            output += ["STDOUT:", result.stdout]
         
         if result.stderr:
-            print("STDERR:")
-            print(result.stderr)
+            output += ["STDERR:", result.stderr]
         
         if result.returncode == 0:
-            print(f"✅ {description} completed successfully")
+            output.append(f"✅ {description} completed successfully")
         else:
-            print(f"❌ {description} failed with exit code {result.returncode}")
+            output.append(f"❌ {description} failed with exit code {result.returncode}")
         
-        return result.returncode == 0
+        success = result.returncode == 0
         
+    except FileNotFoundError:
+        output.append(f"❌ Command not found: {cmd[0]}")
+    except Exception as e:
+        output.append(f"❌ Error running {description}: {e}")
+
+    # concurrent test types print their output in one piece, so it does not interleave
+    with _print_lock:
+        print('\n'.join(output))
+    return success
+
+
+def stream_command(cmd, description):
+    """Run a command, printing its output as it arrives."""
+    try:
+        with subprocess.Popen(cmd, cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+        returncode = proc.returncode
     except FileNotFoundError:
         print(f"❌ Command not found: {cmd[0]}")
         return False
@@ -43,9 +86,59 @@ def run_command(cmd, description):
         print(f"❌ Error running {description}: {e}")
         return False
 
+    if returncode == 0:
+        print(f"✅ {description} completed successfully")
+    else:
+        print(f"❌ {description} failed with exit code {returncode}")
+    return returncode == 0
+
+
+def run_pytest(args, description):
+    """Run pytest in this interpreter, instead of paying the start up of a new one."""
+    try:
+        import pytest
+    except ImportError:
+        print("❌ pytest is not installed, run: python run_tests.py install-deps")
+        return False
+
+    returncode = pytest.main(args)
+    if returncode == 0:
+        print(f"✅ {description} completed successfully")
+    else:
+        print(f"❌ {description} failed with exit code {int(returncode)}")
+    return returncode == 0
+
+
+def test_dependencies_satisfied(requirements_file=os.path.join(ROOT, 'test-requirements.txt')):
+    """Whether every requirement in requirements_file is installed in a matching version."""
+    try:
+        from importlib import metadata
+        from packaging.requirements import Requirement
+    except ImportError:
+        # let pip check
+        return False
+
+    try:
+        with open(requirements_file) as fp:
+            for line in fp:
+                line = line.split('#', 1)[0].strip()
+                if not line:
+                    continue
+                requirement = Requirement(line)
+                if metadata.version(requirement.name) not in requirement.specifier:
+                    return False
+    except Exception:
+        # missing distribution or a line pip understands but packaging does not
+        return False
+    return True
+
 
 def install_test_dependencies():
     """Install test dependencies."""
+    if test_dependencies_satisfied():
+        print("✅ All test dependencies already installed")
+        return True
+
     print("Installing test dependencies...")
     return run_command([
         sys.executable, '-m', 'pip', 'install', '-r', 'test-requirements.txt'
@@ -55,49 +148,49 @@ def install_test_dependencies():
 def run_unit_tests():
     """Run unit tests."""
     return run_command([
-        sys.executable, '-m', 'pytest', 'tests/', '-m', 'unit or not integration', '-v'
+        sys.executable, '-m', 'pytest', TESTS, '-m', 'unit or not integration', '-v'
     ], "Unit tests")
 
 
 def run_integration_tests():
     """Run integration tests."""
     return run_command([
-        sys.executable, '-m', 'pytest', 'tests/', '-m', 'integration', '-v'
+        sys.executable, '-m', 'pytest', TESTS, '-m', 'integration', '-v'
     ], "Integration tests")
 
 
 def run_cli_tests():
     """Run CLI tests."""
     return run_command([
-        sys.executable, '-m', 'pytest', 'tests/test_cli_commands.py', '-v'
+        sys.executable, '-m', 'pytest', os.path.join(TESTS, 'test_cli_commands.py'), '-v'
     ], "CLI command tests")
 
 
 def run_business_logic_tests():
     """Run business logic tests."""
     return run_command([
-        sys.executable, '-m', 'pytest', 'tests/test_business_logic.py', '-v'
+        sys.executable, '-m', 'pytest', os.path.join(TESTS, 'test_business_logic.py'), '-v'
     ], "Business logic tests")
 
 
 def run_helper_tests():
     """Run helper tests."""
     return run_command([
-        sys.executable, '-m', 'pytest', 'tests/test_helpers.py', '-v'
+        sys.executable, '-m', 'pytest', os.path.join(TESTS, 'test_helpers.py'), '-v'
     ], "Helper module tests")
 
 
 def run_all_tests():
     """Run all tests."""
     return run_command([
-        sys.executable, '-m', 'pytest', 'tests/', '-v'
+        sys.executable, '-m', 'pytest', TESTS, '-v'
     ], "All tests")
 
 
 def run_coverage_tests():
     """Run tests with coverage reporting."""
     return run_command([
-        sys.executable, '-m', 'pytest', 'tests/', 
+        sys.executable, '-m', 'pytest', TESTS,
         '--cov=cli', '--cov=core', '--cov=helpers', '--cov=media', '--cov=misc', '--cov=notifications',
         '--cov-report=html', '--cov-report=term-missing', '-v'
     ], "Tests with coverage")
@@ -106,10 +199,22 @@ def run_coverage_tests():
 def run_fast_tests():
     """Run only fast tests (exclude slow marker)."""
     return run_command([
-        sys.executable, '-m', 'pytest', 'tests/', '-m', 'not slow', '-v'
+        sys.executable, '-m', 'pytest', TESTS, '-m', 'not slow', '-v'
     ], "Fast tests")
 
 
+TEST_RUNNERS = {
+    'all': run_all_tests,
+    'unit': run_unit_tests,
+    'integration': run_integration_tests,
+    'cli': run_cli_tests,
+    'business': run_business_logic_tests,
+    'helpers': run_helper_tests,
+    'coverage': run_coverage_tests,
+    'fast': run_fast_tests,
+}
+
+
 def main():
     """Main test runner function."""
     parser = argparse.ArgumentParser(description='Traktarr Test Runner')
@@ -119,45 +224,59 @@ def main():
             'all', 'unit', 'integration', 'cli', 'business', 'helpers', 
             'coverage', 'fast', 'install-deps'
         ],
-        help='Type of tests to run'
+        nargs='+',
+        help='Type(s) of tests to run, several are run concurrently'
     )
     parser.add_argument(
         '--install-first',
         action='store_true',
         help='Install test dependencies before running tests'
     )
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Run the test files in parallel on all CPUs (requires pytest-xdist)'
+    )
+    parser.add_argument(
+        '--last-failed',
+        action='store_true',
+        help='Only rerun the tests that failed in the last run (all tests if none failed)'
+    )
+    parser.add_argument(
+        '--failed-first',
+        action='store_true',
+        help='Run the tests that failed in the last run first, then the rest'
+    )
     
     args = parser.parse_args()
     
-    # Change to the traktarr directory
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
-    
     success = True
-    
+
+    if args.parallel:
+        pytest_args.extend(PARALLEL_ARGS)
+    # both use the failures pytest keeps in .pytest_cache
+    if args.last_failed:
+        pytest_args.append('--last-failed')
+    if args.failed_first:
+        pytest_args.append('--failed-first')
+
     # Install dependencies if requested
-    if args.install_first or args.test_type == 'install-deps':
+    if args.install_first or 'install-deps' in args.test_type:
         success = install_test_dependencies()
-        if args.test_type == 'install-deps':
-            return 0 if success else 1
-    
-    # Run the requested tests
-    if args.test_type == 'all':
-        success = run_all_tests()
-    elif args.test_type == 'unit':
-        success = run_unit_tests()
-    elif args.test_type == 'integration':
-        success = run_integration_tests()
-    elif args.test_type == 'cli':
-        success = run_cli_tests()
-    elif args.test_type == 'business':
-        success = run_business_logic_tests()
-    elif args.test_type == 'helpers':
-        success = run_helper_tests()
-    elif args.test_type == 'coverage':
-        success = run_coverage_tests()
-    elif args.test_type == 'fast':
-        success = run_fast_tests()
-    
+        if not success:
+            return 1
+
+    # Run the requested tests, each test type only once
+    runners = [TEST_RUNNERS[test_type] for test_type in dict.fromkeys(args.test_type) if test_type in TEST_RUNNERS]
+    if len(runners) > 1:
+        # the test types run in their own processes, the threads only wait for them
+        global concurrent
+        concurrent = True
+        with ThreadPoolExecutor(max_workers=min(len(runners), os.cpu_count() or 1)) as executor:
+            success = all(list(executor.map(lambda runner: runner(), runners)))
+    elif runners:
+        success = runners[0]()
+
     return 0 if success else 1
 
 
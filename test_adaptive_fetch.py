@@ -5,6 +5,7 @@ Test script to verify adaptive fetching logic for Trakt lists
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, os.path.abspath('.'))
 
 from core.business_logic import init_globals, _get_trakt_list
@@ -23,13 +24,19 @@ def test_boxoffice_adaptive_fetch():
     
     # Create Trakt instance
     trakt = Trakt(cfg)
-    
+
+    def fetch(limit):
+        return _get_trakt_list(
+            trakt, 'movies', 'boxoffice', None, False, None,
+            None, None, None, None, None, limit=limit
+        )
+
+    # The three fetches are independent, run them at the same time (the Trakt session and rate limiter are shared)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        result1, result2, result3 = executor.map(fetch, (3, 10, None))
+
     # Test 1: Fetch small limit
     print("\n=== Test 1: Fetch 3 items ===")
-    result1 = _get_trakt_list(
-        trakt, 'movies', 'boxoffice', None, False, None, 
-        None, None, None, None, None, limit=3
-    )
     if result1:
         print(f"✓ Fetched {len(result1)} movies with limit=3")
         for i, movie in enumerate(result1[:3]):
@@ -42,10 +49,6 @@ def test_boxoffice_adaptive_fetch():
     
     # Test 2: Fetch larger limit
     print("\n=== Test 2: Fetch 10 items ===")
-    result2 = _get_trakt_list(
-        trakt, 'movies', 'boxoffice', None, False, None,
-        None, None, None, None, None, limit=10
-    )
     if result2:
         print(f"✓ Fetched {len(result2)} movies with limit=10")
         print(f"Comparison: limit=3 got {len(result1)}, limit=10 got {len(result2)}")
@@ -54,10 +57,6 @@ def test_boxoffice_adaptive_fetch():
     
     # Test 3: Fetch unlimited
     print("\n=== Test 3: Fetch all available ===")
-    result3 = _get_trakt_list(
-        trakt, 'movies', 'boxoffice', None, False, None,
-        None, None, None, None, None, limit=None
-    )
     if result3:
         print(f"✓ Fetched {len(result3)} movies with no limit")
         print(f"Total available in boxoffice list: {len(result3)}")
@@ -18,6 +18,8 @@ To test Discord notifications:
 import sys
 from notifications.discord import Discord
 
+WEBHOOK_URL_PREFIXES = ("https://discord.com/api/webhooks/", "https://discordapp.com/api/webhooks/")
+
 def test_discord_notification(webhook_url):
     """Test Discord notification with the provided webhook URL."""
     print("Testing Discord notification...")
@@ -53,9 +55,9 @@ if __name__ == "__main__":
     
     webhook_url = sys.argv[1]
     
-    if not (webhook_url.startswith("https://discord.com/api/webhooks/") or webhook_url.startswith("https://discordapp.com/api/webhooks/")):
+    if not webhook_url.startswith(WEBHOOK_URL_PREFIXES):
         print("❌ Invalid Discord webhook URL format.")
-        print("Expected format: https://discord.com/api/webhooks/... or https://discordapp.com/api/webhooks/...")
+        print("Expected format: %s..." % "... or ".join(WEBHOOK_URL_PREFIXES))
         sys.exit(1)
     
     test_discord_notification(webhook_url)
@@ -6,6 +6,15 @@ This script provides a quick overview of test status and runs the working tests.
 """
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+
+def run_test_group(test_group):
+    """Run one test group in its own pytest process, returns (test group, return code, output)."""
+    cmd = [sys.executable, "-m", "pytest", test_group, "-v", "--tb=short"]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    return test_group, result.returncode, result.stdout + result.stderr
+
 
 def run_tests_with_summary():
     """Run the tests that are known to work and provide a summary."""
@@ -27,12 +36,17 @@ def run_tests_with_summary():
     print(f"✅ Running {len(working_tests)} test groups that are fully working...")
     print()
     
-    # Run working tests
-    cmd = ["python", "-m", "pytest"] + working_tests + ["-v", "--tb=short"]
-    
+    # Run working tests, the groups at the same time. pytest.main() cannot run several sessions at once in this
+    # interpreter, so like several test types in run_tests.py, each group runs in its own pytest process and the
+    # threads only wait for them
     try:
-        result = subprocess.run(cmd, capture_output=False, text=True)
-        return_code = result.returncode
+        with ThreadPoolExecutor(max_workers=min(len(working_tests), 8)) as executor:
+            results = list(executor.map(run_test_group, working_tests))
+        return_code = 0
+        for test_group, group_return_code, output in results:
+            print(f"{'✅' if group_return_code == 0 else '❌'} {test_group}")
+            print(output)
+            return_code = return_code or group_return_code
     except Exception as e:
         print(f"❌ Error running tests: {e}")
         return 1
@@ -0,0 +1,482 @@
+"""Tests for the scheduler loop of automatic mode (run_automatic_mode)."""
+
+import itertools
+from collections import namedtuple
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import ANY, MagicMock, Mock, patch
+from misc.config import Singleton
+from core import business_logic as bl
+from core.business_logic import run_automatic_mode
+
+
+# Trakt list methods returning no items in the end-to-end test
+_TRAKT_EMPTY_METHODS = ('get_popular_movies', 'get_trending_movies', 'get_boxoffice_movies', 'get_watchlist_movies',
+                        'get_user_list_movies', 'get_anticipated_shows', 'get_popular_shows', 'get_trending_shows',
+                        'get_most_watched_shows', 'get_most_played_shows', 'get_watchlist_shows',
+                        'get_user_list_shows')
+_TRAKT_EMPTY_CONFIG = {'%s.return_value' % method_name: [] for method_name in _TRAKT_EMPTY_METHODS}
+
+
+@pytest.fixture(autouse=True, scope="module")
+def clear_singleton():
+    """Clear singleton instances before and after the tests of this module (none of them create a Config)."""
+    Singleton._instances = {}
+    yield
+    Singleton._instances = {}
+
+
+@pytest.fixture
+def mock_cfg(monkeypatch):
+    """Replace the config of the business logic with a MagicMock."""
+    mock = MagicMock()
+    monkeypatch.setattr(bl, 'cfg', mock)
+    return mock
+
+
+@pytest.fixture
+def mock_notify(monkeypatch):
+    """Replace the notifications of the business logic with a MagicMock."""
+    mock = MagicMock()
+    monkeypatch.setattr(bl, 'notify', mock)
+    return mock
+
+
+@pytest.fixture
+def mock_log(monkeypatch):
+    """Replace the logger of the business logic with a MagicMock."""
+    mock = MagicMock()
+    monkeypatch.setattr(bl, 'log', mock)
+    return mock
+
+
+AutomaticTasks = namedtuple('AutomaticTasks', ('movies_pub', 'movies_user', 'shows_pub', 'shows_user'))
+
+
+@pytest.fixture
+def patched_auto_fns(monkeypatch):
+    """Replace the four scheduled automatic_*_lists functions of the business logic with mocks."""
+    patched = AutomaticTasks(*(Mock(return_value=1) for _ in AutomaticTasks._fields))
+    monkeypatch.setattr(bl, 'automatic_movies_public_lists', patched.movies_pub)
+    monkeypatch.setattr(bl, 'automatic_movies_user_lists', patched.movies_user)
+    monkeypatch.setattr(bl, 'automatic_shows_public_lists', patched.shows_pub)
+    monkeypatch.setattr(bl, 'automatic_shows_user_lists', patched.shows_user)
+    return patched
+
+
+@pytest.fixture
+def mock_schedule_and_time(monkeypatch):
+    """Mock schedule and time modules in business logic."""
+    # Create mock schedule
+    mock_schedule = Mock()
+    mock_schedule.every = Mock()
+    mock_schedule.run_pending = Mock()
+    mock_schedule.idle_seconds = Mock()
+    mock_schedule.next_run = Mock()
+    
+    # Create mock time
+    mock_time_module = Mock()
+    mock_time_module.time = Mock()
+    mock_time_module.sleep = Mock()
+    
+    # Replace the modules, monkeypatch restores them after the test
+    monkeypatch.setattr(bl, 'schedule', mock_schedule)
+    monkeypatch.setattr(bl, 'time', mock_time_module)
+    
+    return mock_schedule, mock_time_module
+
+
+@pytest.fixture
+def mock_task(mock_schedule_and_time):
+    """Make every schedule.every(...).hours.do(...) of the mocked schedule return this task."""
+    mock_schedule, _ = mock_schedule_and_time
+    task = SimpleNamespace(tag='test_task', next_run=SimpleNamespace(strftime=lambda fmt: '2024-01-01 12:00:00'),
+                           run=Mock(return_value=None))
+    mock_schedule.every.return_value.hours.do.return_value = task
+    return task
+
+
+class TestRunAutomaticMode:
+    """Test the run_automatic_mode function."""
+    
+    def test_run_automatic_mode_basic_scheduling(self, mock_log, mock_notify, mock_cfg, mock_schedule_and_time,
+                                                 patched_auto_fns, mock_task):
+        """Test basic scheduling functionality in automatic mode."""
+        mock_schedule, mock_time_module = mock_schedule_and_time
+        
+        # Configure the mocked config
+        mock_cfg.automatic = Mock()
+        mock_cfg.automatic.movies = Mock()
+        mock_cfg.automatic.shows = Mock()
+        mock_cfg.automatic.movies.intervals = {'public_lists': 24, 'user_lists': 12}
+        mock_cfg.automatic.shows.intervals = {'public_lists': 8, 'user_lists': 6}
+        
+        # Configure other required config
+        mock_cfg.notifications = Mock()
+        mock_cfg.notifications.verbose = True
+        mock_cfg.filters = Mock()
+        mock_cfg.filters.movies = Mock()
+        mock_cfg.filters.movies.rotten_tomatoes = ""
+        
+        mock_schedule.idle_seconds.side_effect = [3600, 0, -1]  # First sleep, then run, then exit
+        mock_schedule.next_run.return_value = Mock()
+        mock_schedule.next_run.return_value.strftime.return_value = '2024-01-01 13:00:00'
+        
+        # Mock time progression
+        mock_time_module.time.side_effect = [0, 1, 2, 3600, 3601]  # Time progression for log intervals
+
+        # Mock the automatic functions to avoid calling them
+        patched_auto_fns.movies_pub.return_value = 2
+        patched_auto_fns.movies_user.return_value = 1
+        patched_auto_fns.shows_pub.return_value = 3
+        patched_auto_fns.shows_user.return_value = 1
+
+        # Run for limited iterations to avoid infinite loop
+        mock_schedule.run_pending.side_effect = [None] * 2 + [KeyboardInterrupt("Test termination")]
+
+        # Test should exit via KeyboardInterrupt
+        with pytest.raises(KeyboardInterrupt):
+            run_automatic_mode(
+                add_delay=1.0,
+                sort='votes',
+                no_search=False,
+                run_now=False,
+                no_notifications=False,
+                ignore_blacklist=False
+            )
+
+        # Verify scheduling was attempted for all 4 task types
+        assert mock_schedule.every.call_count == 4
+        
+        # Verify the main loop functions were called
+        assert mock_schedule.run_pending.call_count >= 1
+        assert mock_schedule.idle_seconds.call_count >= 1
+        assert mock_time_module.sleep.call_count >= 1
+        
+        # Verify initial logging
+        mock_log.info.assert_any_call("Automatic mode is now running.")
+        mock_log.info.assert_any_call("Successfully scheduled %d automatic tasks", 4)
+        mock_log.info.assert_any_call("  - %s: next run at %s", ANY, '2024-01-01 12:00:00')
+    
+    def test_run_automatic_mode_with_run_now(self, mock_log, mock_notify, mock_cfg, mock_schedule_and_time,
+                                             patched_auto_fns, mock_task):
+        """Test automatic mode with run_now option."""
+        mock_schedule, mock_time_module = mock_schedule_and_time
+        
+        # Configure intervals so tasks will be scheduled
+        mock_cfg.automatic = Mock()
+        mock_cfg.automatic.movies = Mock()
+        mock_cfg.automatic.shows = Mock()
+        mock_cfg.automatic.movies.intervals = {'public_lists': 24, 'user_lists': 12}
+        mock_cfg.automatic.shows.intervals = {'public_lists': 8, 'user_lists': 6}
+        
+        # Configure other required config
+        mock_cfg.notifications = Mock()
+        mock_cfg.notifications.verbose = True
+        mock_cfg.filters = Mock()
+        mock_cfg.filters.movies = Mock()
+        mock_cfg.filters.movies.rotten_tomatoes = ""
+        
+        # Mock time
+        mock_time_module.time.return_value = 0
+        
+        mock_schedule.idle_seconds.return_value = -1  # Force immediate exit
+        
+        # Mock the automatic functions
+        patched_auto_fns.movies_pub.return_value = 2
+        patched_auto_fns.movies_user.return_value = 1
+        patched_auto_fns.shows_pub.return_value = 3
+        patched_auto_fns.shows_user.return_value = 1
+        
+        # Limit iterations to avoid infinite loop
+        mock_schedule.run_pending.side_effect = [None, KeyboardInterrupt("Test termination")]
+        
+        with pytest.raises(KeyboardInterrupt):
+            run_automatic_mode(
+                add_delay=0.5,
+                sort='rating',
+                no_search=True,
+                run_now=True,  # Should run tasks immediately
+                no_notifications=True,
+                ignore_blacklist=True
+            )
+
+        # Verify tasks were run immediately (task.run() called)
+        assert mock_task.run.call_count == 4  # All 4 tasks should be run immediately
+        
+        # Verify sleep was called between immediate runs
+        sleep_calls = [call for call in mock_time_module.sleep.call_args_list if call[0][0] == 0.5]
+        assert len(sleep_calls) == 4  # Sleep after each immediate run
+
+    def test_run_automatic_mode_concurrent_run_now(self, mock_log, mock_notify, mock_cfg, mock_schedule_and_time):
+        """Test automatic mode running due tasks in parallel with concurrent > 1."""
+        mock_schedule, mock_time_module = mock_schedule_and_time
+
+        mock_cfg.automatic = Mock()
+        mock_cfg.automatic.movies = Mock()
+        mock_cfg.automatic.shows = Mock()
+        mock_cfg.automatic.movies.intervals = {'public_lists': 24, 'user_lists': 12}
+        mock_cfg.automatic.shows.intervals = {'public_lists': 8, 'user_lists': 6}
+        mock_cfg.notifications = Mock()
+        mock_cfg.notifications.verbose = False
+        mock_cfg.filters = Mock()
+        mock_cfg.filters.movies = Mock()
+        mock_cfg.filters.movies.rotten_tomatoes = ""
+
+        mock_time_module.time.return_value = 0
+
+        tasks = []
+
+        def create_task(*args, **kwargs):
+            task = Mock()
+            task.next_run = None
+            task.should_run = False
+            tasks.append(task)
+            return task
+
+        mock_schedule.every.return_value = Mock()
+        mock_schedule.every.return_value.hours.do.side_effect = create_task
+        mock_schedule.jobs = tasks
+
+        # Stop the loop on its first iteration
+        mock_schedule.idle_seconds.side_effect = KeyboardInterrupt("Test termination")
+
+        with pytest.raises(KeyboardInterrupt):
+            run_automatic_mode(add_delay=0.5, run_now=True, no_notifications=True, concurrent=4)
+
+        # All 4 tasks ran immediately without sleeping in between
+        assert len(tasks) == 4
+        for task in tasks:
+            task.run.assert_called_once()
+        assert not [call for call in mock_time_module.sleep.call_args_list if call[0][0] == 0.5]
+        mock_schedule.run_pending.assert_not_called()
+    
+    def test_run_automatic_mode_no_intervals_configured(self, mock_log, mock_notify, mock_cfg, mock_schedule_and_time):
+        """Test automatic mode when no intervals are configured."""
+        mock_schedule, mock_time_module = mock_schedule_and_time
+        
+        # Configure no intervals
+        mock_cfg.automatic = Mock()
+        mock_cfg.automatic.movies = Mock()
+        mock_cfg.automatic.shows = Mock()
+        mock_cfg.automatic.movies.intervals = {}
+        mock_cfg.automatic.shows.intervals = {}
+        
+        # Configure other required config
+        mock_cfg.notifications = Mock()
+        mock_cfg.notifications.verbose = False  # Disable to avoid notify.send calls
+        
+        # Mock schedule to avoid actually scheduling
+        mock_schedule.every.return_value = Mock()
+        
+        # Mock time module
+        mock_time_module.time.return_value = 0
+        
+        # Make sure the main loop exits immediately
+        # Since no tasks are scheduled, idle_seconds() should return a value that causes immediate sleep
+        mock_schedule.idle_seconds.return_value = 1  # Return a small value
+        mock_schedule.next_run.return_value = None  # No next run since no tasks
+        
+        # Mock run_pending to exit immediately after the first call
+        mock_schedule.run_pending.side_effect = KeyboardInterrupt("Test termination")
+        
+        with pytest.raises(KeyboardInterrupt):
+            run_automatic_mode()
+        
+        # Verify warning about no tasks scheduled
+        mock_log.warning.assert_called_with("No automatic tasks scheduled! Check your intervals configuration.")
+        
+        # Verify no tasks were actually scheduled
+        assert mock_schedule.every.call_count == 0
+    
+    def test_run_automatic_mode_idle_without_jobs(self, mock_log, mock_notify, mock_cfg, mock_schedule_and_time):
+        """Test that automatic mode without scheduled jobs sleeps instead of polling."""
+        mock_schedule, mock_time_module = mock_schedule_and_time
+
+        mock_cfg.automatic.movies.intervals = {}
+        mock_cfg.automatic.shows.intervals = {}
+        mock_cfg.notifications.verbose = False
+
+        mock_time_module.time.return_value = 0
+        mock_schedule.idle_seconds.return_value = None  # no jobs
+        mock_time_module.sleep.side_effect = [None, KeyboardInterrupt("Test termination")]
+
+        with pytest.raises(KeyboardInterrupt):
+            run_automatic_mode()
+
+        assert [call[0][0] for call in mock_time_module.sleep.call_args_list] == [3600, 3600]
+        mock_schedule.run_pending.assert_not_called()
+        mock_log.exception.assert_not_called()
+
+    def test_run_automatic_mode_exception_handling(self, mock_log, mock_notify, mock_cfg, mock_schedule_and_time,
+                                                   patched_auto_fns, mock_task):
+        """Test exception handling in automatic mode main loop."""
+        mock_schedule, mock_time_module = mock_schedule_and_time
+        
+        # Configure intervals so tasks will be scheduled
+        mock_cfg.automatic = Mock()
+        mock_cfg.automatic.movies = Mock()
+        mock_cfg.automatic.shows = Mock()
+        mock_cfg.automatic.movies.intervals = {'public_lists': 24, 'user_lists': 12}
+        mock_cfg.automatic.shows.intervals = {'public_lists': 8, 'user_lists': 6}
+        
+        # Configure other required config
+        mock_cfg.notifications = Mock()
+        mock_cfg.notifications.verbose = False  # Disable to avoid notify.send calls
+        mock_cfg.filters = Mock()
+        mock_cfg.filters.movies = Mock()
+        mock_cfg.filters.movies.rotten_tomatoes = ""
+        
+        mock_time_module.time.return_value = 0
+        
+        # Make run_pending throw an exception, then exit
+        test_exception = Exception("Test exception")
+        mock_schedule.run_pending.side_effect = [test_exception, KeyboardInterrupt("Test termination")]
+        mock_schedule.idle_seconds.return_value = 1
+        
+        
+        with pytest.raises(KeyboardInterrupt):
+            run_automatic_mode()
+
+        # Verify exception was logged
+        mock_log.exception.assert_called_with(
+            "Unhandled exception occurred while processing scheduled tasks: %s", 
+            test_exception
+        )
+        
+        # Verify recovery sleep was called
+        sleep_calls = [call for call in mock_time_module.sleep.call_args_list if call[0][0] == 1]
+        assert len(sleep_calls) >= 1
+    
+    def test_run_automatic_mode_periodic_status_logging(self, mock_log, mock_notify, mock_cfg, mock_schedule_and_time,
+                                                        patched_auto_fns):
+        """Test periodic status logging in automatic mode."""
+        mock_schedule, mock_time_module = mock_schedule_and_time
+        
+        # Configure intervals so tasks will be scheduled
+        mock_cfg.automatic = Mock()
+        mock_cfg.automatic.movies = Mock()
+        mock_cfg.automatic.shows = Mock()
+        mock_cfg.automatic.movies.intervals = {'public_lists': 24, 'user_lists': 12}
+        mock_cfg.automatic.shows.intervals = {'public_lists': 8, 'user_lists': 6}
+        
+        # Configure other required config
+        mock_cfg.notifications = Mock()
+        mock_cfg.notifications.verbose = False  # Disable to avoid notify.send calls
+        mock_cfg.filters = Mock()
+        mock_cfg.filters.movies = Mock()
+        mock_cfg.filters.movies.rotten_tomatoes = ""
+        
+        # Mock time progression to trigger periodic logging
+        mock_time_module.time.side_effect = itertools.count(0, 3600)  # Cross a logging threshold every iteration
+        
+        # Mock multiple schedule tasks to match expected output
+        tasks = [
+            SimpleNamespace(tag=tag, next_run=SimpleNamespace(strftime=lambda fmt, hour=hour: '2024-01-01 %s:00:00' % hour))
+            for tag, hour in (('movies public lists', 12), ('movies user lists', 13),
+                              ('shows public lists', 14), ('shows user lists', 15))
+        ]
+        
+        # Set up the task creation sequence
+        task_index = [0]  # Use list to modify in closure
+        
+        def create_task(*args, **kwargs):
+            if task_index[0] < len(tasks):
+                task = tasks[task_index[0]]
+                task_index[0] += 1
+                return task
+            return Mock()
+        
+        mock_schedule.every.return_value = SimpleNamespace(hours=SimpleNamespace(do=create_task))
+        
+        mock_schedule.idle_seconds.return_value = 1
+        mock_schedule.next_run.return_value = Mock()
+        mock_schedule.next_run.return_value.strftime.return_value = '2024-01-01 13:00:00'
+        
+        # Limit iterations
+        mock_schedule.run_pending.side_effect = [None] * 2 + [KeyboardInterrupt("Test termination")]
+        
+        
+        with pytest.raises(KeyboardInterrupt):
+            run_automatic_mode()
+
+        # Verify periodic status logging occurred
+        mock_log.info.assert_any_call("Current schedule status:")
+
+        # Verify individual task status was logged
+        mock_log.info.assert_any_call("  - %s: next run at %s", 'movies public lists', '2024-01-01 12:00:00')
+        mock_log.info.assert_any_call("  - %s: next run at %s", 'shows user lists', ANY)
+
+
+class TestAutomaticModeIntegration:
+    """Integration tests for automatic mode with mocked external dependencies."""
+    
+    @patch('media.trakt.Trakt')
+    def test_end_to_end_automatic_mode_flow(self, mock_trakt_class, mock_log, mock_notify, mock_cfg, mock_schedule_and_time,
+                                            mock_task):
+        """Test end-to-end automatic mode flow with actual task execution."""
+        mock_schedule, mock_time_module = mock_schedule_and_time
+        
+        # Configure intervals so tasks will be scheduled
+        mock_cfg.automatic = Mock()
+        mock_cfg.automatic.movies = Mock()
+        mock_cfg.automatic.shows = Mock()
+        mock_cfg.automatic.movies.intervals = {'public_lists': 24, 'user_lists': 12}
+        mock_cfg.automatic.shows.intervals = {'public_lists': 8, 'user_lists': 6}
+        
+        # Configure other required config
+        mock_cfg.notifications = Mock()
+        mock_cfg.notifications.verbose = False  # Disable to avoid notify.send calls
+        mock_cfg.filters = Mock()
+        mock_cfg.filters.movies = Mock()
+        mock_cfg.filters.movies.rotten_tomatoes = ""
+        
+        mock_time_module.time.return_value = 0
+        
+        # Mock Trakt to return test data
+        mock_trakt = Mock()
+        mock_trakt_class.return_value = mock_trakt
+        
+        # Define non_user_lists attribute
+        mock_trakt_class.non_user_lists = ['anticipated', 'popular', 'trending', 'boxoffice']
+        
+        # Configure Trakt to return some test data
+        mock_trakt.get_anticipated_movies.return_value = [
+            {'title': 'Test Movie', 'year': 2024, 'ids': {'imdb': 'tt1234567', 'tmdb': 12345, 'trakt': 54321}}
+        ]
+        mock_trakt.configure_mock(**_TRAKT_EMPTY_CONFIG)
+        
+        # Track task execution
+        executed_tasks = []
+        def track_task_execution(*args, **kwargs):
+            executed_tasks.append(args)
+            return 1  # Mock successful addition
+        
+        mock_task.run.side_effect = track_task_execution
+        
+        mock_schedule.idle_seconds.return_value = -1  # Exit immediately
+        
+        # Mock _process_media to avoid actual API calls
+        with patch('core.business_logic._process_media') as mock_process:
+            mock_process.return_value = 1  # Return number added
+            
+            # Limit iterations
+            mock_schedule.run_pending.side_effect = [None, KeyboardInterrupt("Test termination")]
+            
+            with pytest.raises(KeyboardInterrupt):
+                run_automatic_mode(
+                    add_delay=0.1,
+                    sort='votes',
+                    no_search=False,
+                    run_now=True,  # Execute tasks immediately
+                    no_notifications=False,
+                    ignore_blacklist=False
+                )
+        
+        # Verify tasks were scheduled and executed
+        assert mock_schedule.every.call_count == 4  # 4 task types
+        assert mock_task.run.call_count == 4  # All tasks run immediately
+        
+        # Verify successful scheduling log
+        mock_log.info.assert_any_call("Successfully scheduled %d automatic tasks", 4)
@@ -5,6 +5,8 @@ These tests verify the core business logic functions work correctly
 with mocked dependencies.
 """
 
+from contextlib import ExitStack
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 import pytest
 
@@ -23,6 +25,72 @@ with patch('core.business_logic.cfg'), \
     )
 
 
+# Patched by the process_shows fixture, by the name of the mock
+_PROCESS_SHOWS_PATCHES = {
+    'cfg': 'core.business_logic.cfg',
+    'log': 'core.business_logic.log',
+    'notify': 'core.business_logic.notify',
+    'trakt_class': 'media.trakt.Trakt',
+    'sonarr_class': 'media.sonarr.Sonarr',
+    'validate_trakt': 'core.business_logic.validate_trakt',
+    'validate_pvr': 'core.business_logic.validate_pvr',
+    'quality_profile': 'core.business_logic.get_quality_profile_id',
+    'get_objects': 'core.business_logic.get_objects',
+    'get_trakt_list': 'core.business_logic._get_trakt_list',
+    'remove_existing': 'helpers.sonarr.remove_existing_series_from_trakt_list',
+    'sorted': 'helpers.misc.sorted_list',
+    'blacklisted': 'helpers.trakt.is_show_blacklisted',
+    'lang_profile': 'core.business_logic.get_language_profile_id',
+    'sleep': 'time.sleep',
+}
+
+
+@pytest.fixture
+def process_shows():
+    """
+    Patch the dependencies of _process_media for a Trakt list of 5 shows that pass every filter.
+
+    Returns the mocks by their _PROCESS_SHOWS_PATCHES name, along with `sonarr` (the Sonarr instance, adding
+    succeeds) and `shows` (the list returned by the patched list functions).
+    """
+    with ExitStack() as stack:
+        mocks = SimpleNamespace(**{name: stack.enter_context(patch(target))
+                                   for name, target in _PROCESS_SHOWS_PATCHES.items()})
+
+        mocks.cfg.filters.shows.allowed_countries = None
+        mocks.cfg.filters.shows.allowed_languages = None
+        mocks.cfg.filters.shows.blacklisted_min_year = None
+        mocks.cfg.filters.shows.blacklisted_max_year = None
+        mocks.cfg.sonarr.tags = None
+
+        mocks.sonarr = Mock()
+        mocks.sonarr_class.return_value = mocks.sonarr
+        mocks.sonarr.add_series.return_value = True
+        mocks.quality_profile.return_value = 5
+        mocks.lang_profile.return_value = 1
+        mocks.get_objects.return_value = []
+
+        mocks.shows = [
+            {
+                'show': {
+                    'title': 'Show %d' % i,
+                    'year': 2020,
+                    'genres': ['drama'],
+                    'country': 'us',
+                    'language': 'en',
+                    'ids': {'tvdb': i, 'tmdb': i, 'imdb': 'tt%d' % i, 'slug': 'show-%d' % i}
+                }
+            }
+            for i in range(1, 6)
+        ]
+        mocks.get_trakt_list.return_value = mocks.shows
+        mocks.remove_existing.return_value = mocks.shows
+        mocks.sorted.return_value = mocks.shows
+        mocks.blacklisted.return_value = False
+
+        yield mocks
+
+
 class TestBusinessLogic:
     """Test core business logic functions."""
 
@@ -340,6 +408,60 @@ class TestBusinessLogic:
             mock_get_quality.assert_called_once()
             mock_radarr.add_movie.assert_called_once()
 
+    @patch('core.business_logic.cfg')
+    @patch('core.business_logic.notify')
+    @patch('core.business_logic.log')
+    def test_callback_notify_events(self, mock_log, mock_notify, mock_cfg):
+        """Test that callback events are sent as notifications, adds only with verbose notifications."""
+        from core.business_logic import callback_notify
+
+        mock_cfg.notifications.verbose = True
+        callback_notify({'event': 'add_movie', 'movie': {'title': 'Movie', 'year': None}, 'list_type': 'trending'})
+        mock_notify.send.assert_called_with(message="Added 'Trending' movie: 'Movie (????)'")
+        callback_notify({'event': 'add_show', 'show': {'title': 'Show', 'year': 2020}, 'list_type': 'popular'})
+        mock_notify.send.assert_called_with(message="ADDED 'Popular' show: 'Show (2020)'")
+
+        mock_cfg.notifications.verbose = False
+        mock_notify.reset_mock()
+        callback_notify({'event': 'add_show', 'show': {'title': 'Show', 'year': 2020}, 'list_type': 'popular'})
+        mock_notify.send.assert_not_called()
+        callback_notify({'event': 'abort', 'list_type': 'watchlist', 'type': 'shows', 'reason': 'Failure'})
+        mock_notify.send.assert_called_with(message="ABORTED ADDING Trakt 'Watchlist' shows due to: Failure")
+        callback_notify({'event': 'error', 'reason': 'Failure'})
+        mock_notify.send.assert_called_with(message="Error: Failure")
+
+        mock_notify.reset_mock()
+        callback_notify({'event': 'unknown'})
+        mock_notify.send.assert_not_called()
+        mock_log.error.assert_called_once()
+
+    @patch('core.business_logic.log')
+    def test_get_trakt_list_dispatch(self, mock_log):
+        """Test that list types are mapped to the matching Trakt method for shows and movies."""
+        from core.business_logic import _get_trakt_list
+
+        trakt = Mock()
+        args = (None, False, 'user1', '2000-2020', None, None, None, '60-180')
+
+        _get_trakt_list(trakt, 'shows', 'Trending', *args, limit=10)
+        trakt.get_trending_shows.assert_called_once_with(
+            limit=10, years='2000-2020', countries=None, languages=None, genres=None)
+
+        _get_trakt_list(trakt, 'movies', 'played_weekly', *args, limit=10)
+        trakt.get_most_played_movies.assert_called_once_with(
+            limit=10, years='2000-2020', countries=None, languages=None, genres=None, runtimes='60-180',
+            most_type='weekly')
+
+        _get_trakt_list(trakt, 'shows', 'Watched', *args, limit=10)
+        trakt.get_most_watched_shows.assert_called_once_with(
+            limit=10, years='2000-2020', countries=None, languages=None, genres=None, most_type=None)
+
+        _get_trakt_list(trakt, 'shows', 'boxoffice', *args, limit=10)
+        trakt.get_user_list_shows.assert_called_once_with('boxoffice', 'user1', limit=10)
+
+        assert _get_trakt_list(trakt, 'movies', 'person', *args, limit=10) is None
+        mock_log.error.assert_called_once()
+
     @patch('core.business_logic._process_media')
     def test_add_multiple_shows_with_limit(self, mock_process_media):
         """Test adding multiple shows with a limit."""
@@ -699,6 +821,86 @@ class TestBusinessLogic:
             'anime'  # series_type (detected from 'Anime' genre)
         )
 
+    def test_process_media_workers_respects_add_limit(self, process_shows):
+        """Test _process_media with multiple workers does not add more than add_limit items."""
+        from core.business_logic import _process_media
+
+        result = _process_media(
+            media_type='shows',
+            list_type='anticipated',
+            add_limit=3,
+            add_delay=0.1,
+            workers=2,
+        )
+
+        assert result == 3
+        assert process_shows.sonarr.add_series.call_count == 3
+        # Two workers may add without delay, the third add waits for its turn
+        assert process_shows.sleep.call_count == 1
+
+    def test_process_media_blacklist_ignores_genres_and_years_arguments(self, process_shows):
+        """Test --genres ignore and --years filter the Trakt list, but blacklist with the configured filters."""
+        from core.business_logic import _process_media
+        from misc.config import AttrConfig
+
+        cfg = AttrConfig({
+            'filters': {'shows': {'blacklisted_genres': ['anime'], 'blacklisted_min_year': 2000,
+                                  'blacklisted_max_year': 2030}},
+            'sonarr': {'tags': None},
+            'notifications': {'verbose': False},
+        })
+        with patch('core.business_logic.cfg', cfg):
+            _process_media(media_type='shows', list_type='anticipated', genres='ignore', years='1990-2020')
+
+        filters_config = process_shows.blacklisted.call_args[0][1]
+        assert filters_config.blacklisted_genres == ('anime',)
+        assert filters_config.blacklisted_min_year == 2000
+        assert filters_config.blacklisted_max_year == 2030
+
+    def test_process_media_stops_on_shutdown(self, process_shows):
+        """Test _process_media does not add any more items once a shutdown was requested."""
+        from core.business_logic import _process_media
+
+        with patch('core.business_logic._shutdown') as mock_shutdown:
+            mock_shutdown.is_set.return_value = True
+            for workers in (1, 2):
+                result = _process_media(
+                    media_type='shows',
+                    list_type='anticipated',
+                    add_limit=3,
+                    add_delay=0.1,
+                    workers=workers,
+                )
+                assert result == 0
+
+        process_shows.sonarr.add_series.assert_not_called()
+
+    def test_process_media_batch_size(self, process_shows):
+        """Test _process_media adding in batches, falling back to single adds when a batch is rejected."""
+        from core.business_logic import _process_media
+
+        # Two full batches
+        del process_shows.shows[4:]
+        mock_sonarr = process_shows.sonarr
+        mock_sonarr.series_payload.side_effect = lambda tvdb_id, *args: {'tvdbId': tvdb_id}
+        # First batch is accepted except for the second show, second batch is rejected
+        mock_sonarr.import_series.side_effect = [{1}, None]
+
+        result = _process_media(
+            media_type='shows',
+            list_type='anticipated',
+            add_delay=0.1,
+            batch_size=2,
+        )
+
+        assert result == 3
+        assert mock_sonarr.import_series.call_args_list[0][0][0] == [{'tvdbId': 1}, {'tvdbId': 2}]
+        assert mock_sonarr.import_series.call_args_list[1][0][0] == [{'tvdbId': 3}, {'tvdbId': 4}]
+        # Rejected batch is added one show at a time
+        assert [c[0][0] for c in mock_sonarr.add_series.call_args_list] == [3, 4]
+        # the language profile is looked up once, not for every show
+        assert process_shows.lang_profile.call_count == 1
+
     @patch('core.business_logic.cfg')
     @patch('core.business_logic.log')
     @patch('core.business_logic.notify')
@@ -880,7 +1082,7 @@ class TestBusinessLogic:
                     }
                 }
             }
-        ]
+        ] * 3  # a dry run lists every item, add_limit only counts added items
         mock_get_trakt_list.return_value = trakt_show_data
         mock_remove_existing.return_value = trakt_show_data
         mock_sorted.return_value = trakt_show_data
@@ -904,7 +1106,7 @@ class TestBusinessLogic:
         mock_get_trakt_list.assert_called_once()
         mock_remove_existing.assert_called_once()
         mock_sorted.assert_called_once()
-        mock_blacklisted.assert_called_once()
+        assert mock_blacklisted.call_count == 3
 
     @patch('core.business_logic.cfg')
     @patch('core.business_logic.log')
@@ -19,17 +19,17 @@ class TestCLICommands:
         """Setup for each test method."""
         self.runner = CliRunner()
 
-    @patch('cli.commands.init_globals')
+    @patch('core.business_logic.init_globals')
     def test_app_initialization_with_defaults(self, mock_init):
         """Test that the app initializes with default config paths."""
         result = self.runner.invoke(app, ['--help'])
         assert result.exit_code == 0
         assert 'Add new shows & movies to Sonarr/Radarr from Trakt.' in result.output
 
-    @patch('cli.commands.init_globals')
+    @patch('core.business_logic.init_globals')
     def test_app_initialization_with_custom_config(self, mock_init):
         """Test app initialization with custom config file."""
-        with patch('cli.commands.trakt_authentication') as mock_auth:
+        with patch('core.business_logic.trakt_authentication') as mock_auth:
             result = self.runner.invoke(app, [
                 '--config', '/custom/config.json',
                 '--cachefile', '/custom/cache.db', 
@@ -46,8 +46,8 @@ class TestCLICommands:
             mock_auth.assert_called_once()
             assert result.exit_code == 0
 
-    @patch('cli.commands.init_globals')
-    @patch('cli.commands.trakt_authentication')
+    @patch('core.business_logic.init_globals')
+    @patch('core.business_logic.trakt_authentication')
     def test_trakt_auth_command(self, mock_auth, mock_init):
         """Test the trakt-auth command."""
         result = self.runner.invoke(app, ['trakt-auth'])
@@ -56,8 +56,8 @@ class TestCLICommands:
         mock_auth.assert_called_once()
         assert result.exit_code == 0
 
-    @patch('cli.commands.init_globals')
-    @patch('cli.commands.add_single_show')
+    @patch('core.business_logic.init_globals')
+    @patch('core.business_logic.add_single_show')
     def test_show_command_required_args(self, mock_add_show, mock_init):
         """Test the show command with required arguments."""
         result = self.runner.invoke(app, ['show', '--show-id', '12345'])
@@ -66,8 +66,8 @@ class TestCLICommands:
         mock_add_show.assert_called_once_with('12345', None, False)
         assert result.exit_code == 0
 
-    @patch('cli.commands.init_globals')
-    @patch('cli.commands.add_single_show')
+    @patch('core.business_logic.init_globals')
+    @patch('core.business_logic.add_single_show')
     def test_show_command_all_args(self, mock_add_show, mock_init):
         """Test the show command with all optional arguments."""
         result = self.runner.invoke(app, [
@@ -81,7 +81,7 @@ class TestCLICommands:
         mock_add_show.assert_called_once_with('12345', '/custom/tv', True)
         assert result.exit_code == 0
 
-    @patch('cli.commands.init_globals')
+    @patch('core.business_logic.init_globals')
     def test_show_command_missing_required_arg(self, mock_init):
         """Test the show command fails without required show-id."""
         result = self.runner.invoke(app, ['show'])
@@ -89,8 +89,8 @@ class TestCLICommands:
         assert result.exit_code != 0
         assert 'Missing option' in result.output or 'Error' in result.output
 
-    @patch('cli.commands.init_globals')
-    @patch('cli.commands.add_multiple_shows')
+    @patch('core.business_logic.init_globals')
+    @patch('core.business_logic.add_multiple_shows')
     def test_shows_command_required_args(self, mock_add_shows, mock_init):
         """Test the shows command with required arguments."""
         result = self.runner.invoke(app, ['shows', '--list-type', 'trending'])
@@ -100,6 +100,9 @@ class TestCLICommands:
             list_type='trending',
             add_limit=0,
             add_delay=2.5,
+            workers=1,
+            batch_size=1,
+            cache_ttl=None,
             sort='votes',
             years=None,
             genres=None,
@@ -115,8 +118,8 @@ class TestCLICommands:
         )
         assert result.exit_code == 0
 
-    @patch('cli.commands.init_globals')
-    @patch('cli.commands.add_multiple_shows')
+    @patch('core.business_logic.init_globals')
+    @patch('core.business_logic.add_multiple_shows')
     def test_shows_command_all_args(self, mock_add_shows, mock_init):
         """Test the shows command with all arguments."""
         result = self.runner.invoke(app, [
@@ -124,6 +127,9 @@ class TestCLICommands:
             '--list-type', 'popular',
             '--add-limit', '10',
             '--add-delay', '5.0',
+            '--workers', '3',
+            '--batch-size', '10',
+            '--cache-ttl', '600',
             '--sort', 'rating',
             '--year', '2020-2023',
             '--genres', 'drama,comedy',
@@ -143,6 +149,9 @@ class TestCLICommands:
             list_type='popular',
             add_limit=10,
             add_delay=5.0,
+            workers=3,
+            batch_size=10,
+            cache_ttl=600,
             sort='rating',
             years='2020-2023',
             genres='drama,comedy',
@@ -158,8 +167,8 @@ class TestCLICommands:
         )
         assert result.exit_code == 0
 
-    @patch('cli.commands.init_globals')
-    @patch('cli.commands.add_single_movie')
+    @patch('core.business_logic.init_globals')
+    @patch('core.business_logic.add_single_movie')
     def test_movie_command_required_args(self, mock_add_movie, mock_init):
         """Test the movie command with required arguments."""
         result = self.runner.invoke(app, ['movie', '--movie-id', '67890'])
@@ -168,8 +177,8 @@ class TestCLICommands:
         mock_add_movie.assert_called_once_with('67890', None, None, False)
         assert result.exit_code == 0
 
-    @patch('cli.commands.init_globals')
-    @patch('cli.commands.add_single_movie')
+    @patch('core.business_logic.init_globals')
+    @patch('core.business_logic.add_single_movie')
     def test_movie_command_all_args(self, mock_add_movie, mock_init):
         """Test the movie command with all optional arguments."""
         result = self.runner.invoke(app, [
@@ -184,8 +193,8 @@ class TestCLICommands:
         mock_add_movie.assert_called_once_with('67890', '/custom/movies', 'in_cinemas', True)
         assert result.exit_code == 0
 
-    @patch('cli.commands.init_globals')
-    @patch('cli.commands.add_multiple_movies')
+    @patch('core.business_logic.init_globals')
+    @patch('core.business_logic.add_multiple_movies')
     def test_movies_command_required_args(self, mock_add_movies, mock_init):
         """Test the movies command with required arguments."""
         result = self.runner.invoke(app, ['movies', '--list-type', 'anticipated'])
@@ -195,6 +204,9 @@ class TestCLICommands:
             list_type='anticipated',
             add_limit=0,
             add_delay=2.5,
+            workers=1,
+            batch_size=1,
+            cache_ttl=None,
             sort='votes',
             rotten_tomatoes=None,
             years=None,
@@ -212,8 +224,8 @@ class TestCLICommands:
         )
         assert result.exit_code == 0
 
-    @patch('cli.commands.init_globals')
-    @patch('cli.commands.add_multiple_movies')
+    @patch('core.business_logic.init_globals')
+    @patch('core.business_logic.add_multiple_movies')
     def test_movies_command_all_args(self, mock_add_movies, mock_init):
         """Test the movies command with all arguments."""
         result = self.runner.invoke(app, [
@@ -221,6 +233,9 @@ class TestCLICommands:
             '--list-type', 'trending',
             '--add-limit', '5',
             '--add-delay', '3.0',
+            '--workers', '3',
+            '--batch-size', '10',
+            '--cache-ttl', '600',
             '--sort', 'release',
             '--rotten_tomatoes', '80',
             '--years', '2022',
@@ -242,6 +257,9 @@ class TestCLICommands:
             list_type='trending',
             add_limit=5,
             add_delay=3.0,
+            workers=3,
+            batch_size=10,
+            cache_ttl=600,
             sort='release',
             rotten_tomatoes=80,
             years='2022',
@@ -259,8 +277,8 @@ class TestCLICommands:
         )
         assert result.exit_code == 0
 
-    @patch('cli.commands.init_globals')
-    @patch('cli.commands.run_automatic_mode')
+    @patch('core.business_logic.init_globals')
+    @patch('core.business_logic.run_automatic_mode')
     def test_run_command_default_args(self, mock_run, mock_init):
         """Test the run command with default arguments."""
         result = self.runner.invoke(app, ['run'])
@@ -272,12 +290,16 @@ class TestCLICommands:
             no_search=False,
             run_now=False,
             no_notifications=False,
-            ignore_blacklist=False
+            ignore_blacklist=False,
+            concurrent=1,
+            control_socket=None,
+            workers=1,
+            batch_size=1
         )
         assert result.exit_code == 0
 
-    @patch('cli.commands.init_globals')
-    @patch('cli.commands.run_automatic_mode')
+    @patch('core.business_logic.init_globals')
+    @patch('core.business_logic.run_automatic_mode')
     def test_run_command_all_args(self, mock_run, mock_init):
         """Test the run command with all arguments."""
         result = self.runner.invoke(app, [
@@ -287,7 +309,11 @@ class TestCLICommands:
             '--no-search',
             '--run-now',
             '--no-notifications',
-            '--ignore-blacklist'
+            '--ignore-blacklist',
+            '--concurrent', '2',
+            '--control-socket', '/tmp/traktarr.sock',
+            '--workers', '4',
+            '--batch-size', '50'
         ])
         
         mock_init.assert_called_once()
@@ -297,11 +323,36 @@ class TestCLICommands:
             no_search=True,
             run_now=True,
             no_notifications=True,
-            ignore_blacklist=True
+            ignore_blacklist=True,
+            concurrent=2,
+            control_socket='/tmp/traktarr.sock',
+            workers=4,
+            batch_size=50
         )
         assert result.exit_code == 0
 
-    @patch('cli.commands.init_globals')
+    @patch('core.business_logic.init_globals')
+    @patch('core.remote.send_command', return_value=True)
+    def test_remote_command(self, mock_send, mock_init):
+        """Test the remote command parses the arguments of the sent command."""
+        result = self.runner.invoke(app, [
+            'remote',
+            '--socket', '/tmp/traktarr.sock',
+            'shows',
+            '--list-type', 'trending',
+            '--add-limit', '5',
+            '--dry-run'
+        ])
+
+        assert result.exit_code == 0
+        path, func_name, kwargs = mock_send.call_args[0]
+        assert path == '/tmp/traktarr.sock'
+        assert func_name == 'add_multiple_shows'
+        assert kwargs['list_type'] == 'trending'
+        assert kwargs['add_limit'] == 5
+        assert kwargs['dry_run'] is True
+
+    @patch('core.business_logic.init_globals')
     def test_shows_command_missing_required_arg(self, mock_init):
         """Test the shows command fails without required list-type."""
         result = self.runner.invoke(app, ['shows'])
@@ -309,7 +360,7 @@ class TestCLICommands:
         assert result.exit_code != 0
         assert 'Missing option' in result.output or 'Error' in result.output
 
-    @patch('cli.commands.init_globals')
+    @patch('core.business_logic.init_globals')
     def test_movies_command_missing_required_arg(self, mock_init):
         """Test the movies command fails without required list-type."""
         result = self.runner.invoke(app, ['movies'])
@@ -317,7 +368,7 @@ class TestCLICommands:
         assert result.exit_code != 0
         assert 'Missing option' in result.output or 'Error' in result.output
 
-    @patch('cli.commands.init_globals')
+    @patch('core.business_logic.init_globals')
     def test_movie_command_missing_required_arg(self, mock_init):
         """Test the movie command fails without required movie-id."""
         result = self.runner.invoke(app, ['movie'])
@@ -360,7 +411,7 @@ class TestCLICommands:
         assert result.exit_code != 0
         assert 'Invalid value' in result.output or 'Error' in result.output
 
-    @patch('cli.commands.init_globals')
+    @patch('core.business_logic.init_globals')
     def test_help_output_contains_expected_commands(self, mock_init):
         """Test that help output contains all expected commands."""
         result = self.runner.invoke(app, ['--help'])
@@ -373,7 +424,18 @@ class TestCLICommands:
         assert 'movies' in result.output
         assert 'run' in result.output
 
-    @patch('cli.commands.init_globals') 
+    @pytest.mark.parametrize('argv, expected', [
+        (['-h'], 'Add new shows & movies to Sonarr/Radarr from Trakt.'),
+        (['-V'], 'Traktarr, version'),
+    ])
+    def test_short_help_and_version_options(self, argv, expected):
+        """Test that -h and -V work like --help and --version."""
+        result = self.runner.invoke(app, argv)
+
+        assert result.exit_code == 0
+        assert expected in result.output
+
+    @patch('core.business_logic.init_globals') 
     def test_command_help_shows_options(self, mock_init):
         """Test that command help shows all available options."""
         result = self.runner.invoke(app, ['shows', '--help'])
@@ -385,3 +447,79 @@ class TestCLICommands:
         assert '--sort' in result.output
         assert '--dry-run' in result.output
         assert '--notifications' in result.output
+
+
+class TestFastParse:
+    """Test the argparse fast path used before falling back to Click."""
+
+    @patch('core.business_logic.init_globals')
+    @patch('core.business_logic.add_multiple_shows')
+    def test_shows_fast_path_matches_click_kwargs(self, mock_add_shows, mock_init):
+        """Test that the fast path forwards the same arguments as the Click command."""
+        from cli.fastparse import main
+
+        main([
+            '--config', '/custom/config.json',
+            '--cachefile', '/custom/cache.db',
+            '--logfile', '/custom/activity.log',
+            'shows',
+            '-t', 'popular',
+            '-l', '10',
+            '--add-delay', '5.0',
+            '--sort', 'rating',
+            '--year', '2020-2023',
+            '--no-search',
+            '--dry-run'
+        ])
+
+        mock_init.assert_called_once_with('/custom/config.json', '/custom/cache.db', '/custom/activity.log')
+        mock_add_shows.assert_called_once_with(
+            list_type='popular',
+            add_limit=10,
+            add_delay=5.0,
+            workers=1,
+            batch_size=1,
+            cache_ttl=None,
+            sort='rating',
+            years='2020-2023',
+            genres=None,
+            folder=None,
+            person=None,
+            include_non_acting_roles=False,
+            no_search=True,
+            notifications=False,
+            authenticate_user=None,
+            ignore_blacklist=False,
+            remove_rejected_from_recommended=False,
+            dry_run=True
+        )
+
+    @patch('core.business_logic.init_globals')
+    @patch('core.business_logic.add_single_movie')
+    def test_movie_fast_path(self, mock_add_movie, mock_init):
+        """Test the movie command through the fast path."""
+        from cli.fastparse import main
+
+        main(['movie', '-id', '67890', '-ma', 'in_cinemas'])
+
+        mock_init.assert_called_once()
+        mock_add_movie.assert_called_once_with(
+            movie_id='67890', folder=None, minimum_availability='in_cinemas', no_search=False
+        )
+
+    @pytest.mark.parametrize('argv', [
+        ['--help'],
+        ['-V'],
+        ['shows', '--help'],
+        ['show'],
+        ['shows', '--list-type', 'trending', '--sort', 'invalid'],
+        ['movies', '--list-type', 'trending', '--unknown-option'],
+        ['unknown-command'],
+        [],
+    ])
+    def test_parse_falls_back_to_click(self, argv):
+        """Test that help, invalid and unknown arguments are left to Click."""
+        from cli.fastparse import parse, FallbackToClick
+
+        with pytest.raises(FallbackToClick):
+            parse(argv)
@@ -15,8 +15,8 @@ def test_debug_movies_command():
     """Debug test to see what's happening with movies command."""
     runner = CliRunner()
     
-    with patch('cli.commands.init_globals') as mock_init, \
-         patch('cli.commands.add_multiple_movies') as mock_add_movies:
+    with patch('core.business_logic.init_globals') as mock_init, \
+         patch('core.business_logic.add_multiple_movies') as mock_add_movies:
         
         result = runner.invoke(app, [
             'movies',
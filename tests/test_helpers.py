@@ -4,7 +4,7 @@ Test Utilities and Helpers for Traktarr
 These tests verify that helper modules and utility functions work correctly.
 """
 
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, call
 import pytest
 
 
@@ -53,6 +53,63 @@ class TestHelpers:
         except ImportError:
             pytest.skip("Parameter helpers not available")
 
+    def test_misc_allowed_genres(self):
+        """Test matching an item's genres against the requested genres."""
+        from helpers.misc import allowed_genres
+
+        movie = {'movie': {'genres': ['action', 'drama']}}
+        assert allowed_genres(frozenset({'drama', 'horror'}), 'movie', movie)
+        assert not allowed_genres(frozenset({'horror'}), 'movie', movie)
+        assert allowed_genres(frozenset({'ignore'}), 'movie', {'movie': {'genres': []}})
+
+    def test_misc_sorted_list(self):
+        """Test sorting Trakt items, with items missing the sort value last."""
+        from helpers.misc import sorted_list
+
+        movies = [{'movie': {'title': 'a', 'votes': 10, 'released': None}},
+                  {'movie': {'title': 'b', 'votes': None, 'released': '2020-01-01'}},
+                  {'movie': {'title': 'c', 'votes': 30, 'released': '2021-01-01'}}]
+        assert [m['movie']['title'] for m in sorted_list(movies, 'movie', 'votes')] == ['c', 'a', 'b']
+        assert [m['movie']['title'] for m in sorted_list(movies, 'movie', 'released')] == ['c', 'b', 'a']
+        assert movies[0]['movie']['released'] is None
+
+    def test_misc_sorted_list_with_limit(self):
+        """Test that a partially sorted list yields the same order as a fully sorted one."""
+        from helpers.misc import sorted_list
+
+        movies = [{'movie': {'title': str(i), 'votes': (i * 7) % 5}} for i in range(20)]
+        expected = sorted_list(movies, 'movie', 'votes')
+
+        for limit in (1, 3, 10):
+            items = sorted_list(movies, 'movie', 'votes', limit=limit)
+            assert list(items) == expected
+        assert list(sorted_list(movies, 'movie', 'votes', reverse=False, limit=4)) == \
+            sorted_list(movies, 'movie', 'votes', reverse=False)
+
+    def test_sonarr_series_type(self):
+        """Test the Sonarr series type detection from Trakt genres."""
+        from helpers.sonarr import series_type
+
+        assert series_type(['animation', 'anime']) == 'anime'
+        assert series_type(['Action', 'Anime']) == 'anime'
+        assert series_type(['animation', 'drama']) == 'standard'
+        assert series_type([]) == 'standard'
+        assert series_type(None) == 'standard'
+
+    def test_radarr_remove_existing_and_excluded_movies(self):
+        """Test that movies already in Radarr or excluded in Radarr are removed from the Trakt list."""
+        from helpers.radarr import remove_existing_and_excluded_movies_from_trakt_list
+
+        trakt_movies = [{'movie': {'title': str(i), 'year': 2020, 'ids': {'tmdb': i}}} for i in range(1, 5)]
+        radarr_movies = [{'title': 'Existing', 'tmdbId': 1}, {'title': 'No TMDb ID'}]
+        radarr_exclusions = [{'movieTitle': 'Excluded', 'tmdbId': 3}]
+
+        movies, removal_successful = remove_existing_and_excluded_movies_from_trakt_list(
+            radarr_movies, radarr_exclusions, trakt_movies)
+
+        assert removal_successful
+        assert [movie['movie']['ids']['tmdb'] for movie in movies] == [2, 4]
+
     @patch('requests.get')
     def test_trakt_helper_authentication(self, mock_get):
         """Test Trakt API helper authentication."""
@@ -122,6 +179,244 @@ class TestHelpers:
             pytest.skip("Radarr helper not available")
 
 
+class TestRateLimiter:
+    """Test the token bucket rate limiter."""
+
+    @patch('helpers.ratelimit.time')
+    def test_rate_limiter_allows_burst_then_waits(self, mock_time):
+        """Test that requests within the budget are not delayed and later requests are spaced out."""
+        from helpers.ratelimit import RateLimiter
+
+        mock_time.monotonic.return_value = 100.0
+        limiter = RateLimiter(2, 10)
+
+        assert limiter.wait() == 0
+        assert limiter.wait() == 0
+        # bucket is empty, each following call waits for its own token
+        assert limiter.wait() == pytest.approx(5)
+        assert limiter.wait() == pytest.approx(10)
+        assert mock_time.sleep.call_count == 2
+
+        # tokens are refilled over time
+        mock_time.monotonic.return_value = 130.0
+        assert limiter.wait() == 0
+
+    def test_rate_limiter_without_period_never_waits(self):
+        """Test that a zero period (e.g. --add-delay 0) disables rate limiting."""
+        from helpers.ratelimit import RateLimiter
+
+        limiter = RateLimiter(1, 0)
+        assert [limiter.wait() for _ in range(5)] == [0] * 5
+
+
+class TestTraktListCache:
+    """Test caching of Trakt lists in the cache file."""
+
+    def test_cached_list_keys_on_arguments(self, tmp_path):
+        """Test that cached results are reused only for the same arguments, and 0 disables the cache."""
+        from media.trakt import Trakt
+
+        with patch('media.trakt.cachefile', str(tmp_path / 'cache.db')), \
+                patch.object(Trakt, '_make_items_request', side_effect=lambda **kwargs: [kwargs['years']]) as mock_request:
+            trakt = Trakt(Mock())
+            assert trakt.get_trending_movies(limit=10, years='2020') == ['2020']
+            assert trakt.get_trending_movies(limit=10, years='2020') == ['2020']
+            assert trakt.get_trending_movies(limit=10, years='2021') == ['2021']
+            assert mock_request.call_count == 2
+
+            Trakt(Mock(), cache_ttl=0).get_trending_movies(limit=10, years='2020')
+            assert mock_request.call_count == 3
+
+    def test_cached_item_only_with_pvr_id(self, tmp_path):
+        """Test that shows are cached by id once they have a TVDb id, and 0 cache_ttl bypasses the cache."""
+        from media.trakt import Trakt
+
+        shows = {
+            '1': {'title': 'Show', 'ids': {'trakt': 1, 'tvdb': 100}},
+            '2': {'title': 'New Show', 'ids': {'trakt': 2, 'tvdb': None}},
+        }
+        with patch('media.trakt.cachefile', str(tmp_path / 'cache.db')), \
+                patch.object(Trakt, '_make_item_request', side_effect=lambda url, object_name: shows[url[-1]]) \
+                as mock_request:
+            trakt = Trakt(Mock())
+            assert trakt.get_show('1') == shows['1']
+            assert trakt.get_show('1') == shows['1']
+            assert mock_request.call_count == 1
+
+            assert trakt.get_show('2') == shows['2']
+            assert trakt.get_show('2') == shows['2']
+            assert mock_request.call_count == 3
+
+            Trakt(Mock(), cache_ttl=0).get_show('1')
+            assert mock_request.call_count == 4
+
+    def test_cached_list_stored_compressed(self, tmp_path):
+        """Test that lists are cached compressed."""
+        import pickle
+        import zlib
+        from helpers.cache import file_cache
+        from media.trakt import Trakt
+
+        cachefile = str(tmp_path / 'cache.db')
+        items = [{'movie': {'title': 'Movie %d' % i, 'ids': {'trakt': i}}} for i in range(100)]
+        with patch('media.trakt.cachefile', cachefile), \
+                patch.object(Trakt, '_make_items_request', return_value=items) as mock_request:
+            trakt = Trakt(Mock())
+            assert trakt.get_trending_movies(limit=100) == items
+            assert trakt.get_trending_movies(limit=100) == items
+            assert mock_request.call_count == 1
+
+            cache = file_cache(cachefile, 3600)
+            stored = [pickle.loads(bytes(row[0])) for row in cache._get_conn(None).execute('SELECT val FROM bucket')]
+            assert len(stored) == 1
+            assert pickle.loads(zlib.decompress(stored[0])) == items
+            assert len(stored[0]) < len(pickle.dumps(items))
+
+
+class TestTraktPaging:
+    """Test retrieving Trakt list pages."""
+
+    def test_make_items_request_skips_duplicates_and_stops_at_limit(self):
+        """Test that items repeated on a later page are skipped and paging stops once the limit is reached."""
+        import json
+        from media.trakt import Trakt
+
+        pages = [
+            [{'title': 'A', 'ids': {'trakt': 1}}, {'title': 'B', 'ids': {'trakt': 2}}],
+            [{'title': 'B', 'ids': {'trakt': 2}}, {'title': 'C', 'ids': {'trakt': 3}}, {'title': 'D', 'ids': {'trakt': 4}}],
+        ]
+
+        def make_request(url, payload, authenticate_user):
+            req = Mock(status_code=200, headers={'X-Pagination-Page-Count': '3'})
+            return req, json.dumps(pages[payload['page'] - 1])
+
+        trakt = Trakt(Mock())
+        with patch.object(trakt, '_make_request', side_effect=make_request) as mock_request:
+            items = trakt._make_items_request(url='https://api.trakt.tv/movies/popular', limit=3,
+                                              type_name='popular', object_name='movies')
+
+        assert [item['movie']['title'] for item in items] == ['A', 'B', 'C']
+        assert mock_request.call_count == 2
+
+    def test_make_items_request_gives_up_when_rate_limited(self):
+        """Test that a page rate limited on every attempt is retried a bounded number of times, then given up."""
+        from media.trakt import Trakt
+
+        limited = Mock(status_code=429, headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+
+        trakt = Trakt(Mock())
+        with patch.object(trakt, '_make_request', return_value=(limited, '{}')) as mock_request, \
+                patch('media.trakt.time.sleep') as mock_sleep:
+            # without the backoff retries of the whole request
+            items = Trakt._make_items_request.__wrapped__(trakt, url='https://api.trakt.tv/movies/popular', limit=3,
+                                                          type_name='popular', object_name='movies')
+
+        assert items is None
+        assert mock_request.call_count == 7
+        assert [call[0][0] for call in mock_sleep.call_args_list] == [5] * 6
+
+    def test_page_items_keep_only_used_fields(self):
+        """Test that list items are wrapped in their object type and reduced to the fields traktarr uses."""
+        from media.trakt import Trakt
+
+        page = [
+            {'watchers': 10, 'show': {'title': 'A', 'year': 2020, 'ids': {'tvdb': 1}, 'overview': '...'}},
+            {'title': 'B', 'year': 2021, 'ids': {'tvdb': 2}, 'trailer': 'https://youtu.be/'},
+        ]
+
+        assert list(Trakt._page_items(page, 'trending', 'shows', False)) == [
+            {'show': {'title': 'A', 'year': 2020, 'ids': {'tvdb': 1}}},
+            {'show': {'title': 'B', 'year': 2021, 'ids': {'tvdb': 2}}},
+        ]
+
+
+class TestTmdbCache:
+    """Test caching of TMDb lookups in the cache file."""
+
+    def test_verify_movie_exists_is_cached(self, tmp_path):
+        """Test that found movies are not requested again, while missing movies are."""
+        from cashier import Cashier
+        from helpers import tmdb
+
+        cache = Cashier(str(tmp_path / 'cache.db'), default_timeout=60)
+        with patch('helpers.tmdb._exists_cache', return_value=cache), \
+                patch('helpers.tmdb.session') as mock_session:
+            mock_session.get.return_value = Mock(status_code=200)
+            assert tmdb.verify_movie_exists_on_tmdb('Movie', 2020, 1)
+            assert tmdb.verify_movie_exists_on_tmdb('Movie', 2020, 1)
+            assert mock_session.get.call_count == 1
+
+            mock_session.get.return_value = Mock(status_code=404)
+            assert not tmdb.verify_movie_exists_on_tmdb('Missing', 2020, 2)
+            assert not tmdb.verify_movie_exists_on_tmdb('Missing', 2020, 2)
+            assert mock_session.get.call_count == 3
+
+
+class TestOmdbCache:
+    """Test caching of OMDb Rotten Tomatoes scores in the cache file."""
+
+    def test_rt_score_is_cached(self, tmp_path):
+        """Test that scores (and missing scores) are not requested again, while failed requests are."""
+        import json
+        from cashier import Cashier
+        from helpers import omdb
+
+        rated = {'Response': 'True', 'Ratings': [{'Source': 'Rotten Tomatoes', 'Value': '87%'}]}
+        unrated = {'Response': 'True', 'Ratings': []}
+
+        cache = Cashier(str(tmp_path / 'cache.db'), default_timeout=60)
+        with patch('helpers.omdb._rt_score_cache', return_value=cache), \
+                patch('helpers.omdb.session') as mock_session:
+            mock_session.get.return_value = Mock(status_code=200, content=json.dumps(rated))
+            assert omdb.get_movie_rt_score('key', 'Movie', 2020, 'tt1') == 87
+            assert omdb.get_movie_rt_score('key', 'Movie', 2020, 'tt1') == 87
+            assert mock_session.get.call_count == 1
+
+            mock_session.get.return_value = Mock(status_code=200, content=json.dumps(unrated))
+            assert omdb.get_movie_rt_score('key', 'Unrated', 2020, 'tt2') is False
+            assert omdb.get_movie_rt_score('key', 'Unrated', 2020, 'tt2') is False
+            assert mock_session.get.call_count == 2
+
+            mock_session.get.return_value = Mock(status_code=500)
+            assert omdb.get_movie_rt_score('key', 'Failed', 2020, 'tt3') is False
+            assert omdb.get_movie_rt_score('key', 'Failed', 2020, 'tt3') is False
+            assert mock_session.get.call_count == 4
+
+    def test_prefetch_rt_scores(self, tmp_path):
+        """Test that prefetched scores are checked from the cache, and movies without an IMDb ID are not requested."""
+        import json
+        from cashier import Cashier
+        from helpers import omdb
+
+        rated = {'Response': 'True', 'Ratings': [{'Source': 'Rotten Tomatoes', 'Value': '75%'}]}
+
+        cache = Cashier(str(tmp_path / 'cache.db'), default_timeout=60)
+        with patch('helpers.omdb._rt_score_cache', return_value=cache), \
+                patch('helpers.omdb.session') as mock_session:
+            mock_session.get.return_value = Mock(status_code=200, content=json.dumps(rated))
+            omdb.prefetch_rt_scores('key', [('A', 2020, 'tt1'), ('B', 2020, 'tt2'), ('C', 2020, None)])
+            assert mock_session.get.call_count == 2
+
+            assert omdb.does_movie_have_min_req_rt_score('key', 'A', 2020, 'tt1', 70)
+            assert not omdb.does_movie_have_min_req_rt_score('key', 'B', 2020, 'tt2', 80)
+            assert mock_session.get.call_count == 2
+
+
+class TestFileCache:
+    """Test the cache file wrapper."""
+
+    def test_one_connection_per_thread(self, tmp_path):
+        """Test that values are stored and read back over a single connection, whatever the key."""
+        from helpers.cache import FileCache
+
+        cache = FileCache(str(tmp_path / 'cache.db'), default_timeout=60)
+        for i in range(5):
+            cache.set('key-%d' % i, i)
+        assert [cache.get('key-%d' % i) for i in range(5)] == list(range(5))
+        assert cache.get('missing') is None
+        assert cache._get_conn('key-0') is cache._get_conn('key-4')
+
+
 class TestConfigValidation:
     """Test configuration validation and loading."""
 
@@ -169,6 +464,84 @@ class TestConfigValidation:
         except ImportError:
             pytest.skip("Config module not available")
 
+    def test_config_migrate_legacy_settings(self):
+        """Test that legacy config options are replaced by their current names."""
+        from misc.config import AttrConfig, Config
+
+        settings = AttrConfig({
+            'filters': {'movies': {'rating_limit': 70, 'blacklist_title_keywords': [], 'rotten_tomatoes': ''}},
+            'radarr': {'profile': 'Any', 'quality': 'HD-1080p'},
+            'sonarr': {'quality': 'HD-1080p'},
+        })
+
+        assert Config().migrate_legacy_settings(settings)
+        assert settings['filters']['movies'] == {'rotten_tomatoes': 70}
+        assert settings.radarr == {'quality': 'Any'}
+        assert settings.sonarr == {'quality': 'HD-1080p'}
+        assert not Config().migrate_legacy_settings(settings)
+
+    def test_config_upgrade_settings_in_place(self):
+        """Test that missing options are added to the loaded settings without sharing the base config."""
+        from misc.config import AttrConfig, Config
+
+        config = Config()
+        settings = AttrConfig({'core': {}, 'sonarr': {'quality': 'HD-1080p', 'tags': {}}})
+
+        upgraded_settings, upgraded = config.upgrade_settings(settings)
+        assert upgraded
+        assert upgraded_settings is settings
+        assert settings['core'] == {'debug': False}
+        assert settings['sonarr']['quality'] == 'HD-1080p'
+
+        settings['core']['debug'] = True
+        assert Config.base_config['core']['debug'] is False
+        assert config.upgrade_settings(settings) == (settings, False)
+
+    def test_config_merge_settings(self):
+        """Test that merged settings only replace the changed options, and are saved."""
+        from misc.config import AttrConfig, Config
+
+        config = Config()
+        conf = AttrConfig({'trakt': {'client_id': 'id', 'user': {'access_token': 'old', 'refresh_token': 'r'}}})
+
+        with patch.object(config, 'conf', conf), patch.object(config, 'dump_config') as mock_dump:
+            merged, upgraded = config.merge_settings({'trakt': {'user': {'access_token': 'new'}}})
+
+            assert upgraded
+            assert merged is conf
+            assert conf.trakt == {'client_id': 'id', 'user': {'access_token': 'new', 'refresh_token': 'r'}}
+            mock_dump.assert_called_once()
+
+    def test_config_json_indented(self):
+        """Test that the config file is written like json.dump(sort_keys=True, indent=2), and read back."""
+        import json
+        from helpers import fastjson
+
+        settings = {'sonarr': {'root_folder': '/tv', 'tags': {}}, 'core': {'debug': False}, 'name': 'Amélie'}
+
+        dumped = fastjson.dumps_indented(settings)
+        assert json.loads(dumped.decode('utf-8')) == settings
+        assert fastjson.loads(dumped) == settings
+        assert dumped.decode('utf-8').splitlines() == \
+            json.dumps(settings, sort_keys=True, indent=2, ensure_ascii=False).splitlines()
+
+    def test_attr_config_attribute_access(self):
+        """Test that missing options are None and nested sections are wrapped once, reflecting later changes."""
+        from misc.config import AttrConfig
+
+        settings = AttrConfig({'sonarr': {'tags': {}, 'root_folder': '/tv'}, 'filters': {'shows': {'disabled_for': []}}})
+
+        assert settings.missing is None
+        assert settings.sonarr.missing is None
+        assert settings.sonarr is settings.sonarr
+        assert settings.filters.shows.disabled_for == ()
+
+        settings['sonarr']['root_folder'] = '/anime'
+        assert settings.sonarr.root_folder == '/anime'
+
+        settings['filters']['shows']['disabled_for'].append('anticipated')
+        assert settings.filters.shows.disabled_for == ('anticipated',)
+
     def test_config_invalid_json(self):
         """Test config loading with invalid JSON."""
         try:
@@ -229,6 +602,37 @@ class TestMediaProcessing:
         assert len(filtered_shows) == 2
         assert all('reality' not in show.get('genres', []) for show in filtered_shows)
 
+    def test_trakt_blacklisted_genre_country_language(self):
+        """Test the Trakt blacklist checks against (case insensitive) genre, country and language settings."""
+        from helpers import trakt as trakt_helper
+
+        show = {'show': {'title': 'Some Show', 'genres': ['drama', 'reality'], 'country': 'us', 'language': 'en'}}
+
+        assert trakt_helper.blacklisted_show_genre(show, ['Reality'])
+        assert not trakt_helper.blacklisted_show_genre(show, ['anime'])
+        assert not trakt_helper.blacklisted_show_genre(show, ['ignore'])
+        assert not trakt_helper.blacklisted_show_country(show, ['GB', 'US'])
+        assert trakt_helper.blacklisted_show_country(show, ['gb'])
+        assert not trakt_helper.blacklisted_show_country(show, [])
+        assert trakt_helper.blacklisted_show_language(show, ['de'])
+        assert not trakt_helper.blacklisted_show_language(show, ['ignore'])
+
+    def test_trakt_blacklisted_id_title_network(self):
+        """Test the Trakt blacklist checks against ids, (case insensitive) title keywords and networks."""
+        from helpers import trakt as trakt_helper
+
+        show = {'show': {'title': 'The Great Show', 'network': 'Netflix', 'ids': {'tvdb': 123}}}
+        movie = {'movie': {'title': 'A Christmas Movie', 'ids': {'tmdb': 456}}}
+
+        assert trakt_helper.blacklisted_show_id(show, ('123', 789))
+        assert not trakt_helper.blacklisted_show_id(show, [456])
+        assert trakt_helper.blacklisted_movie_id(movie, [456])
+        assert trakt_helper.blacklisted_show_title(show, ['GREAT'])
+        assert not trakt_helper.blacklisted_show_title(show, ['untold'])
+        assert trakt_helper.blacklisted_movie_title(movie, ('xmas', 'christmas'))
+        assert trakt_helper.blacklisted_show_network(show, ['netflix'])
+        assert not trakt_helper.blacklisted_show_network(show, ('hbo',))
+
     def test_movie_filtering_by_year(self):
         """Test filtering movies by year range.""" 
         # Mock movie data
@@ -350,6 +754,76 @@ class TestNotifications:
             pytest.skip("Slack notifications not available")
 
 
+    @patch('notifications.discord.time.sleep')
+    @patch('notifications.discord.session')
+    def test_discord_notification_rate_limited(self, mock_session, mock_sleep):
+        """Test that a rate limited Discord webhook is retried after Retry-After."""
+        import json
+        from notifications.discord import Discord
+
+        limited = Mock(status_code=429, headers={'Retry-After': '2'})
+        mock_session.post.side_effect = [limited, Mock(status_code=204)]
+
+        notifier = Discord('https://discord.com/api/webhooks/test', avatar_url='https://example.com/a.png')
+        assert notifier.send(message='Test Message') is True
+
+        assert mock_session.post.call_count == 2
+        mock_sleep.assert_called_once_with(2.0)
+        assert json.loads(mock_session.post.call_args[1]['data']) == {
+            'username': 'Traktarr', 'avatar_url': 'https://example.com/a.png', 'content': 'Test Message'}
+
+
+    @patch('notifications.discord.log')
+    @patch('notifications.discord.session')
+    def test_discord_notification_sent_in_background(self, mock_session, mock_log):
+        """Test that Notifications hands Discord messages to its background worker, which sends them together."""
+        import json
+        from notifications import Notifications
+        from notifications.discord import _executor
+
+        mock_session.post.return_value = Mock(status_code=204)
+        notify = Notifications()
+        notify.load(service='discord', webhook_url='https://discord.com/api/webhooks/test')
+        discord = notify.services[0]
+        discord.COALESCE_SECONDS = 0.2
+        future = discord.send_async(message='First')
+        notify.send(message='Second')
+        assert discord.send_async(message='Third') is future
+
+        assert future.result(timeout=5) is True
+        mock_session.post.assert_called_once()
+        assert json.loads(mock_session.post.call_args[1]['data'])['content'] == 'First\nSecond\nThird'
+        # the single worker runs the callbacks of the flush before the next task
+        _executor.submit(lambda: None).result(timeout=5)
+        assert mock_log.debug.call_args_list.count(call("Sent notification with %s", "Discord")) == 1
+
+    @patch('notifications.discord.time')
+    @patch('notifications.discord.session')
+    def test_discord_notification_rate_limit_headers(self, mock_session, mock_time):
+        """Test that Discord waits for the rate limit reset and reads retry_after from a 429 body."""
+        from notifications.discord import Discord
+
+        mock_time.monotonic.return_value = 100.0
+        exhausted = Mock(status_code=204, headers={'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset-After': '1.5'})
+        limited = Mock(status_code=429, headers={})
+        limited.json.return_value = {'retry_after': 0.5}
+        mock_session.post.side_effect = [exhausted, limited, Mock(status_code=204, headers={})]
+
+        notifier = Discord('https://discord.com/api/webhooks/test')
+        assert notifier.send(message='First') is True
+        mock_time.sleep.assert_not_called()
+        assert notifier.send(message='Second') is True
+
+        assert [call[0][0] for call in mock_time.sleep.call_args_list] == [1.5, 0.5]
+
+    def test_discord_join_messages(self):
+        """Test that coalesced Discord messages are split below the content limit."""
+        from notifications.discord import _join_messages
+
+        assert _join_messages(['a' * 5, 'b' * 4, 'c' * 8, 'd' * 20], 10) == ['aaaaa\nbbbb', 'cccccccc', 'd' * 20]
+        assert _join_messages([], 10) == []
+
+
 class TestErrorHandling:
     """Test error handling and edge cases."""
 
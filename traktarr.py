@@ -6,13 +6,20 @@ This is the main entry point for Traktarr that imports and runs the CLI commands
 """
 
 import signal
-from pyfiglet import Figlet
+import sys
 
-from cli.commands import app
-from core.business_logic import exit_handler
+from cli.fastparse import HELP_FLAGS, VERSION, main
 
 
-if __name__ == "__main__":
+def _exit_handler(signum, frame):
+    # the business logic is only imported once a signal arrives, help and version output never load it
+    from core.business_logic import exit_handler
+    exit_handler(signum, frame)
+
+
+def _print_banner():
+    from pyfiglet import Figlet
+
     print("")
 
     f = Figlet(font='graffiti')
@@ -29,9 +36,21 @@ if __name__ == "__main__":
 #########################################################################
 """)
 
+
+if __name__ == "__main__":
+    argv = sys.argv[1:]
+    if argv in (['--version'], ['-V']):
+        # answer before loading the banner font, Click and the business logic
+        print("Traktarr, version %s" % VERSION)
+        sys.exit(0)
+
     # Register the signal handlers
-    signal.signal(signal.SIGTERM, exit_handler)
-    signal.signal(signal.SIGINT, exit_handler)
+    signal.signal(signal.SIGTERM, _exit_handler)
+    signal.signal(signal.SIGINT, _exit_handler)
+
+    # Help and version output is answered by Click without the banner (and its font)
+    if not any(arg in HELP_FLAGS for arg in argv):
+        _print_banner()
 
     # Start application
-    app()
+    main()